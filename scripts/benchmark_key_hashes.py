@@ -0,0 +1,51 @@
+"""Big_map key hashing throughput: one key at a time vs batch API."""
+
+import sys
+from time import perf_counter
+
+from click import secho
+
+from pytezos.crypto.encoding import base58_encode
+from pytezos.crypto.key import blake2b_32
+from pytezos.michelson.forge import forge_script_expr
+from pytezos.michelson.types import MichelsonType
+
+LEDGER_KEY_TYPES = {
+    'nat': ({'prim': 'nat'}, lambda i: i),
+    'string': ({'prim': 'string'}, lambda i: f'token_{i}'),
+    'address x nat': (
+        {'prim': 'pair', 'args': [{'prim': 'address'}, {'prim': 'nat'}]},
+        lambda i: ('tz1MsmYzmqxHs9trE1qQugZxxcLPqAXdQaX9', i),
+    ),
+}
+
+
+def hash_reference(keys: list) -> list:
+    return [base58_encode(blake2b_32(key.pack(legacy=True)).digest(), b'expr').decode() for key in keys]
+
+
+def hash_one_by_one(keys: list) -> list:
+    return [forge_script_expr(key.pack(legacy=True)) for key in keys]
+
+
+def main(count: int = 100000) -> None:
+    for name, (type_expr, make_key) in LEDGER_KEY_TYPES.items():
+        ty = MichelsonType.match(type_expr)
+        keys = [ty.from_python_object(make_key(i)) for i in range(count)]
+        secho(f'{name}: {count} keys', fg='yellow')
+
+        results = []
+        for label, func in (
+            ('reference', hash_reference),
+            ('one-by-one', hash_one_by_one),
+            ('batch', ty.get_script_exprs),
+        ):
+            start = perf_counter()
+            results.append(func(keys))
+            elapsed = perf_counter() - start
+            secho(f'  {label:<12} {count / elapsed:10.0f} keys/s  {elapsed / count * 1e6:6.2f} us/key', fg='green')
+        assert all(res == results[0] for res in results), 'hash mismatch'
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,65 @@
+"""Micheline binary codec throughput over the fixtures used by contract tests."""
+
+import json
+import sys
+from glob import glob
+from os.path import basename
+from os.path import dirname
+from os.path import join
+from timeit import repeat
+
+from click import secho
+
+from pytezos.michelson.forge import forge_micheline
+from pytezos.michelson.forge import unforge_micheline
+
+CORPUS_PATH = join(dirname(__file__), '..', 'tests', 'contract_tests')
+
+
+def iter_expressions(path: str):
+    with open(path) as f:
+        data = json.load(f)
+    if basename(path) == '__script__.json':
+        yield data['code']
+        yield data['storage']
+    elif basename(path) == '__entrypoints__.json':
+        yield from data['entrypoints'].values()
+    else:
+        if 'value' in data.get('parameters', {}):
+            yield data['parameters']['value']
+        yield data['storage']
+        for diff in data.get('lazy_storage_diff', []):
+            for update in diff['diff'].get('updates', []):
+                if diff['kind'] == 'big_map':
+                    yield update['key']
+                    if 'value' in update:
+                        yield update['value']
+
+
+def load_corpus() -> list:
+    return [expr for path in sorted(glob(join(CORPUS_PATH, '*', '*.json'))) for expr in iter_expressions(path)]
+
+
+def forge_all(exprs: list) -> None:
+    for expr in exprs:
+        forge_micheline(expr)
+
+
+def unforge_all(blobs: list) -> None:
+    for data in blobs:
+        unforge_micheline(data)
+
+
+def main(number: int = 5) -> None:
+    exprs = load_corpus()
+    blobs = list(map(forge_micheline, exprs))
+    size = sum(map(len, blobs)) / 1024
+    secho(f'{len(exprs)} expressions, {size:.0f} KiB forged', fg='yellow')
+
+    for name, func, arg in (('forge', forge_all, exprs), ('unforge', unforge_all, blobs)):
+        best = min(repeat(lambda: func(arg), number=number, repeat=5)) / number  # noqa: B023
+        secho(f'{name:<12} {size / best:8.0f} KiB/s  {best * 1e3:8.2f} ms/corpus', fg='green')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
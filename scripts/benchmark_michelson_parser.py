@@ -0,0 +1,51 @@
+"""Michelson parser throughput over the `.tz` corpus used by REPL tests."""
+
+import sys
+from glob import glob
+from os.path import dirname
+from os.path import join
+from timeit import repeat
+
+from click import secho
+
+from pytezos.michelson.parse import PARSER_ENGINES
+from pytezos.michelson.parse import MichelsonParser
+from pytezos.michelson.parse import MichelsonParserError
+from pytezos.michelson.parse import michelson_to_micheline
+
+CORPUS_PATH = join(dirname(__file__), '..', 'tests', 'unit_tests', 'test_michelson', 'test_repl')
+
+
+def load_corpus() -> list:
+    sources = []
+    for path in sorted(glob(join(CORPUS_PATH, '**', '*.tz'), recursive=True)):
+        with open(path) as f:
+            source = f.read()
+        try:
+            michelson_to_micheline(source)
+        except MichelsonParserError:
+            continue
+        sources.append(source)
+    return sources
+
+
+def parse_all(sources: list, engine: str) -> None:
+    for source in sources:
+        michelson_to_micheline(source, engine=engine)
+
+
+def main(number: int = 5) -> None:
+    sources = load_corpus()
+    size = sum(map(len, sources)) / 1024
+    secho(f'{len(sources)} files, {size:.0f} KiB', fg='yellow')
+
+    best = min(repeat(MichelsonParser, number=number * 10, repeat=5)) / (number * 10)
+    secho(f'{"init":<12} {best * 1e3:8.2f} ms/parser', fg='green')
+
+    for engine in PARSER_ENGINES:
+        best = min(repeat(lambda: parse_all(sources, engine), number=number, repeat=5)) / number  # noqa: B023
+        secho(f'{engine:<12} {size / best:8.0f} KiB/s  {best / len(sources) * 1e3:6.2f} ms/file', fg='green')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
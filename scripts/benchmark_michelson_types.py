@@ -0,0 +1,115 @@
+"""Load time, class count and memory of `MichelsonProgram.match` over contract scripts used by tests.
+
+Scripts are matched several times with the program cache disabled, first without type interning (baseline), then
+with it. Without interning every round creates a new set of classes, with interning only the first one does.
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from contextlib import ExitStack
+from glob import glob
+from os.path import dirname
+from os.path import join
+from time import perf_counter
+from unittest.mock import patch
+
+from click import secho
+
+from pytezos.michelson import cache
+from pytezos.michelson import micheline
+from pytezos.michelson.cache import get_program_cache
+from pytezos.michelson.cache import set_program_cache
+from pytezos.michelson.instructions import base as instructions_base
+from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.parse import MichelsonParserError
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.sections import parameter
+from pytezos.michelson.sections import view
+from pytezos.michelson.types import base as types_base
+
+TESTS_PATH = join(dirname(__file__), '..', 'tests')
+# NOTE: modules importing `intern_type` by name
+INTERNING_MODULES = (micheline, types_base, instructions_base, parameter, view, cache)
+
+
+def load_corpus() -> list:
+    scripts = []
+    for path in sorted(glob(join(TESTS_PATH, 'contract_tests', '*', '__script__.json'))):
+        with open(path) as f:
+            scripts.append(json.load(f)['code'])
+    for path in sorted(
+        glob(join(TESTS_PATH, 'unit_tests', 'test_michelson', 'test_repl', '**', '*.tz'), recursive=True)
+    ):
+        with open(path) as f:
+            try:
+                scripts.append(michelson_to_micheline(f.read()))
+            except MichelsonParserError:
+                continue
+    return scripts
+
+
+def count_classes() -> int:
+    gc.collect()
+    count, pending = 0, [Micheline]
+    while pending:
+        subclasses = pending.pop().__subclasses__()
+        count += len(subclasses)
+        pending.extend(subclasses)
+    return count
+
+
+def match_all(scripts: list) -> list:
+    programs = []
+    for script in scripts:
+        try:
+            programs.append(MichelsonProgram.match(script))
+        except Exception:
+            continue
+    return programs
+
+
+def create_type(cls: type, attrs: dict) -> type:
+    return type(cls.__name__, (cls,), attrs)
+
+
+def run(scripts: list, rounds: int, interning: bool) -> None:
+    secho(f'interning {"on" if interning else "off"}', fg='yellow')
+    with ExitStack() as stack:
+        if not interning:
+            for module in INTERNING_MODULES:
+                stack.enter_context(patch.object(module, 'intern_type', create_type))
+        initial = count_classes()
+        tracemalloc.start()
+        programs = []
+        for i in range(rounds):
+            started = perf_counter()
+            programs.extend(match_all(scripts))
+            elapsed = perf_counter() - started
+            current, peak = tracemalloc.get_traced_memory()
+            classes = count_classes() - initial
+            secho(
+                f'  round {i + 1}  {elapsed * 1e3:8.1f} ms  {classes:7d} classes  '
+                f'{current / 2**20:7.1f} MiB current  {peak / 2**20:7.1f} MiB peak',
+                fg='green',
+            )
+        tracemalloc.stop()
+        del programs
+
+
+def main(rounds: int = 3) -> None:
+    scripts = load_corpus()
+    secho(f'{len(scripts)} scripts, {rounds} rounds, program cache disabled', fg='yellow')
+    program_cache = get_program_cache()
+    set_program_cache(None)
+    try:
+        run(scripts, rounds, interning=False)
+        run(scripts, rounds, interning=True)
+    finally:
+        set_program_cache(program_cache)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,27 @@
+"""Micro-benchmark of RPC query chain construction (no network calls are made)."""
+
+import sys
+from timeit import repeat
+
+from click import secho
+
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+
+CHAINS = {
+    'contract': lambda shell: shell.blocks[1000].context.contracts['KT1'].storage,
+    'big_map': lambda shell: shell.head.context.big_maps[42]['expr'],
+    'operations': lambda shell: shell.blocks['BLock'].operations[3][0],
+    'unknown': lambda shell: shell.chains.main.blocks.head.foo.bar.baz,
+}
+
+
+def main(number: int = 10000) -> None:
+    shell = ShellQuery(RpcNode('http://localhost:8732'))
+    for name, chain in CHAINS.items():
+        best = min(repeat(lambda: chain(shell), number=number, repeat=5))  # noqa: B023
+        secho(f'{name:<12} {best / number * 1e6:8.2f} us/chain', fg='green')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
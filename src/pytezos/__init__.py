@@ -10,22 +10,57 @@ Just type:
 And follow the interactive documentation.
 """
 
+import importlib
 import importlib.metadata
+from typing import TYPE_CHECKING
 
-from pytezos.client import PyTezosClient
-from pytezos.contract.interface import Contract
-from pytezos.contract.interface import ContractInterface
-from pytezos.crypto.key import Key
-from pytezos.logging import logger
-from pytezos.michelson.forge import forge_micheline
-from pytezos.michelson.forge import unforge_micheline
-from pytezos.michelson.format import micheline_to_michelson
-from pytezos.michelson.micheline import MichelsonRuntimeError
-from pytezos.michelson.parse import michelson_to_micheline
-from pytezos.michelson.types.base import MichelsonType
-from pytezos.michelson.types.base import Undefined
-from pytezos.michelson.types.core import Unit
+if TYPE_CHECKING:
+    from pytezos.client import PyTezosClient
+    from pytezos.contract.interface import Contract
+    from pytezos.contract.interface import ContractInterface
+    from pytezos.crypto.key import Key
+    from pytezos.logging import logger
+    from pytezos.michelson.forge import forge_micheline
+    from pytezos.michelson.forge import unforge_micheline
+    from pytezos.michelson.format import micheline_to_michelson
+    from pytezos.michelson.micheline import MichelsonRuntimeError
+    from pytezos.michelson.parse import michelson_to_micheline
+    from pytezos.michelson.types.base import MichelsonType
+    from pytezos.michelson.types.base import Undefined
+    from pytezos.michelson.types.core import Unit
 
 __version__ = importlib.metadata.version('pytezos')
 
-pytezos = PyTezosClient()
+# NOTE: subsystems are imported on first access to keep `import pytezos` cheap
+_lazy_imports = {
+    'PyTezosClient': 'pytezos.client',
+    'Contract': 'pytezos.contract.interface',
+    'ContractInterface': 'pytezos.contract.interface',
+    'Key': 'pytezos.crypto.key',
+    'logger': 'pytezos.logging',
+    'forge_micheline': 'pytezos.michelson.forge',
+    'unforge_micheline': 'pytezos.michelson.forge',
+    'micheline_to_michelson': 'pytezos.michelson.format',
+    'MichelsonRuntimeError': 'pytezos.michelson.micheline',
+    'michelson_to_micheline': 'pytezos.michelson.parse',
+    'MichelsonType': 'pytezos.michelson.types.base',
+    'Undefined': 'pytezos.michelson.types.base',
+    'Unit': 'pytezos.michelson.types.core',
+}
+
+__all__ = ['pytezos', '__version__', *_lazy_imports]
+
+
+def __getattr__(name: str):
+    if name == 'pytezos':
+        value = __getattr__('PyTezosClient')()
+    elif name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -14,6 +14,8 @@ from pytezos.jupyter import is_interactive
 from pytezos.logging import logger
 from pytezos.operation.content import ContentMixin
 from pytezos.operation.group import OperationGroup
+from pytezos.rpc import RateLimiter
+from pytezos.rpc import RetryBudget
 from pytezos.rpc import ShellQuery
 from pytezos.sandbox.parameters import get_protocol_parameters
 
@@ -123,12 +125,16 @@ class PyTezosClient(ContextMixin, ContentMixin):
         key: Optional[Union[Key, str, dict]] = None,
         mode: Optional[str] = None,
         ipfs_gateway: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
     ):
         """Change current RPC endpoint and account (private key).
 
         :param shell: one of 'mainnet', '***net', or RPC node uri, or instance of :class:`pytezos.rpc.shell.ShellQuery`
         :param key: base58 encoded key, path to the faucet file, faucet file itself, alias from tezos-client, or `Key`
         :param mode: whether to use `readable` or `optimized` encoding for parameters/storage/other
+        :param rate_limiter: limit request rate and concurrency per node, e.g. `RateLimiter(rate=10)`
+        :param retry_budget: enable retries of throttled requests within the budget, e.g. `RetryBudget()`
         :returns: A copy of current object with changes applied
         """
         return PyTezosClient(
@@ -137,6 +143,8 @@ class PyTezosClient(ContextMixin, ContentMixin):
                 key=key,
                 mode=mode,
                 ipfs_gateway=ipfs_gateway,
+                rate_limiter=rate_limiter,
+                retry_budget=retry_budget,
             )
         )
 
@@ -204,6 +212,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
         time_between_blocks: Optional[int] = None,
         prev_hash: Optional[str] = None,
         block_timeout: Optional[int] = None,
+        monitor: bool = False,
     ) -> List[dict]:
         """Wait for multiple injected operations get enough confirmations
 
@@ -212,6 +221,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
         :param time_between_blocks: override the corresponding parameter from constants
         :param prev_hash: Current block hash (optional). If not set, current head is used.
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param monitor: follow the heads stream instead of polling, handles reorgs
         """
         if len(operation_groups) == 0:
             raise ValueError('At least one operation group has to be passed to the args')
@@ -229,6 +239,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
             current_block_hash=prev_hash,
             time_between_blocks=time_between_blocks,
             block_timeout=block_timeout,
+            monitor=monitor,
         )
 
     def sleep(
@@ -236,12 +247,14 @@ class PyTezosClient(ContextMixin, ContentMixin):
         num_blocks: int,
         time_between_blocks: Optional[int] = None,
         block_timeout: Optional[int] = None,
+        monitor: bool = False,
     ) -> List[str]:
         """Sleeps until a certain amount of blocks appended to the chain
 
         :param num_blocks: number of blocks to wait for
         :param time_between_blocks: override the corresponding parameter from constants
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param monitor: follow the heads stream instead of polling
         """
         block_hash = self.shell.head.hash()
         return list(
@@ -250,5 +263,6 @@ class PyTezosClient(ContextMixin, ContentMixin):
                 max_blocks=num_blocks,
                 time_between_blocks=time_between_blocks,
                 block_timeout=block_timeout,
+                monitor=monitor,
             )
         )
@@ -11,6 +11,8 @@ from pytezos.crypto.encoding import is_public_key
 from pytezos.crypto.key import Key
 from pytezos.crypto.key import is_installed
 from pytezos.jupyter import InlineDocstring
+from pytezos.rpc import RateLimiter
+from pytezos.rpc import RetryBudget
 from pytezos.rpc import RpcMultiNode
 from pytezos.rpc import RpcNode
 from pytezos.rpc import ShellQuery
@@ -137,6 +139,8 @@ class ContextMixin(metaclass=InlineDocstring):
         ipfs_gateway: Optional[str] = None,
         balance: Optional[int] = None,
         view_results: Optional[Dict[str, Any]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
     ) -> ExecutionContext:
         if isinstance(shell, str):
             if shell.endswith('.pool'):
@@ -150,6 +154,12 @@ class ContextMixin(metaclass=InlineDocstring):
         else:
             assert shell is None or isinstance(shell, ShellQuery), f'unexpected shell {shell}'
 
+        if rate_limiter is not None or retry_budget is not None:
+            shell = shell or self.context.shell
+            assert shell, f'network is undefined'
+            node = shell.node.using(rate_limiter=rate_limiter, retry_budget=retry_budget)
+            shell = shell.__class__(node=node, path=shell._wild_path, params=shell._params, timeout=shell._timeout)
+
         if isinstance(key, str):
             if key in keys:
                 key = Key.from_encoded_key(keys[key])
@@ -13,8 +13,8 @@ from pytezos.contract.result import ContractCallResult
 from pytezos.jupyter import get_class_docstring
 from pytezos.logging import logger
 from pytezos.michelson.format import micheline_to_michelson
+from pytezos.michelson.program import MichelsonProgram
 from pytezos.michelson.repl import Interpreter
-from pytezos.michelson.sections.storage import StorageSection
 from pytezos.operation import DEFAULT_BURN_RESERVE
 from pytezos.operation import DEFAULT_GAS_RESERVE
 from pytezos.operation.content import format_mutez
@@ -169,7 +169,7 @@ class ContractCall(ContextMixin):
         :param view_results: patch VIEW calls (keys must be string "address%view", values => Python objects)
         :rtype: pytezos.contract.result.ContractCallResult
         """
-        storage_ty = StorageSection.match(self.context.storage_expr)
+        storage_ty = MichelsonProgram.load(self.context).storage
         if storage is None:
             initial_storage = storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
         else:
@@ -225,7 +225,7 @@ class ContractCall(ContextMixin):
         :param gas_limit: restrict max consumed gas
         :rtype: ContractCallResult
         """
-        storage_ty = StorageSection.match(self.context.storage_expr)
+        storage_ty = MichelsonProgram.load(self.context).storage
         if storage is None:
             initial_storage = storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
         else:
@@ -279,12 +279,12 @@ class ContractCall(ContextMixin):
         :returns: Decoded parameters of a callback
         """
         if storage:
-            storage_ty = StorageSection.match(self.context.storage_expr)
+            storage_ty = MichelsonProgram.load(self.context).storage
             initial_storage = storage_ty.from_python_object(storage).to_micheline_value(lazy_diff=True)
         elif self.address:
             initial_storage = self.shell.blocks[self.context.block_id].context.contracts[self.address].storage()
         else:
-            storage_ty = StorageSection.match(self.context.storage_expr)
+            storage_ty = MichelsonProgram.load(self.context).storage
             initial_storage = storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
 
         operations, _, stdout, error = Interpreter.run_callback(
@@ -1,3 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Union
 
@@ -5,11 +10,15 @@ from deprecation import deprecated  # type: ignore
 
 from pytezos.context.impl import ExecutionContext
 from pytezos.context.mixin import ContextMixin
+from pytezos.contract.export import export_big_map
 from pytezos.jupyter import get_class_docstring
 from pytezos.michelson.format import micheline_to_michelson
 from pytezos.michelson.parse import michelson_to_micheline
 from pytezos.michelson.types.base import MichelsonType
 from pytezos.michelson.types.base import generate_pydoc
+from pytezos.michelson.types.big_map import BigMapType
+from pytezos.rpc.protocol import DEFAULT_BIG_MAP_PAGE_SIZE
+from pytezos.rpc.search import DEFAULT_FETCH_WORKERS
 
 
 class ContractData(ContextMixin):
@@ -93,6 +102,76 @@ class ContractData(ContextMixin):
         """
         return type(self.data).dummy(self.context).to_python_object(lazy_diff=True)
 
+    def get_many(
+        self,
+        keys: Iterable[Any],
+        workers: int = DEFAULT_FETCH_WORKERS,
+        try_unpack: bool = False,
+    ) -> List[Any]:
+        """Get multiple big_map values at once, requesting them concurrently
+
+        :param keys: big_map keys (Python objects)
+        :param workers: number of concurrent requests
+        :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+        :return: list of Python objects in the order of keys, None for missing keys
+        """
+        if not isinstance(self.data, BigMapType):
+            raise TypeError(f'Expected big_map, got {self.data.prim}')
+        key_type, val_type = self.data.args
+        key_hashes = self.data.get_key_hashes(keys)
+
+        # NOTE: pending changes (not yet applied on chain) take precedence, like in `BigMapType.get`
+        pending = list(self.data)
+        pending_hashes = key_type.get_script_exprs(key for key, _ in pending)
+        values: Dict[str, Optional[MichelsonType]] = {h: val for h, (_, val) in zip(pending_hashes, pending)}
+
+        missing = list(dict.fromkeys(h for h in key_hashes if h not in values))
+        if missing and self.data.ptr is not None and self.context.shell is not None:
+
+            def get_value(key_hash: str) -> Optional[MichelsonType]:
+                val_expr = self.context.get_big_map_value(self.data.ptr, key_hash)  # type: ignore
+                return None if val_expr is None else val_type.from_micheline_value(val_expr)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                values.update(zip(missing, executor.map(get_value, missing)))
+
+        return [
+            None if values.get(key_hash) is None else values[key_hash].to_python_object(try_unpack=try_unpack)  # type: ignore
+            for key_hash in key_hashes
+        ]
+
+    def export(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        try_unpack: bool = False,
+        page_size: int = DEFAULT_BIG_MAP_PAGE_SIZE,
+        workers: int = DEFAULT_FETCH_WORKERS,
+    ) -> int:
+        """Dump all big_map values to a file (JSONL, CSV or Parquet), streaming page by page
+
+        :param path: output file path
+        :param format: one of `jsonl`, `csv`, `parquet`; guessed from the file extension by default
+        :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+        :param page_size: number of values per request
+        :param workers: number of concurrent requests
+        :return: number of exported values
+        """
+        if not isinstance(self.data, BigMapType):
+            raise TypeError(f'Expected big_map, got {self.data.prim}')
+        if self.data.ptr is None or self.shell is None:
+            raise ValueError('Big_map is not deployed or shell is undefined')
+        ptr, _ = self.context.big_maps.get(self.data.ptr, (self.data.ptr, False))
+        return export_big_map(
+            query=self.shell.blocks[self.context.block_id].context.big_maps[ptr],
+            path=path,
+            format=format,
+            value_type=self.data.args[1],
+            try_unpack=try_unpack,
+            page_size=page_size,
+            workers=workers,
+        )
+
     @deprecated(deprecated_in='3.0.0', removed_in='4.0.0')
     def default(self):
         return self.dummy()
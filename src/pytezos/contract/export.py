@@ -0,0 +1,204 @@
+import csv
+import json
+from os.path import splitext
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Type
+
+from pytezos.logging import logger
+from pytezos.michelson.types.base import MichelsonType
+from pytezos.rpc.protocol import DEFAULT_BIG_MAP_PAGE_SIZE
+from pytezos.rpc.protocol import BigMapQuery
+from pytezos.rpc.search import DEFAULT_FETCH_WORKERS
+
+EXPORT_FORMATS = ('jsonl', 'csv', 'parquet')
+DEFAULT_PARQUET_BATCH_SIZE = 10000
+PROGRESS_LOG_INTERVAL = 100000
+
+
+def to_json_compatible(obj: Any) -> Any:
+    """Convert Python representation of a Michelson value to JSON-serializable form.
+
+    Bytes become hex strings, maps with complex keys become lists of `[key, value]` pairs.
+
+    :param obj: result of `MichelsonType.to_python_object`
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, bytes):
+        return obj.hex()
+    if isinstance(obj, dict):
+        if all(isinstance(k, (str, int)) for k in obj):
+            return {k: to_json_compatible(v) for k, v in obj.items()}
+        return [[to_json_compatible(k), to_json_compatible(v)] for k, v in obj.items()]
+    if isinstance(obj, (list, tuple, set)):
+        return [to_json_compatible(x) for x in obj]
+    return str(obj)
+
+
+def _to_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    # NOTE: records (annotated pairs) are spread into columns, nested values are JSON-encoded
+    value = record['value']
+    columns = value if isinstance(value, dict) and all(isinstance(k, str) for k in value) else {'value': value}
+    row = {'index': record['index']}
+    for key, item in columns.items():
+        row[key] = item if item is None or isinstance(item, (str, int, float, bool)) else json.dumps(item)
+    return row
+
+
+class RecordWriter:
+    """Base class for streaming exporters: records are written one by one, memory usage is constant.
+
+    :param path: output file path
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class JsonlWriter(RecordWriter):
+    """One JSON document per line."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self._file = open(path, 'w')  # noqa: SIM115
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False))
+        self._file.write('\n')
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CsvWriter(RecordWriter):
+    """CSV with a header, columns are taken from the first record."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self._file = open(path, 'w', newline='')  # noqa: SIM115
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write(self, record: Dict[str, Any]) -> None:
+        row = _to_row(record)
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(row), restval='', extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerow(row)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter(RecordWriter):
+    """Parquet file written in row groups, requires `pyarrow`.
+
+    Columns are taken from the first record; numbers are stored as strings since Michelson integers are unbounded.
+
+    :param path: output file path
+    :param batch_size: number of rows per row group
+    """
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_PARQUET_BATCH_SIZE) -> None:
+        try:
+            import pyarrow  # type: ignore
+            import pyarrow.parquet  # type: ignore
+        except ImportError as e:
+            raise ImportError('Please, install `pyarrow` Python library to export to Parquet') from e
+        super().__init__(path)
+        self.batch_size = batch_size
+        self._pa = pyarrow
+        self._writer = None
+        self._columns: List[str] = []
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        row = _to_row(record)
+        if not self._columns:
+            self._columns = list(row)
+        self._rows.append({k: None if row.get(k) is None else str(row[k]) for k in self._columns})
+        if len(self._rows) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        schema = self._pa.schema([(name, self._pa.string()) for name in self._columns])
+        table = self._pa.Table.from_pylist(self._rows, schema=schema)
+        if self._writer is None:
+            self._writer = self._pa.parquet.ParquetWriter(self.path, schema)
+        self._writer.write_table(table)  # type: ignore
+        self._rows.clear()
+
+    def close(self) -> None:
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+def open_writer(path: str, format: Optional[str] = None) -> RecordWriter:
+    """Create exporter for the given format.
+
+    :param path: output file path
+    :param format: one of `jsonl`, `csv`, `parquet`; guessed from the file extension by default
+    """
+    if format is None:
+        format = splitext(path)[1].lstrip('.').lower()
+    if format == 'jsonl':
+        return JsonlWriter(path)
+    if format == 'csv':
+        return CsvWriter(path)
+    if format == 'parquet':
+        return ParquetWriter(path)
+    raise ValueError(f'Unsupported export format `{format}`, expected one of {EXPORT_FORMATS}')
+
+
+def export_big_map(
+    query: BigMapQuery,
+    path: str,
+    format: Optional[str] = None,
+    value_type: Optional[Type[MichelsonType]] = None,
+    try_unpack: bool = False,
+    page_size: int = DEFAULT_BIG_MAP_PAGE_SIZE,
+    workers: int = DEFAULT_FETCH_WORKERS,
+) -> int:
+    """Dump all big_map values to a file, streaming page by page.
+
+    Each record is `{'index': <position>, 'value': <value>}`; RPC does not expose keys, only values.
+
+    :param query: big_map RPC query, e.g. `shell.head.context.big_maps[123]`
+    :param path: output file path
+    :param format: one of `jsonl`, `csv`, `parquet`; guessed from the file extension by default
+    :param value_type: decode values with this type, otherwise Micheline expressions are written as is
+    :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+    :param page_size: number of values per request
+    :param workers: number of concurrent requests
+    :returns: number of exported values
+    """
+    index = 0
+    with open_writer(path, format) as writer:
+        for index, expr in enumerate(query.values(page_size=page_size, workers=workers), start=1):
+            if value_type is None:
+                value = expr
+            else:
+                value = to_json_compatible(
+                    value_type.from_micheline_value(expr).to_python_object(try_unpack=try_unpack)
+                )
+            writer.write({'index': index - 1, 'value': value})
+            if index % PROGRESS_LOG_INTERVAL == 0:
+                logger.info('Exported %d values', index)
+    return index
@@ -0,0 +1,388 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import Generator
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.logging import logger
+from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.sections.parameter import ParameterSection
+from pytezos.michelson.sections.storage import StorageSection
+from pytezos.michelson.types.base import MichelsonType
+from pytezos.operation.result import OperationResult
+from pytezos.rpc.search import DEFAULT_FETCH_RETRIES
+from pytezos.rpc.search import DEFAULT_FETCH_WORKERS
+from pytezos.rpc.shell import ShellQuery
+
+DEFAULT_MAX_PENDING = 16
+DEFAULT_CONFIRMATIONS = 2
+DEFAULT_CHECKPOINT_INTERVAL = 1.0
+SCRIPT_CACHE_SIZE = 1024
+
+SectionTypes = Tuple[Type[ParameterSection], Type[StorageSection]]
+
+
+class ContractCallRecord(NamedTuple):
+    """Decoded contract invocation (external or internal transaction)."""
+
+    level: int
+    block_hash: str
+    timestamp: str
+    operation_hash: str
+    counter: Optional[int]
+    nonce: Optional[int]
+    source: str
+    destination: str
+    amount: int
+    entrypoint: str
+    parameters: Any
+    storage: Any
+    status: str
+
+
+class ContractEvent(NamedTuple):
+    """Decoded contract event (emitted with `EMIT`)."""
+
+    level: int
+    block_hash: str
+    timestamp: str
+    operation_hash: str
+    nonce: Optional[int]
+    source: str
+    tag: Optional[str]
+    payload: Any
+    status: str
+
+
+IndexerRecord = Union[ContractCallRecord, ContractEvent]
+
+
+def load_section_types(exprs: Tuple[Any, Any]) -> SectionTypes:
+    """Get compiled parameter and storage types, shared through the process-wide program cache (keyed by code hash).
+
+    :param exprs: `parameter` and `storage` sections of the script
+    """
+    parameter_expr, storage_expr = exprs
+    program = MichelsonProgram.load(ExecutionContext(script={'code': [parameter_expr, storage_expr]}))
+    return program.parameter, program.storage
+
+
+@lru_cache(maxsize=SCRIPT_CACHE_SIZE)
+def _get_event_type(type_json: str) -> Type[MichelsonType]:
+    return MichelsonType.match(json.loads(type_json))
+
+
+def get_script_sections(script: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Extract `parameter` and `storage` sections from contract script.
+
+    :param script: {"code": [...], "storage": ...}
+    """
+    sections = {section['prim']: section for section in script['code']}
+    return sections['parameter'], sections['storage']
+
+
+def _get_status(content: Dict[str, Any]) -> str:
+    if content['internal']:
+        return content.get('result', {}).get('status', 'unknown')
+    return content.get('metadata', {}).get('operation_result', {}).get('status', 'unknown')
+
+
+def extract_block_items(
+    block: Dict[str, Any],
+    contracts: Optional[Set[str]] = None,
+    applied_only: bool = True,
+) -> List[Dict[str, Any]]:
+    """Find contract calls and events in a block (not decoded yet).
+
+    :param block: {"header": {...}, "operations": [[...], ...]}
+    :param contracts: addresses to track, all originated contracts by default; implicit accounts are skipped
+    :param applied_only: skip failed, backtracked and skipped operations
+    """
+    items = []
+    for validation_pass in block['operations']:
+        for group in validation_pass:
+            for content in OperationResult.iter_contents(group):
+                kind = content['kind']
+                if kind == 'transaction':
+                    address = content['destination']
+                elif kind == 'event':
+                    address = content['source']
+                else:
+                    continue
+                # NOTE: implicit accounts (and rollups) have no script, even if listed in `contracts`
+                if not address.startswith('KT1'):
+                    continue
+                if contracts is not None and address not in contracts:
+                    continue
+                status = _get_status(content)
+                if applied_only and status != 'applied':
+                    continue
+                result = content.get('result') if content['internal'] else content['metadata'].get('operation_result')
+                items.append(
+                    {
+                        'kind': kind,
+                        'address': address,
+                        'operation_hash': group.get('hash'),
+                        'status': status,
+                        'content': content,
+                        'result': result or {},
+                    }
+                )
+    return items
+
+
+def decode_block_items(
+    header: Dict[str, Any],
+    items: List[Dict[str, Any]],
+    scripts: Dict[str, Tuple[Any, Any]],
+    decode_storage: bool = False,
+) -> List[IndexerRecord]:
+    """Decode raw items with contract types, runs in worker processes.
+
+    :param header: block header
+    :param items: result of :func:`extract_block_items`
+    :param scripts: `parameter` and `storage` sections of the called contracts
+    :param decode_storage: decode resulting storage as well
+    """
+    records: List[IndexerRecord] = []
+    section_types = {address: load_section_types(exprs) for address, exprs in scripts.items()}
+    for item in items:
+        content, result = item['content'], item['result']
+        common = {
+            'level': header['level'],
+            'block_hash': header['hash'],
+            'timestamp': header['timestamp'],
+            'operation_hash': item['operation_hash'],
+            'nonce': content.get('nonce'),
+            'status': item['status'],
+        }
+        if item['kind'] == 'event':
+            payload = content.get('payload')
+            if payload is not None and content.get('type') is not None:
+                event_type = _get_event_type(json.dumps(content['type'], sort_keys=True))
+                payload = event_type.from_micheline_value(payload).to_python_object()
+            records.append(ContractEvent(source=item['address'], tag=content.get('tag'), payload=payload, **common))
+            continue
+
+        parameter_type, storage_type = section_types[item['address']]
+        parameters = content.get('parameters', {})
+        decoded_parameters = parameter_type.from_parameters(parameters).to_python_object()
+        storage = None
+        if decode_storage and result.get('storage') is not None:
+            value = storage_type.from_micheline_value(result['storage'])
+            storage = value.merge_lazy_diff(result.get('lazy_storage_diff', [])).to_python_object()
+        records.append(
+            ContractCallRecord(
+                counter=int(content['counter']) if 'counter' in content else None,
+                source=content['source'],
+                destination=item['address'],
+                amount=int(content.get('amount', 0)),
+                entrypoint=parameters.get('entrypoint', 'default'),
+                parameters=decoded_parameters,
+                storage=storage,
+                **common,
+            )
+        )
+    return records
+
+
+class Checkpoint:
+    """Last fully processed block, stored durably (atomic replace + fsync) as JSON.
+
+    :param path: checkpoint file path
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as f:
+            return json.load(f)
+
+    def save(self, level: int, block_hash: str) -> None:
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'level': level, 'hash': block_hash}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class ChainIndexer:
+    """Streaming pipeline turning blocks into decoded contract calls and events.
+
+    Blocks are downloaded concurrently (see :meth:`BlockSliceQuery.fetch`), decoded in a process pool and delivered
+    in chain order. The number of blocks in flight is bounded, so a slow consumer slows down the whole pipeline.
+    Checkpoint is advanced only after all records of a block have been consumed (at-least-once delivery).
+
+    .. code-block:: python
+
+        indexer = ChainIndexer(pytezos.shell, contracts=['KT1...'], checkpoint='indexer.json', decode_workers=4)
+        for record in indexer.index(start=3_000_000, stop=3_100_000):
+            save(record)
+
+    :param shell: shell query
+    :param contracts: addresses to track, all originated contracts by default
+    :param checkpoint: path to the checkpoint file, used to resume after a crash
+    :param fetch_workers: number of concurrent block requests
+    :param decode_workers: number of decoding processes, decode in the current process if zero
+    :param max_pending: maximum number of blocks being decoded at once
+    :param decode_storage: decode resulting storage of contract calls
+    :param applied_only: skip failed, backtracked and skipped operations
+    :param confirmations: live mode only processes blocks with this many blocks on top of them (reorg protection)
+    :param checkpoint_interval: minimum interval between checkpoint writes (seconds)
+    """
+
+    def __init__(
+        self,
+        shell: ShellQuery,
+        contracts: Optional[Iterable[str]] = None,
+        checkpoint: Optional[str] = None,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
+        decode_workers: int = 0,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        decode_storage: bool = False,
+        applied_only: bool = True,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+        checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        self.shell = shell
+        self.contracts = set(contracts) if contracts is not None else None
+        self.checkpoint = Checkpoint(checkpoint) if checkpoint else None
+        self.fetch_workers = fetch_workers
+        self.decode_workers = decode_workers
+        self.max_pending = max_pending
+        self.decode_storage = decode_storage
+        self.applied_only = applied_only
+        self.confirmations = confirmations
+        self.checkpoint_interval = checkpoint_interval
+        self._scripts: 'OrderedDict[str, Tuple[Any, Any]]' = OrderedDict()
+
+    def __repr__(self) -> str:
+        contracts = 'all contracts' if self.contracts is None else f'{len(self.contracts)} contracts'
+        return f'{self.__class__.__name__}({contracts}, decode_workers={self.decode_workers})'
+
+    def _get_start(self, start: int) -> int:
+        state = self.checkpoint.load() if self.checkpoint else None
+        if state is not None and state['level'] >= start:
+            logger.info('Resuming from level %d', state['level'] + 1)
+            return state['level'] + 1
+        return start
+
+    def _get_script(self, address: str, level: int) -> Tuple[Any, Any]:
+        if address not in self._scripts:
+            script = self.shell.blocks[level].context.contracts[address].script()
+            self._scripts[address] = get_script_sections(script)
+            if len(self._scripts) > SCRIPT_CACHE_SIZE:
+                self._scripts.popitem(last=False)
+        return self._scripts[address]
+
+    def _fetch_range(self, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        if start > stop:
+            return iter(())
+        return self.shell.blocks[start:stop].fetch(
+            parts=('header', 'operations'),
+            workers=self.fetch_workers,
+            retries=DEFAULT_FETCH_RETRIES,
+        )
+
+    def _follow_heads(self, start: int) -> Generator[Dict[str, Any], None, None]:
+        level = start
+        heads = iter(self.shell.monitor.heads.main())
+        try:
+            for head in heads:
+                target = head['level'] - self.confirmations
+                if target >= level:
+                    yield from self._fetch_range(level, target)
+                    level = target + 1
+        finally:
+            heads.close()  # type: ignore
+
+    def _submit(self, executor: Optional[Executor], block: Dict[str, Any]) -> Future:
+        header = block['header']
+        items = extract_block_items(block, contracts=self.contracts, applied_only=self.applied_only)
+        calls = {item['address'] for item in items if item['kind'] == 'transaction'}
+        # NOTE: scripts are fetched here (I/O), workers only compile them (CPU), compiled types are cached per process
+        scripts = {address: self._get_script(address, header['level']) for address in calls}
+        if executor is None:
+            future: Future = Future()
+            future.set_result(decode_block_items(header, items, scripts, self.decode_storage))
+            return future
+        return executor.submit(decode_block_items, header, items, scripts, self.decode_storage)
+
+    def _run(self, blocks: Iterator[Dict[str, Any]], live: bool) -> Generator[IndexerRecord, None, None]:
+        executor = ProcessPoolExecutor(max_workers=self.decode_workers) if self.decode_workers > 0 else None
+        pending: Deque[Tuple[Dict[str, Any], Future]] = deque()
+        saved_at = time.monotonic()
+        last_header: Optional[Dict[str, Any]] = None
+
+        def save_checkpoint(force: bool = False) -> None:
+            nonlocal saved_at
+            if self.checkpoint is None or last_header is None:
+                return
+            if force or time.monotonic() - saved_at >= self.checkpoint_interval:
+                self.checkpoint.save(last_header['level'], last_header['hash'])
+                saved_at = time.monotonic()
+
+        try:
+            for block in blocks:
+                pending.append((block['header'], self._submit(executor, block)))
+                # NOTE: in live mode blocks are rare, deliver right away
+                while pending and (live or len(pending) >= self.max_pending or pending[0][1].done()):
+                    header, future = pending.popleft()
+                    yield from future.result()
+                    last_header = header
+                    save_checkpoint()
+            while pending:
+                header, future = pending.popleft()
+                yield from future.result()
+                last_header = header
+                save_checkpoint()
+        finally:
+            save_checkpoint(force=True)
+            for _, future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def index(self, start: int, stop: Optional[int] = None) -> Generator[IndexerRecord, None, None]:
+        """Index a level range, resuming from the checkpoint if any.
+
+        :param start: first level
+        :param stop: last level (inclusive), current head by default
+        :returns: Generator (lazy) of :class:`ContractCallRecord` and :class:`ContractEvent` in chain order
+        """
+        start = self._get_start(start)
+        if stop is None:
+            stop = self.shell.head.header()['level']
+        return self._run(self._fetch_range(start, stop), live=False)
+
+    def follow(self, start: Optional[int] = None) -> Generator[IndexerRecord, None, None]:
+        """Index new blocks as they arrive (never ends), catching up from `start` or checkpoint first.
+
+        :param start: first level, the current head minus confirmations by default
+        :returns: Generator (lazy) of :class:`ContractCallRecord` and :class:`ContractEvent` in chain order
+        """
+        if start is None:
+            start = self.shell.head.header()['level'] - self.confirmations
+        return self._run(self._follow_heads(self._get_start(start)), live=True)
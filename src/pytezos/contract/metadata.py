@@ -11,7 +11,6 @@ from typing import Union
 
 import requests
 from attr import dataclass
-from jsonschema import validate as jsonschema_validate  # type: ignore
 
 from pytezos.context.impl import ExecutionContext
 from pytezos.context.mixin import ContextMixin
@@ -163,6 +162,8 @@ class ContractMetadata(ContextMixin):
     @staticmethod
     def validate_metadata_json(metadata_json: Dict[str, Any]) -> None:
         """Validate metadata JSON with JSONSchema"""
+        from jsonschema import validate as jsonschema_validate  # type: ignore
+
         jsonschema_validate(instance=metadata_json, schema=metadata_schema)
 
     @classmethod
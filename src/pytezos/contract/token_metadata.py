@@ -10,7 +10,6 @@ from typing import Optional
 
 import requests
 from attr import dataclass
-from jsonschema import validate as jsonschema_validate  # type: ignore
 
 from pytezos.context.impl import ExecutionContext
 from pytezos.context.mixin import ContextMixin
@@ -104,6 +103,8 @@ class ContractTokenMetadata(ContextMixin):
     @staticmethod
     def validate_token_metadata_json(metadata_json: Dict[str, Any]) -> None:
         """Validate token metadata JSON with JSONSchema"""
+        from jsonschema import validate as jsonschema_validate  # type: ignore
+
         jsonschema_validate(instance=metadata_json, schema=token_metadata_schema)
 
     @classmethod
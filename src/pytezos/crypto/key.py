@@ -13,7 +13,6 @@ from typing import Union
 from eth_typing import BLSPubkey
 from eth_typing import BLSSignature
 from mnemonic import Mnemonic
-from py_ecc.bls import G2MessageAugmentation as G2  # noqa: N814
 
 from pytezos.crypto.encoding import base58_decode
 from pytezos.crypto.encoding import base58_encode
@@ -166,6 +165,8 @@ class Key(metaclass=InlineDocstring):
 
         # BLS12-381
         elif curve == b'BL':
+            from py_ecc.bls import G2MessageAugmentation as G2  # noqa: N814
+
             sk_int = int.from_bytes(secret_exponent, byteorder='little')
             public_point = G2.SkToPk(sk_int)
 
@@ -472,6 +473,8 @@ class Key(metaclass=InlineDocstring):
             signature = r.to_bytes(32, 'big') + s.to_bytes(32, 'big')
         elif self.curve == b'BL':
             # BLS12-381
+            from py_ecc.bls import G2MessageAugmentation as G2  # noqa: N814
+
             sk_int = int.from_bytes(self.secret_exponent, byteorder='little')
             signature = G2.Sign(sk_int, encoded_message)
         else:
@@ -530,6 +533,8 @@ class Key(metaclass=InlineDocstring):
                 raise ValueError('Signature is invalid.')
         # BLS12-381
         elif self.curve == b'BL':
+            from py_ecc.bls import G2MessageAugmentation as G2  # noqa: N814
+
             if not G2.Verify(
                 BLSPubkey(self.public_point),
                 encoded_message,
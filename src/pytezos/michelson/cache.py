@@ -0,0 +1,281 @@
+import importlib
+import json
+import marshal
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from hashlib import blake2b
+from os.path import expanduser
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from pytezos.logging import logger
+from pytezos.michelson.micheline import get_interned_attrs
+from pytezos.michelson.micheline import intern_type
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_PROGRAM_CACHE_SIZE = 256
+PROGRAM_SECTIONS = ('parameter', 'storage', 'code')
+
+# NOTE: serialized programs are only valid for the same class layout and marshal format
+_FORMAT_VERSION = 1
+_CLASS, _INTERNED = 0, 1
+_VALUE, _LIST, _REF = 0, 1, 2
+
+
+def get_expr_hash(expr) -> str:
+    """Hash of a Micheline expression, insensitive to the order of object keys.
+
+    :param expr: Micheline expression
+    """
+    if orjson is not None:
+        # NOTE: same output as `json.dumps` below, an order of magnitude faster on big scripts
+        with suppress(TypeError):
+            return blake2b(orjson.dumps(expr, option=orjson.OPT_SORT_KEYS), digest_size=20).hexdigest()
+    data = json.dumps(expr, separators=(',', ':'), sort_keys=True, ensure_ascii=False).encode()
+    return blake2b(data, digest_size=20).hexdigest()
+
+
+def _get_version() -> str:
+    from pytezos import __version__
+
+    return f'{_FORMAT_VERSION}:{__version__}:{sys.version_info[0]}.{sys.version_info[1]}'
+
+
+class _TypeTableWriter:
+    """Flattens a graph of interned classes into a list of nodes, children first."""
+
+    def __init__(self) -> None:
+        self.nodes: List[tuple] = []
+        self.index: Dict[type, int] = {}
+
+    def ref(self, ty: type) -> int:
+        idx = self.index.get(ty)
+        if idx is not None:
+            return idx
+        interned = get_interned_attrs(ty)
+        if interned is not None:
+            base, attrs = interned
+            node: tuple = (
+                _INTERNED,
+                self.ref(base),
+                tuple((name, self.encode(value)) for name, value in attrs.items()),
+            )
+        elif ty.__qualname__ == ty.__name__ and getattr(sys.modules.get(ty.__module__), ty.__name__, None) is ty:
+            node = (_CLASS, ty.__module__, ty.__name__)
+        else:
+            raise ValueError(f'Cannot serialize dynamic class {ty.__qualname__}, only interned types are supported')
+        idx = self.index[ty] = len(self.nodes)
+        self.nodes.append(node)
+        return idx
+
+    def encode(self, value) -> tuple:
+        if isinstance(value, list):
+            return _LIST, tuple(map(self.encode, value))
+        if isinstance(value, type):
+            return _REF, self.ref(value)
+        return _VALUE, value
+
+
+def _resolve_class(module: str, name: str) -> type:
+    if not module.startswith('pytezos.michelson.'):
+        raise ValueError(f'Unexpected module `{module}`')
+    ty = getattr(importlib.import_module(module), name)
+    if not isinstance(ty, type):
+        raise ValueError(f'`{module}.{name}` is not a class')
+    return ty
+
+
+def _read_type_table(nodes: List[tuple]) -> List[type]:
+    classes: List[type] = []
+
+    def decode(value: tuple):
+        kind, data = value
+        if kind == _LIST:
+            return list(map(decode, data))
+        if kind == _REF:
+            return classes[data]
+        return data
+
+    for node in nodes:
+        if node[0] == _CLASS:
+            classes.append(_resolve_class(node[1], node[2]))
+        else:
+            _, base, attrs = node
+            classes.append(intern_type(classes[base], {name: decode(value) for name, value in attrs}))
+    return classes
+
+
+def dump_program(program: type) -> bytes:
+    """Serialize compiled program: the graph of section and instruction classes is stored as is,
+    so that loading it does not require parsing and type checking the code again.
+
+    :param program: class returned by `MichelsonProgram.load` or `MichelsonProgram.match`
+    """
+    writer = _TypeTableWriter()
+    base = writer.ref(program.__mro__[1])
+    sections = tuple(writer.ref(getattr(program, name)) for name in PROGRAM_SECTIONS)
+    views = tuple(map(writer.ref, program.views))  # type: ignore
+    return marshal.dumps((tuple(writer.nodes), base, sections, views))
+
+
+def load_program(data: bytes) -> type:
+    """Deserialize compiled program produced by `dump_program`.
+
+    :param data: serialized program
+    """
+    nodes, base, sections, views = marshal.loads(data)
+    classes = _read_type_table(nodes)
+    return classes[base].create_type(  # type: ignore
+        *(classes[idx] for idx in sections),
+        views=[classes[idx] for idx in views],
+    )
+
+
+class ProgramCache:
+    """Process-wide LRU cache of compiled programs keyed by the hash of their code.
+
+    Optionally programs are also stored on disk (SQLite) in serialized form, so that other processes and restarted
+    workers can skip parsing and type checking of big scripts.
+
+    :param max_size: maximum number of programs kept in memory
+    :param path: path to the database file (optional)
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PROGRAM_CACHE_SIZE, path: Optional[str] = None) -> None:
+        self.max_size = max_size
+        self.path = expanduser(path) if path else None
+        self._programs: 'OrderedDict[str, type]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(('hits', 'misses', 'evictions', 'disk_hits', 'disk_writes', 'disk_errors'), 0)
+        self._version = _get_version()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.path:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS programs (key TEXT PRIMARY KEY, version TEXT, value BLOB)')
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self)} programs, path={self.path})'
+
+    def __len__(self) -> int:
+        return len(self._programs)
+
+    def get(self, key: str) -> Optional[type]:
+        """Get compiled program from memory, or from disk if enabled.
+
+        :param key: code hash, see `get_expr_hash`
+        """
+        with self._lock:
+            program = self._programs.get(key)
+            if program is not None:
+                self._programs.move_to_end(key)
+                self._stats['hits'] += 1
+                return program
+            self._stats['misses'] += 1
+        if self._conn is None:
+            return None
+
+        with self._lock:
+            row = self._conn.execute('SELECT version, value FROM programs WHERE key = ?', (key,)).fetchone()
+        if row is None or row[0] != self._version:
+            return None
+        try:
+            program = load_program(bytes(row[1]))
+        except Exception as e:
+            logger.debug('Failed to load program %s from disk: %s', key, e)
+            self._count('disk_errors')
+            return None
+        self._count('disk_hits')
+        self._put(key, program)
+        return program
+
+    def set(self, key: str, program: type) -> None:
+        """Store compiled program in memory, and on disk if enabled.
+
+        :param key: code hash, see `get_expr_hash`
+        :param program: `MichelsonProgram` class
+        """
+        self._put(key, program)
+        if self._conn is None:
+            return
+        try:
+            data = dump_program(program)
+        except Exception as e:
+            logger.debug('Failed to serialize program %s: %s', key, e)
+            self._count('disk_errors')
+            return
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO programs (key, version, value) VALUES (?, ?, ?)',
+                (key, self._version, data),
+            )
+            self._stats['disk_writes'] += 1
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _put(self, key: str, program: type) -> None:
+        with self._lock:
+            self._programs[key] = program
+            self._programs.move_to_end(key)
+            while len(self._programs) > self.max_size:
+                self._programs.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def get_or_create(self, expr: Any, factory: Callable[[], type]) -> type:
+        """Get compiled program for the given code, compile it on a miss.
+
+        :param expr: Micheline expression the program is compiled from
+        :param factory: callable compiling the program
+        """
+        key = get_expr_hash(expr)
+        program = self.get(key)
+        if program is None:
+            program = factory()
+            self.set(key, program)
+        return program
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters: hits, misses, evictions and disk usage (if enabled)."""
+        with self._lock:
+            return {'size': len(self._programs), **self._stats}
+
+    def clear(self) -> None:
+        """Drop all programs from memory, on-disk storage is kept."""
+        with self._lock:
+            self._programs.clear()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_program_cache: Optional[ProgramCache] = ProgramCache()
+
+
+def get_program_cache() -> Optional[ProgramCache]:
+    """Get process-wide cache used by `MichelsonProgram.load` and `MichelsonProgram.match`."""
+    return _program_cache
+
+
+def set_program_cache(cache: Optional[ProgramCache]) -> None:
+    """Replace process-wide program cache.
+
+    :param cache: new cache instance, None to disable caching
+    """
+    global _program_cache
+    _program_cache = cache
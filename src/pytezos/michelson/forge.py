@@ -1,7 +1,11 @@
 from contextlib import suppress
+from hashlib import blake2b
+from hashlib import sha256
 from typing import Any
 from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Union
 
@@ -10,11 +14,17 @@ import strict_rfc3339  # type: ignore
 
 from pytezos.crypto.encoding import base58_decode
 from pytezos.crypto.encoding import base58_encode
+from pytezos.crypto.encoding import base58_encodings
 from pytezos.crypto.key import blake2b_32
 from pytezos.michelson.tags import prim_tags
 
 prim_int = {v[0]: k for k, v in prim_tags.items()}
 
+# NOTE: base58 is converted two digits at a time, bignum arithmetic dominates otherwise
+_BASE58_DIGITS = base58.BITCOIN_ALPHABET.decode()
+_BASE58_PAIRS = [a + b for a in _BASE58_DIGITS for b in _BASE58_DIGITS]
+_SCRIPT_EXPR_PREFIX = next(encoding[2] for encoding in base58_encodings if encoding[0] == b'expr')
+
 
 def get_tag(args_len: int, annots_len: int) -> bytes:
     tag = min(args_len * 2 + 3 + (1 if annots_len > 0 else 0), 9)
@@ -53,7 +63,7 @@ def forge_int32(value: int) -> bytes:
     return value.to_bytes(4, 'big')
 
 
-def unforge_int(data: bytes) -> (int, int):  # type: ignore
+def unforge_int(data: Union[bytes, memoryview]) -> (int, int):  # type: ignore
     """Decode signed unbounded integer from bytes.
 
     :param data: Encoded integer
@@ -286,122 +296,162 @@ def unforge_array(data: bytes, len_bytes=4) -> tuple:
     return data[len_bytes : len_bytes + length], len_bytes + length
 
 
+class _ArrayEnd(int):
+    """Position of the length prefix to fill in once the array body is written."""
+
+
+class _Raw(bytes):
+    """Bytes to write as is."""
+
+
 def forge_micheline(data: Union[List, Dict]) -> bytes:
     """Encode a Micheline expression into the byte form.
 
+    Expression is traversed iteratively and written into a single buffer, so nesting depth is not limited.
+
     :param data: Micheline expression
     """
-    res = []
-
-    if isinstance(data, list):
-        res.append(b'\x02')
-        res.append(forge_array(b''.join(map(forge_micheline, data))))
-
-    elif isinstance(data, dict):
-        if data.get('prim'):
-            args_len = len(data.get('args', []))
-            annots_len = len(data.get('annots', []))
-
-            res.append(get_tag(args_len, annots_len))
-            res.append(prim_tags[data['prim']])
-
-            if args_len > 0:
-                args = b''.join(map(forge_micheline, data['args']))
-                if args_len < 3:
-                    res.append(args)
-                else:
-                    res.append(forge_array(args))
-
-            if annots_len > 0:
-                res.append(forge_array(' '.join(data['annots']).encode()))
-            elif args_len >= 3:
-                res.append(b'\x00' * 4)
-
-        elif data.get('bytes') is not None:
-            res.append(b'\x0A')
-            res.append(forge_array(bytes.fromhex(data['bytes'])))
-
-        elif data.get('int') is not None:
-            res.append(b'\x00')
-            res.append(forge_int(int(data['int'])))
-
-        elif data.get('string') is not None:
-            res.append(b'\x01')
-            res.append(forge_array(data['string'].encode()))
+    res = bytearray()
+    stack: List[Any] = [data]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+
+    while stack:
+        item = pop()
+        if isinstance(item, dict):
+            if item.get('prim'):
+                args = item.get('args', [])
+                annots = item.get('annots', [])
+                args_len, annots_len = len(args), len(annots)
+
+                res.append(min(args_len * 2 + 3 + (1 if annots_len > 0 else 0), 9))
+                res += prim_tags[item['prim']]
+
+                if annots_len > 0:
+                    push(_Raw(forge_array(' '.join(annots).encode())))
+                elif args_len >= 3:
+                    push(_Raw(b'\x00' * 4))
+
+                if args_len >= 3:
+                    push(_ArrayEnd(len(res)))
+                    res += b'\x00' * 4
+                extend(reversed(args))
+
+            elif item.get('bytes') is not None:
+                res.append(0x0A)
+                res += forge_array(bytes.fromhex(item['bytes']))
+
+            elif item.get('int') is not None:
+                res.append(0x00)
+                res += forge_int(int(item['int']))
+
+            elif item.get('string') is not None:
+                res.append(0x01)
+                res += forge_array(item['string'].encode())
+            else:
+                raise AssertionError(item)
+
+        elif isinstance(item, list):
+            res.append(0x02)
+            push(_ArrayEnd(len(res)))
+            res += b'\x00' * 4
+            extend(reversed(item))
+        elif type(item) is _ArrayEnd:
+            res[item : item + 4] = (len(res) - item - 4).to_bytes(4, 'big')
+        elif type(item) is _Raw:
+            res += item
         else:
-            raise AssertionError(data)
-    else:
-        raise AssertionError(data)
+            raise AssertionError(item)
+
+    return bytes(res)
 
-    return b''.join(res)
+
+def _read_array(data: memoryview, ptr: int) -> Tuple[int, int]:
+    # NOTE: same checks as `unforge_array`, returns body boundaries instead of a copy
+    assert len(data) - ptr >= 4, f'not enough bytes to parse array length, wanted 4'
+    length = int.from_bytes(data[ptr : ptr + 4], 'big')
+    assert len(data) - ptr >= 4 + length, f'not enough bytes to parse array body, wanted {length}'
+    return ptr + 4, ptr + 4 + length
 
 
 def unforge_micheline(data: bytes) -> Union[List, Dict]:
     """Parse Micheline JSON from bytes.
 
+    Input is read in place without copying, nesting depth is not limited.
+
     :param data: Forged Micheline expression
     :returns: Micheline JSON
     """
+    buf = memoryview(data)
     ptr = 0
+    # NOTE: open containers: (items, end of sequence or -1, expected number of args, prim expression, has annots)
+    stack: List[Tuple[list, int, int, Optional[dict], bool]] = []
 
-    def unforge_sequence():
-        nonlocal ptr
-        _, offset = unforge_array(data[ptr:])
-        end, res = ptr + offset, []
-        ptr += 4
-        while ptr < end:
-            res.append(unforge())
-        assert ptr == end, f'out of sequence boundaries'
-        return res
-
-    def unforge_prim_expr(args_len=0, annots=False):
-        nonlocal ptr
-        prim_tag = data[ptr]
-        ptr += 1
-        expr = {'prim': prim_int[prim_tag]}
-
-        if 0 < args_len < 3:
-            expr['args'] = [unforge() for _ in range(args_len)]
-        elif args_len == 3:
-            expr['args'] = unforge_sequence()
-        else:
-            assert args_len == 0, f'unexpected args len {args_len}'
-
-        if annots or args_len == 3:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            if len(value) > 0:
-                expr['annots'] = value.decode().split(' ')
-
-        return expr
-
-    def unforge():
-        nonlocal ptr
-        tag = data[ptr]
+    while True:
+        tag = buf[ptr]
         ptr += 1
+        value: Any = None
         if tag == 0:
-            value, offset = unforge_int(data[ptr:])
+            num, offset = unforge_int(buf[ptr:])
             ptr += offset
-            return {'int': str(value)}
+            value = {'int': str(num)}
         elif tag == 1:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            return {'string': value.decode()}
+            start, ptr = _read_array(buf, ptr)
+            value = {'string': str(buf[start:ptr], 'utf-8')}
         elif tag == 2:
-            return unforge_sequence()
+            ptr, end = _read_array(buf, ptr)
+            stack.append(([], end, 0, None, False))
         elif 2 < tag < 10:
             args_len, annots = read_tag(tag)
-            return unforge_prim_expr(args_len, annots)
+            expr: Dict[str, Any] = {'prim': prim_int[buf[ptr]]}
+            ptr += 1
+            if args_len == 0:
+                if annots:
+                    ptr = _read_annots(buf, ptr, expr)
+                value = expr
+            elif args_len < 3:
+                expr['args'] = []
+                stack.append((expr['args'], -1, args_len, expr, annots))
+            else:
+                assert args_len == 3, f'unexpected args len {args_len}'
+                ptr, end = _read_array(buf, ptr)
+                expr['args'] = []
+                stack.append((expr['args'], end, 0, expr, True))
         elif tag == 10:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            return {'bytes': value.hex()}
+            start, ptr = _read_array(buf, ptr)
+            value = {'bytes': buf[start:ptr].hex()}
         else:
             raise AssertionError(f'unkonwn tag {tag} at position {ptr}')
 
-    result = unforge()
-    assert ptr == len(data), f'have not reach EOS (pos {ptr}/{len(data)})'
-    return result
+        while stack:
+            items, end, args_len, prim_expr, annots = stack[-1]
+            if value is not None:
+                items.append(value)
+                value = None
+            if end == -1:
+                if len(items) < args_len:
+                    break
+            elif ptr < end:
+                break
+            else:
+                assert ptr == end, f'out of sequence boundaries'
+            stack.pop()
+            if prim_expr is None:
+                value = items
+            else:
+                if annots:
+                    ptr = _read_annots(buf, ptr, prim_expr)
+                value = prim_expr
+
+        if not stack:
+            assert ptr == len(buf), f'have not reach EOS (pos {ptr}/{len(buf)})'
+            return value
+
+
+def _read_annots(data: memoryview, ptr: int, expr: dict) -> int:
+    start, end = _read_array(data, ptr)
+    if end > start:
+        expr['annots'] = str(data[start:end], 'utf-8').split(' ')
+    return end
 
 
 def forge_script(script: Dict[str, Any]) -> bytes:
@@ -414,6 +464,28 @@ def forge_script(script: Dict[str, Any]) -> bytes:
     return forge_array(code) + forge_array(storage)
 
 
+def _encode_script_expr(digest: bytes) -> str:
+    # NOTE: same result as `base58_encode(digest, b'expr')`, but two digits per division
+    payload = _SCRIPT_EXPR_PREFIX + digest
+    payload += sha256(sha256(payload).digest()).digest()[:4]
+    num = int.from_bytes(payload, 'big')
+    res = []
+    while num:
+        num, rem = divmod(num, 58 * 58)
+        res.append(_BASE58_PAIRS[rem])
+    res.reverse()
+    # NOTE: prefix has no leading zero bytes, so the only leading `1` can come from the first pair
+    return ''.join(res).lstrip('1')
+
+
 def forge_script_expr(packed_key: bytes) -> str:
     data = blake2b_32(packed_key).digest()
-    return base58_encode(data, b'expr').decode()
+    return _encode_script_expr(data)
+
+
+def forge_script_exprs(packed_keys: Iterable[Union[bytes, memoryview]]) -> List[str]:
+    """Get script expression hashes (`expr...`) of multiple packed values at once.
+
+    :param packed_keys: packed values (or slices of a shared buffer), see `MichelsonType.pack_many`
+    """
+    return [_encode_script_expr(blake2b(key, digest_size=32).digest()) for key in packed_keys]
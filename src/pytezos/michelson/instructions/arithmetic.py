@@ -5,8 +5,6 @@ from typing import Type
 from typing import Union
 from typing import cast
 
-from py_ecc import optimized_bls12_381 as bls12_381
-
 from pytezos.context.abstract import AbstractContext
 from pytezos.michelson.instructions.base import MichelsonInstruction
 from pytezos.michelson.instructions.base import dispatch_types
@@ -77,6 +75,8 @@ class AddInstruction(MichelsonInstruction, prim='ADD'):
         if issubclass(res_type, IntType):
             res = res_type.from_value(int(a) + int(b))  # type: ignore
         else:
+            from py_ecc import optimized_bls12_381 as bls12_381
+
             res = res_type.from_point(bls12_381.add(a.to_point(), b.to_point()))  # type: ignore
         stack.push(res)
         stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
@@ -182,6 +182,8 @@ class MulInstruction(MichelsonInstruction, prim='MUL'):
         if issubclass(res_type, IntType):
             res = res_type.from_value(int(a) * int(b))  # type: ignore
         else:
+            from py_ecc import optimized_bls12_381 as bls12_381
+
             res = res_type.from_point(bls12_381.multiply(a.to_point(), int(b)))  # type: ignore
         stack.push(res)
         stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
@@ -205,6 +207,8 @@ class NegInstruction(MichelsonInstruction, prim='NEG'):
         if issubclass(res_type, IntType):
             res = IntType.from_value(-int(a))  # type: ignore
         else:
+            from py_ecc import optimized_bls12_381 as bls12_381
+
             res = res_type.from_point(bls12_381.neg(a.to_point()))  # type: ignore
         stack.push(res)
         stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
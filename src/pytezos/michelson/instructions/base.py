@@ -9,6 +9,7 @@ from typing import cast
 
 from pytezos.context.abstract import AbstractContext
 from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.micheline import intern_type
 from pytezos.michelson.stack import MichelsonStack
 
 
@@ -62,9 +63,8 @@ class MichelsonInstruction(Micheline):
             var_names = [a[1:] for a in annots if a.startswith('@')]
         else:
             field_names, var_names = [], []
-        res = type(
-            cls.__name__,
-            (cls,),
+        res = intern_type(
+            cls,
             {
                 'args': args,
                 'field_names': field_names,
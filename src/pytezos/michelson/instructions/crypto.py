@@ -6,7 +6,6 @@ from typing import List
 from typing import Tuple
 from typing import cast
 
-from py_ecc import optimized_bls12_381 as bls12_381
 from py_ecc.fields import optimized_bls12_381_FQ12 as FQ12
 
 from pytezos.context.abstract import AbstractContext
@@ -118,6 +117,8 @@ class PairingCheckInstruction(MichelsonInstruction, prim='PAIRING_CHECK'):
                 ]
             )
         )
+        from py_ecc import optimized_bls12_381 as bls12_381
+
         prod = FQ12.one()
         for pair in points:
             g1, g2 = tuple(iter(pair))  # type: Tuple[BLS12_381_G1Type, BLS12_381_G2Type]
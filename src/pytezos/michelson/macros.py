@@ -1,6 +1,8 @@
 import functools
 import re
 from collections import namedtuple
+from typing import Callable
+from typing import Optional
 from typing import Tuple
 
 from pytezos.michelson.tags import prim_tags
@@ -25,6 +27,7 @@ PxrNode = namedtuple('PxrNode', ['depth', 'annots', 'args', 'is_root'])
 def macro(regexp):
     def register_macro(func):
         macros.append((re.compile(regexp), func))
+        resolve_macro.cache_clear()
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -58,14 +61,28 @@ def expand_macro(prim, annots, args, internal=False):
     if prim in prim_tags:
         return expr(prim=prim, annots=annots, args=args)
 
+    resolved = resolve_macro(prim)
+    if resolved:
+        handler, group = resolved
+        res = handler(group, annots, args)
+        return res if internal else seq(res)
+
+    raise AssertionError(f'unknown primitive `{prim}`')
+
+
+@functools.lru_cache(maxsize=4096)
+def resolve_macro(prim: str) -> Optional[Tuple[Callable, str]]:
+    """Find macro handler by name, lookups are cached so that regular expressions are matched once per name.
+
+    :param prim: macro name
+    :returns: handler and the matched part of the name, None if not a macro
+    """
     for regexp, handler in macros:
         groups = regexp.findall(prim)
         if groups:
             assert len(groups) == 1
-            res = handler(groups[0], annots, args)
-            return res if internal else seq(res)
-
-    raise AssertionError(f'unknown primitive `{prim}`')
+            return handler, groups[0]
+    return None
 
 
 def get_field_annots(annots):
@@ -1,6 +1,10 @@
+import copyreg
+import sys
+import threading
 from contextlib import suppress
 from functools import wraps
 from pprint import pformat
+from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
@@ -13,6 +17,8 @@ from typing import TypeVar
 from typing import Union
 from typing import cast
 from typing import overload
+from weakref import WeakKeyDictionary
+from weakref import WeakValueDictionary
 
 from pytezos.michelson.forge import unforge_address
 from pytezos.michelson.forge import unforge_chain_id
@@ -146,6 +152,48 @@ def blind_unpack(data: bytes):
     return data
 
 
+_interned_types: 'WeakValueDictionary[tuple, type]' = WeakValueDictionary()
+_interned_attrs: 'WeakKeyDictionary[type, Tuple[type, Dict[str, Any]]]' = WeakKeyDictionary()
+_interned_types_lock = threading.Lock()
+
+
+def _freeze(value):
+    if isinstance(value, list):
+        return list, tuple(map(_freeze, value))
+    return type(value), value
+
+
+def intern_type(cls: type, attrs: Dict[str, Any]) -> type:
+    """Create a subclass of `cls` with the given class attributes.
+
+    Structurally identical classes are created once and shared while referenced, so that type equality checks
+    can be done by identity. Classes must not be mutated after creation.
+
+    :param cls: base class
+    :param attrs: class attributes (args, annotations, literal, etc)
+    """
+    try:
+        key = (cls, tuple((name, _freeze(value)) for name, value in attrs.items()))
+        hash(key)
+    except TypeError:
+        return type(cls.__name__, (cls,), attrs)
+    with _interned_types_lock:
+        res = _interned_types.get(key)
+        if res is None:
+            res = _interned_types[key] = type(cls.__name__, (cls,), attrs)
+            _interned_attrs[res] = cls, attrs
+    return res
+
+
+def get_interned_attrs(ty: type) -> Optional[Tuple[type, Dict[str, Any]]]:
+    """Get base class and attributes an interned class was created with.
+
+    :param ty: class returned by `intern_type`
+    :returns: tuple (base class, attributes) or None if the class was not interned
+    """
+    return _interned_attrs.get(ty)
+
+
 class Micheline(metaclass=ErrorTrace):
     prim: Optional[str] = None
     args: List[Type['Micheline']] = []
@@ -212,11 +260,13 @@ class Micheline(metaclass=ErrorTrace):
         annots: Optional[list] = None,
         **kwargs,
     ) -> Type['Micheline']:
-        res = type(cls.__name__, (cls,), dict(args=args, **kwargs))
+        res = intern_type(cls, dict(args=args, **kwargs))
         return cast(Type['MichelsonPrimitive'], res)  # type: ignore
 
     @classmethod
     def assert_type_equal(cls, other: Type['Micheline'], path='', message=''):
+        if cls is other:
+            return
         comment = f' [{message}]' if message else ''
         assert cls.prim == other.prim, f'expected {other.prim}, got {cls.prim} at `{path}`{comment}'
         assert len(cls.args) == len(
@@ -308,6 +358,27 @@ class MichelineLiteral(Micheline):
         return cls.literal
 
 
+def restore_type(expr) -> Type[Micheline]:
+    """Recreate a class pickled by its canonical Micheline expression.
+
+    :param expr: result of `as_micheline_expr`
+    """
+    # NOTE: make sure all primitives are registered when unpickling in a fresh process
+    import pytezos.michelson.program  # noqa: F401
+
+    return Micheline.match(expr)
+
+
+def _reduce_type(ty: ErrorTrace) -> Union[str, Tuple[Callable[..., Type[Micheline]], Tuple[Any, ...]]]:
+    if getattr(sys.modules.get(ty.__module__), ty.__qualname__, None) is ty:
+        return ty.__qualname__
+    return restore_type, (cast(Type[Micheline], ty).as_micheline_expr(),)
+
+
+# NOTE: classes produced by `Micheline.match` are dynamic, pickle them as expressions (interning restores identity)
+copyreg.pickle(ErrorTrace, _reduce_type)
+
+
 def validate_sections(sequence: Type[MichelineSequence], required_sections: Sequence[str]) -> None:
     if len(sequence.args) < len(required_sections):
         raise Exception(f'expected at least {len(required_sections)} sections, got {len(sequence.args)}')
@@ -1,6 +1,7 @@
 # Inspired by https://github.com/jansorg/tezos-intellij/blob/master/grammar/michelson.bnf
 import json
 import re
+import threading
 from typing import List
 from typing import Optional
 
@@ -72,10 +73,8 @@ class MichelsonParser:
 
     tokens = SimpleMichelsonLexer.tokens
 
-    @doc(
-        '''instr : expr 
-                  | empty'''
-    )
+    @doc('''instr : expr 
+                  | empty''')
     def p_instr(self, p):
         p[0] = p[1]
 
@@ -128,10 +127,8 @@ class MichelsonParser:
                 raise MichelsonParserError(p.slice[1], str(e)) from e
         p[0] = Sequence(expr) if isinstance(expr, list) else expr
 
-    @doc(
-        '''annots : annot 
-                   | empty'''
-    )
+    @doc('''annots : annot 
+                   | empty''')
     def p_annots(self, p):
         if p[1] is not None:
             p[0] = [p[1]]
@@ -148,10 +145,8 @@ class MichelsonParser:
     def p_annot(self, p):
         p[0] = p[1]
 
-    @doc(
-        '''args : arg 
-                 | empty'''
-    )
+    @doc('''args : arg 
+                 | empty''')
     def p_args(self, p):
         p[0] = []
         if p[1] is not None:
@@ -203,6 +198,10 @@ class MichelsonParser:
     def __init__(self, debug=False, write_tables=False, extra_primitives: Optional[List[str]] = None):
         """Initialize Michelson parser
 
+        LALR tables are loaded from the bundled `pytezos.michelson.parsetab` module; they are regenerated
+        (and written back if `write_tables` is set) only if the grammar has changed.
+        Parser instances are not thread-safe, use `get_parser` to obtain one bound to the current thread.
+
         :param debug: Verbose output
         :param write_tables: Store PLY output
         :param extra_primitives: List of words to be ignored
@@ -212,6 +211,7 @@ class MichelsonParser:
             module=self,
             debug=debug,
             write_tables=write_tables,
+            tabmodule=PARSER_TABLES_MODULE,
         )
         self.extra_primitives = extra_primitives or []
 
@@ -223,16 +223,264 @@ class MichelsonParser:
         """
         if len(code) > 0 and code[0] == '(' and code[-1] == ')':
             code = code[1:-1]
-        return self.parser.parse(code)
+        # NOTE: PLY falls back to the last lexer built in the process if none is passed
+        return self.parser.parse(code, lexer=self.lexer.lexer)
+
+
+PARSER_TABLES_MODULE = 'pytezos.michelson.parsetab'
+PARSER_ENGINES = ('ply', 'fast')
+
+# NOTE: same token rules as `SimpleMichelsonLexer` in PLY priority order, groups are numbered by token kind
+_TOKEN_RE = re.compile(
+    r'([ \t\r\n\f]+|/\*[^*]*\*/|#[^\n]*)'
+    r'|([:@%]+[_0-9a-zA-Z\.]*)'
+    r'|([A-Za-z][A-Za-z0-9_]+)'
+    r'|("(?:\\.|[^"])*")'
+    r'|(0x[A-Fa-f0-9]*)'
+    r'|(-?[0-9]+)'
+    r'|(\{)|(\})|(\()|(\))|(;)'
+    r'|([\s\S])'
+)
+_EOF, _SKIP, _ANNOT, _PRIM, _STR, _BYTE, _INT = range(7)
+_LEFT_CURLY, _RIGHT_CURLY, _LEFT_PAREN, _RIGHT_PAREN, _SEMI, _ERROR = range(7, 13)
+_TOKEN_NAMES = {
+    _ANNOT: 'ANNOT',
+    _PRIM: 'PRIM',
+    _STR: 'STR',
+    _BYTE: 'BYTE',
+    _INT: 'INT',
+    _LEFT_CURLY: 'LEFT_CURLY',
+    _RIGHT_CURLY: 'RIGHT_CURLY',
+    _LEFT_PAREN: 'LEFT_PAREN',
+    _RIGHT_PAREN: 'RIGHT_PAREN',
+    _SEMI: 'SEMI',
+}
+# NOTE: lookahead sets of the LALR reductions in `MichelsonParser`, checked before the reduction side effects
+# (string decoding, macro expansion) so that errors are reported for the same tokens
+_LITERALS = frozenset((_INT, _BYTE, _STR))
+_INSTR_FOLLOW = frozenset((_SEMI, _RIGHT_CURLY, _EOF))
+_EXPR_FOLLOW = frozenset((_SEMI, _RIGHT_CURLY, _RIGHT_PAREN, _EOF))
+_ARG_FOLLOW = frozenset((_PRIM, _INT, _BYTE, _STR, _LEFT_CURLY, _LEFT_PAREN)) | _EXPR_FOLLOW
+
+
+class _RecursiveDescent:
+    __slots__ = ('code', 'kinds', 'values', 'positions', 'i', 'primitives')
+
+    def __init__(self, code: str, primitives) -> None:
+        kinds: List[int] = []
+        values: List[Optional[str]] = []
+        positions: List[int] = []
+        for match in _TOKEN_RE.finditer(code):
+            kind = match.lastindex
+            assert kind is not None, 'every alternative of the token regex is a group'
+            if kind != _SKIP:
+                kinds.append(kind)
+                values.append(match.group())
+                positions.append(match.start())
+        kinds.append(_EOF)
+        values.append(None)
+        positions.append(len(code))
+        self.code = code
+        self.kinds = kinds
+        self.values = values
+        self.positions = positions
+        self.i = 0
+        self.primitives = primitives
+
+    def error(self, i: int, message: Optional[str] = None) -> MichelsonParserError:
+        token = LexToken()
+        kind = self.kinds[i]
+        token.type = self.values[i] if kind == _ERROR else _TOKEN_NAMES.get(kind, '$end')
+        token.value = self.values[i]
+        token.lineno = 1
+        token.lexpos = self.positions[i]
+        if kind == _EOF and message is None:
+            message = 'unexpected end of input'
+        return MichelsonParserError(token, message)
+
+    def parse(self):
+        res = self.instr_seq()
+        if self.kinds[self.i] != _EOF:
+            raise self.error(self.i)
+        return res
+
+    def instr_seq(self):
+        first = self.instr()
+        if self.kinds[self.i] != _SEMI:
+            return first
+        res = [] if first is None else [first]
+        while self.kinds[self.i] == _SEMI:
+            self.i += 1
+            item = self.instr()
+            if item is not None:
+                res.append(item)
+        return res
+
+    def instr(self):
+        kinds, i = self.kinds, self.i
+        kind = kinds[i]
+        if kind == _PRIM:
+            res = self.expr()
+        elif kind in _LITERALS:
+            self.i = i + 1
+            if kinds[i + 1] not in _INSTR_FOLLOW:
+                raise self.error(i + 1)
+            return self.literal(kind, self.values[i])
+        elif kind == _LEFT_CURLY:
+            self.i = i + 1
+            res = Sequence()
+            items = self.instr_seq()
+            if kinds[self.i] != _RIGHT_CURLY:
+                raise self.error(self.i)
+            self.i += 1
+            if type(items) is list:
+                res.extend(items)
+            elif items is not None:
+                res.append(items)
+        elif kind in _INSTR_FOLLOW:
+            return None
+        else:
+            raise self.error(i)
+        if kinds[self.i] not in _INSTR_FOLLOW:
+            raise self.error(self.i)
+        return res
+
+    def expr(self):
+        kinds, values = self.kinds, self.values
+        prim_index = self.i
+        prim = values[prim_index]
+        i = prim_index + 1
+        annots = []
+        while kinds[i] == _ANNOT:
+            annots.append(values[i])
+            i += 1
+        args = []
+        while True:
+            kind = kinds[i]
+            if kind == _PRIM:
+                args.append({'prim': values[i]})
+            elif kind in _LITERALS:
+                if kinds[i + 1] not in _ARG_FOLLOW:
+                    raise self.error(i + 1)
+                args.append(self.literal(kind, values[i]))
+            elif kind == _LEFT_CURLY:
+                self.i = i + 1
+                items = self.instr_seq()
+                i = self.i
+                if kinds[i] != _RIGHT_CURLY:
+                    raise self.error(i)
+                if type(items) is list:
+                    args.append(items)
+                else:
+                    args.append([] if items is None else [items])
+            elif kind == _LEFT_PAREN:
+                if kinds[i + 1] != _PRIM:
+                    raise self.error(i + 1)
+                self.i = i + 1
+                args.append(self.expr())
+                i = self.i
+                if kinds[i] != _RIGHT_PAREN:
+                    raise self.error(i)
+            else:
+                break
+            i += 1
+        if kinds[i] not in _EXPR_FOLLOW:
+            raise self.error(i)
+        self.i = i
+
+        if prim in prim_tags or prim in self.primitives:
+            res = make_expr(prim=prim, annots=annots, args=args)
+        else:
+            try:
+                res = expand_macro(prim=prim, annots=annots, args=args)
+            except AssertionError as e:
+                raise self.error(prim_index, str(e)) from e
+        return Sequence(res) if isinstance(res, list) else res
+
+    @staticmethod
+    def literal(kind: int, value: str) -> dict:
+        if kind == _INT:
+            return {'int': value}
+        if kind == _BYTE:
+            return {'bytes': value[2:]}  # strip 0x prefix
+        return {'string': json.loads(value)}
+
+
+class FastMichelsonParser:
+    """Single-pass recursive descent Michelson parser.
+
+    Produces the same Micheline and reports errors at the same positions as `MichelsonParser`, but does not depend
+    on PLY and keeps no state between calls, so a single instance can be shared across threads.
+    Nesting depth is limited by the Python recursion limit (roughly a quarter of it).
+    """
+
+    def __init__(self, extra_primitives: Optional[List[str]] = None):
+        """Initialize Michelson parser
+
+        :param extra_primitives: List of words to be ignored
+        """
+        self.extra_primitives = extra_primitives or []
+
+    def parse(self, code):
+        """Parse Michelson source.
+
+        :param code: Michelson source
+        :returns: Micheline expression
+        """
+        if len(code) > 0 and code[0] == '(' and code[-1] == ')':
+            code = code[1:-1]
+        return _RecursiveDescent(code, self.extra_primitives).parse()
+
+
+_engine = 'ply'
+_local = threading.local()
+
+
+def get_parser_engine() -> str:
+    """Get the name of the parser engine used by `michelson_to_micheline` by default."""
+    return _engine
+
+
+def set_parser_engine(name: str = 'ply') -> None:
+    """Choose the parser engine used by `michelson_to_micheline` by default.
+
+    :param name: one of `ply` (`MichelsonParser`), `fast` (`FastMichelsonParser`)
+    """
+    global _engine
+    if name not in PARSER_ENGINES:
+        raise ValueError(f'Unknown parser engine `{name}`, expected one of {PARSER_ENGINES}')
+    _engine = name
+
+
+def get_parser(engine: Optional[str] = None):
+    """Get default Michelson parser shared within the current thread.
+
+    :param engine: one of `ply`, `fast`; the one set with `set_parser_engine` by default
+    """
+    engine = engine or _engine
+    parsers = getattr(_local, 'parsers', None)
+    if parsers is None:
+        parsers = _local.parsers = {}
+    parser = parsers.get(engine)
+    if parser is None:
+        if engine == 'ply':
+            parser = MichelsonParser()
+        elif engine == 'fast':
+            parser = FastMichelsonParser()
+        else:
+            raise ValueError(f'Unknown parser engine `{engine}`, expected one of {PARSER_ENGINES}')
+        parsers[engine] = parser
+    return parser
 
 
-def michelson_to_micheline(data, parser=None):
+def michelson_to_micheline(data, parser=None, engine: Optional[str] = None):
     """Converts Michelson source text into a Micheline expression.
 
     :param data: Michelson string
     :param parser: custom Michelson parser (optional)
+    :param engine: parser engine if no custom parser is given, one of `ply`, `fast` (optional)
     :returns: Micheline expression
     """
     if parser is None:
-        parser = MichelsonParser()
+        parser = get_parser(engine)
     return parser.parse(data)
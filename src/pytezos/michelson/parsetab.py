@@ -0,0 +1,52 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ANNOT BYTE INT LEFT_CURLY LEFT_PAREN PRIM RIGHT_CURLY RIGHT_PAREN SEMI STRinstr : expr \n                  | emptyinstr : INTinstr : BYTEinstr : STRinstr : instr SEMI instrinstr : LEFT_CURLY instr RIGHT_CURLYexpr : PRIM annots argsannots : annot \n                   | emptyannots : annots annotannot : ANNOTargs : arg \n                 | emptyargs : args argarg : PRIMarg : INTarg : BYTEarg : STRarg : LEFT_CURLY instr RIGHT_CURLYarg : LEFT_PAREN expr RIGHT_PARENempty :'
+    
+_lr_action_items = {'INT':([0,7,8,9,11,12,13,14,17,18,19,20,21,22,23,24,25,27,30,31,],[4,4,-22,4,22,-9,-10,-12,-16,22,-11,-13,-14,-17,-18,-19,4,-15,-20,-21,]),'BYTE':([0,7,8,9,11,12,13,14,17,18,19,20,21,22,23,24,25,27,30,31,],[5,5,-22,5,23,-9,-10,-12,-16,23,-11,-13,-14,-17,-18,-19,5,-15,-20,-21,]),'STR':([0,7,8,9,11,12,13,14,17,18,19,20,21,22,23,24,25,27,30,31,],[6,6,-22,6,24,-9,-10,-12,-16,24,-11,-13,-14,-17,-18,-19,6,-15,-20,-21,]),'LEFT_CURLY':([0,7,8,9,11,12,13,14,17,18,19,20,21,22,23,24,25,27,30,31,],[7,7,-22,7,25,-9,-10,-12,-16,25,-11,-13,-14,-17,-18,-19,7,-15,-20,-21,]),'PRIM':([0,7,8,9,11,12,13,14,17,18,19,20,21,22,23,24,25,26,27,30,31,],[8,8,-22,8,17,-9,-10,-12,-16,17,-11,-13,-14,-17,-18,-19,8,8,-15,-20,-21,]),'SEMI':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,28,30,31,],[-22,9,-1,-2,-3,-4,-5,-22,-22,-22,9,-22,-9,-10,-12,9,-7,-16,-8,-11,-13,-14,-17,-18,-19,-22,-15,9,-20,-21,]),'$end':([0,1,2,3,4,5,6,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,27,30,31,],[-22,0,-1,-2,-3,-4,-5,-22,-22,-22,-9,-10,-12,-6,-7,-16,-8,-11,-13,-14,-17,-18,-19,-15,-20,-21,]),'RIGHT_CURLY':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,28,30,31,],[-1,-2,-3,-4,-5,-22,-22,-22,16,-22,-9,-10,-12,-6,-7,-16,-8,-11,-13,-14,-17,-18,-19,-22,-15,30,-20,-21,]),'ANNOT':([8,11,12,13,14,19,],[14,14,-9,-10,-12,-11,]),'LEFT_PAREN':([8,11,12,13,14,17,18,19,20,21,22,23,24,27,30,31,],[-22,26,-9,-10,-12,-16,26,-11,-13,-14,-17,-18,-19,-15,-20,-21,]),'RIGHT_PAREN':([8,11,12,13,14,17,18,19,20,21,22,23,24,27,29,30,31,],[-22,-22,-9,-10,-12,-16,-8,-11,-13,-14,-17,-18,-19,-15,31,-20,-21,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'instr':([0,7,9,25,],[1,10,15,28,]),'expr':([0,7,9,25,26,],[2,2,2,2,29,]),'empty':([0,7,8,9,11,25,],[3,3,13,3,21,3,]),'annots':([8,],[11,]),'annot':([8,11,],[12,19,]),'args':([11,],[18,]),'arg':([11,18,],[20,27,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> instr","S'",1,None,None,None),
+  ('instr -> expr','instr',1,'p_instr','parse.py',77),
+  ('instr -> empty','instr',1,'p_instr','parse.py',78),
+  ('instr -> INT','instr',1,'p_instr_int','parse.py',84),
+  ('instr -> BYTE','instr',1,'p_instr_byte','parse.py',88),
+  ('instr -> STR','instr',1,'p_instr_str','parse.py',92),
+  ('instr -> instr SEMI instr','instr',3,'p_instr_list','parse.py',96),
+  ('instr -> LEFT_CURLY instr RIGHT_CURLY','instr',3,'p_instr_subseq','parse.py',105),
+  ('expr -> PRIM annots args','expr',3,'p_expr','parse.py',113),
+  ('annots -> annot','annots',1,'p_annots','parse.py',133),
+  ('annots -> empty','annots',1,'p_annots','parse.py',134),
+  ('annots -> annots annot','annots',2,'p_annots_list','parse.py',141),
+  ('annot -> ANNOT','annot',1,'p_annot','parse.py',149),
+  ('args -> arg','args',1,'p_args','parse.py',153),
+  ('args -> empty','args',1,'p_args','parse.py',154),
+  ('args -> args arg','args',2,'p_args_list','parse.py',162),
+  ('arg -> PRIM','arg',1,'p_arg_prim','parse.py',170),
+  ('arg -> INT','arg',1,'p_arg_int','parse.py',174),
+  ('arg -> BYTE','arg',1,'p_arg_byte','parse.py',178),
+  ('arg -> STR','arg',1,'p_arg_str','parse.py',182),
+  ('arg -> LEFT_CURLY instr RIGHT_CURLY','arg',3,'p_arg_subseq','parse.py',186),
+  ('arg -> LEFT_PAREN expr RIGHT_PAREN','arg',3,'p_arg_group','parse.py',195),
+  ('empty -> <empty>','empty',0,'p_empty','parse.py',199),
+]
@@ -1,3 +1,5 @@
+import copyreg
+import sys
 from typing import Any
 from typing import Dict
 from typing import List
@@ -8,6 +10,7 @@ from typing import cast
 
 from pytezos.context.impl import ExecutionContext
 from pytezos.crypto.encoding import base58_encode
+from pytezos.michelson.cache import get_program_cache
 from pytezos.michelson.instructions.base import MichelsonInstruction
 from pytezos.michelson.instructions.base import format_stdout
 from pytezos.michelson.instructions.tzt import BigMapInstruction
@@ -38,7 +41,30 @@ from pytezos.michelson.types import OperationType
 from pytezos.michelson.types import PairType
 
 
-class MichelsonProgram:
+class ProgramMeta(type):
+    """Metaclass of compiled programs, makes them picklable by their sections."""
+
+
+def restore_program(base: type, sections: Dict[str, Any]) -> type:
+    """Recreate a pickled program class.
+
+    :param base: `MichelsonProgram` or `TztMichelsonProgram`
+    :param sections: section classes (pickled by their Micheline expressions)
+    """
+    return type(base.__name__, (base,), sections)
+
+
+def _reduce_program(cls: type):
+    if getattr(sys.modules.get(cls.__module__), cls.__qualname__, None) is cls:
+        return cls.__qualname__
+    sections = {k: v for k, v in vars(cls).items() if not k.startswith('__')}
+    return restore_program, (cls.__bases__[0], sections)
+
+
+copyreg.pickle(ProgramMeta, _reduce_program)
+
+
+class MichelsonProgram(metaclass=ProgramMeta):
     """Michelson .tz contract interpreter interface"""
 
     parameter: Type[ParameterSection]
@@ -54,17 +80,26 @@ class MichelsonProgram:
     @staticmethod
     def load(context: ExecutionContext, with_code=False) -> Type['MichelsonProgram']:
         """Create MichelsonProgram type from filled context"""
-        cls = type(
-            MichelsonProgram.__name__,
-            (MichelsonProgram,),
-            {
-                'parameter': ParameterSection.match(context.get_parameter_expr()),
-                'storage': StorageSection.match(context.get_storage_expr()),
-                'code': CodeSection.match(context.get_code_expr() if with_code else []),
-                'views': [ViewSection.match(expr) for expr in context.get_views_expr()] if with_code else [],
-            },
+        parameter_expr = context.get_parameter_expr()
+        storage_expr = context.get_storage_expr()
+        code_expr = context.get_code_expr() if with_code else []
+        views_expr = context.get_views_expr() if with_code else []
+
+        def create() -> Type['MichelsonProgram']:
+            return MichelsonProgram.create_type(
+                ParameterSection.match(parameter_expr),
+                StorageSection.match(storage_expr),
+                CodeSection.match(code_expr),
+                views=[ViewSection.match(expr) for expr in views_expr],
+            )
+
+        cache = get_program_cache()
+        if cache is None:
+            return create()
+        return cast(
+            Type['MichelsonProgram'],
+            cache.get_or_create([parameter_expr, storage_expr, code_expr, *views_expr], create),
         )
-        return cast(Type['MichelsonProgram'], cls)
 
     @staticmethod
     def create(sequence: Type[MichelineSequence]) -> Type['MichelsonProgram']:
@@ -77,24 +112,46 @@ class MichelsonProgram:
                 'code',
             ),
         )
-        cls = type(
-            MichelsonProgram.__name__,
-            (MichelsonProgram,),
+        return MichelsonProgram.create_type(
+            get_script_section(sequence, cls=ParameterSection, required=True),  # type: ignore
+            get_script_section(sequence, cls=StorageSection, required=True),  # type: ignore
+            get_script_section(sequence, cls=CodeSection, required=True),  # type: ignore
+            views=get_script_sections(sequence, cls=ViewSection),  # type: ignore
+        )
+
+    @classmethod
+    def create_type(
+        cls,
+        parameter: Type[ParameterSection],
+        storage: Type[StorageSection],
+        code: Type[CodeSection],
+        views: List[Type[ViewSection]],
+    ) -> Type['MichelsonProgram']:
+        """Create MichelsonProgram type from typed sections"""
+        res = type(
+            cls.__name__,
+            (cls,),
             {
-                'parameter': get_script_section(sequence, cls=ParameterSection, required=True),  # type: ignore
-                'storage': get_script_section(sequence, cls=StorageSection, required=True),  # type: ignore
-                'code': get_script_section(sequence, cls=CodeSection, required=True),  # type: ignore
-                'views': get_script_sections(sequence, cls=ViewSection),  # type: ignore
+                'parameter': parameter,
+                'storage': storage,
+                'code': code,
+                'views': views,
             },
         )
-        return cast(Type['MichelsonProgram'], cls)
+        return cast(Type['MichelsonProgram'], res)
 
     @staticmethod
     def match(expr) -> Type['MichelsonProgram']:
-        seq = cast(Type[MichelineSequence], MichelineSequence.match(expr))
-        if not issubclass(seq, MichelineSequence):
-            raise Exception(f'Expected sequence, got {seq.prim}')
-        return MichelsonProgram.create(seq)
+        def create() -> Type['MichelsonProgram']:
+            seq = cast(Type[MichelineSequence], MichelineSequence.match(expr))
+            if not issubclass(seq, MichelineSequence):
+                raise Exception(f'Expected sequence, got {seq.prim}')
+            return MichelsonProgram.create(seq)
+
+        cache = get_program_cache()
+        if cache is None:
+            return create()
+        return cast(Type['MichelsonProgram'], cache.get_or_create(expr, create))
 
     @classmethod
     def as_micheline_expr(cls) -> List[Dict[str, Any]]:
@@ -180,7 +237,7 @@ class MichelsonProgram:
         return view.args[2].from_micheline_value(res.to_micheline_value(mode=output_mode))
 
 
-class TztMichelsonProgram:
+class TztMichelsonProgram(metaclass=ProgramMeta):
     """Michelson .tzt contract interpreter interface"""
 
     code: Type[CodeSection]
@@ -58,7 +58,7 @@ class Interpreter:
         context_backup = deepcopy(self.context)
 
         try:
-            code_section = CodeSection.match(michelson_to_micheline(code))
+            code_section = CodeSection.match(michelson_to_micheline(code, parser=self.parser))
             instructions = code_section.args[0].execute(self.stack, result.stdout, self.context)
             result.instructions = MichelineSequence([instructions])
             result.stack = self.stack
@@ -9,6 +9,7 @@ from typing import cast
 from pytezos.context.abstract import AbstractContext
 from pytezos.michelson.micheline import Micheline
 from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.micheline import intern_type
 from pytezos.michelson.types import OrType
 from pytezos.michelson.types.adt import wrap_or
 from pytezos.michelson.types.adt import wrap_parameters
@@ -56,7 +57,7 @@ class ParameterSection(Micheline, prim='parameter', args_len=1):
                 root_name = 'root' if 'default' in flat_args else 'default'
         else:
             root_name = root_type.field_name or 'default'
-        res = type(cls.__name__, (cls,), dict(args=args, root_name=root_name, **kwargs))
+        res = intern_type(cls, dict(args=args, root_name=root_name, **kwargs))
         return cast(Type['ParameterSection'], res)
 
     @classmethod
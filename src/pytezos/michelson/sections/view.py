@@ -9,6 +9,7 @@ from pytezos.context.abstract import AbstractContext
 from pytezos.michelson.micheline import Micheline
 from pytezos.michelson.micheline import MichelineLiteral
 from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.micheline import intern_type
 from pytezos.michelson.types.base import MichelsonType
 
 
@@ -66,7 +67,7 @@ class ViewSection(Micheline, prim='view', args_len=4):
         # NOTE: Check for opcodes forbidden in views
         cls.check_code(args[3], lambda_=False)
 
-        res = type(cls.__name__, (cls,), dict(args=args, name=name, **kwargs))
+        res = intern_type(cls, dict(args=args, name=name, **kwargs))
         return cast(Type['ViewSection'], res)
 
     @classmethod
@@ -1,3 +1,4 @@
+import copyreg
 from collections.abc import Iterable
 from copy import copy
 from copy import deepcopy
@@ -12,8 +13,10 @@ from typing import cast
 
 from pytezos.context.abstract import AbstractContext
 from pytezos.michelson.forge import forge_micheline
+from pytezos.michelson.forge import forge_script_exprs
 from pytezos.michelson.forge import unforge_micheline
 from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.micheline import intern_type
 
 type_mappings = {
     'nat': 'int  /* Natural number */',
@@ -76,6 +79,22 @@ class MichelsonType(Micheline):
     def __getitem__(self, key):
         raise AssertionError(f'forbidden')
 
+    # NOTE: values are pickled as (type expression, value expression) pair, see `restore_value`
+    def __reduce__(self):
+        return restore_value, (type(self), self.to_micheline_value())
+
+    # NOTE: keep copying attribute-wise, `copy` module would otherwise go through `__reduce__`
+    def __copy__(self):
+        res = self.__class__.__new__(self.__class__)
+        res.__dict__.update(self.__dict__)
+        return res
+
+    def __deepcopy__(self, memo):
+        res = self.__class__.__new__(self.__class__)
+        memo[id(self)] = res
+        res.__dict__.update(deepcopy(self.__dict__, memo))
+        return res
+
     @staticmethod
     def match(expr) -> Type['MichelsonType']:
         return cast(Type['MichelsonType'], Micheline.match(expr))
@@ -95,9 +114,8 @@ class MichelsonType(Micheline):
             assert type_args[0].is_comparable(), f'{cls.prim} key type has to be comparable (not {type_args[0].prim})'
         if cls.prim == 'big_map':
             assert type_args[0].is_big_map_friendly(), f'impossible big_map value type'
-        res = type(
-            cls.__name__,
-            (cls,),
+        res = intern_type(
+            cls,
             dict(
                 field_name=parse_name(annots, '%'),  # type: ignore
                 type_name=parse_name(annots, ':'),  # type: ignore
@@ -270,11 +288,86 @@ class MichelsonType(Micheline):
         data = self.forge(mode='legacy_optimized' if legacy else 'optimized')
         return b'\x05' + data
 
+    @classmethod
+    def get_forger(cls, mode='optimized') -> Callable[['MichelsonType', bytearray], None]:
+        """Get a function appending forged values of this type to a buffer, used for batch packing.
+
+        Types with a fixed binary layout override this to precompute tags and length prefixes once per batch,
+        by default values are converted to Micheline and forged one by one.
+
+        :param mode: `optimized` or `legacy_optimized`
+        """
+
+        def forge(item: 'MichelsonType', buf: bytearray) -> None:
+            buf += forge_micheline(item.to_micheline_value(mode=mode))
+
+        return forge
+
+    @classmethod
+    def forge_many(cls, items: Iterable['MichelsonType'], legacy=False) -> Tuple[bytearray, List[int]]:
+        """Pack multiple values of this type into a single buffer.
+
+        :param items: values of this type
+        :param legacy: use legacy optimized form (used for big_map key hashes)
+        :returns: tuple (buffer, offsets), i-th packed value is `buffer[offsets[i]:offsets[i + 1]]`
+        """
+        assert cls.is_packable(), f'{cls.prim} cannot be packed'
+        forge = cls.get_forger(mode='legacy_optimized' if legacy else 'optimized')
+        buf, offsets = bytearray(), [0]
+        for item in items:
+            buf.append(0x05)
+            forge(item, buf)
+            offsets.append(len(buf))
+        return buf, offsets
+
+    @classmethod
+    def pack_many(cls, items: Iterable['MichelsonType'], legacy=False) -> List[bytes]:
+        """Pack multiple values of this type at once.
+
+        :param items: values of this type
+        :param legacy: use legacy optimized form (used for big_map key hashes)
+        """
+        buf, offsets = cls.forge_many(items, legacy=legacy)
+        view = memoryview(buf)
+        return [bytes(view[start:end]) for start, end in zip(offsets, offsets[1:])]
+
+    @classmethod
+    def get_script_exprs(cls, items: Iterable['MichelsonType']) -> List[str]:
+        """Get big_map key hashes (`expr...`) of multiple values of this type at once.
+
+        :param items: values of this type
+        """
+        buf, offsets = cls.forge_many(items, legacy=True)
+        view = memoryview(buf)
+        return forge_script_exprs(view[start:end] for start, end in zip(offsets, offsets[1:]))
+
     def duplicate(self):
         assert self.is_duplicable(), f'{self.prim} is not duplicable'
         return deepcopy(self)
 
 
+def restore_value(ty: Type[MichelsonType], val_expr) -> MichelsonType:
+    """Recreate a pickled Michelson value.
+
+    :param ty: value type (pickled by its Micheline expression)
+    :param val_expr: value in readable Micheline form
+    """
+    return ty.from_micheline_value(val_expr)
+
+
+def reduce_state(value: MichelsonType):
+    """Pickle value attribute-wise, for values not representable as Micheline (pending diffs, operations).
+
+    Execution context is not transferred, it has to be attached again after unpickling.
+
+    :param value: Michelson value
+    """
+    state = dict(value.__dict__)
+    if 'context' in state:
+        state['context'] = None
+    return copyreg.__newobj__, (type(value),), state  # type: ignore
+
+
 def generate_pydoc(ty: Type[MichelsonType], title=None):
     definitions = []  # type: ignore
     top_def = ty.generate_pydoc(definitions, inferred_name=title)
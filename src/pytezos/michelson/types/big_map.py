@@ -1,7 +1,9 @@
 from copy import copy
 from copy import deepcopy
+from typing import Any
 from typing import Callable
 from typing import Generator
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -16,6 +18,7 @@ from pytezos.michelson.micheline import MichelineSequence
 from pytezos.michelson.micheline import parse_micheline_literal
 from pytezos.michelson.types.base import MichelsonType
 from pytezos.michelson.types.base import Undefined
+from pytezos.michelson.types.base import reduce_state
 from pytezos.michelson.types.map import EltLiteral
 from pytezos.michelson.types.map import MapType
 
@@ -50,6 +53,10 @@ class BigMapType(MapType, prim='big_map', args_len=2):
     def __deepcopy__(self, memodict):
         return self.duplicate()
 
+    def __reduce__(self):
+        # NOTE: pending changes are not representable as Micheline value
+        return reduce_state(self)
+
     def __getitem__(self, key_obj) -> Optional[MichelsonType]:  # type: ignore
         key = self.args[0].from_python_object(key_obj)
         return self.get(key, dup=False)
@@ -155,18 +162,20 @@ class BigMapType(MapType, prim='big_map', args_len=2):
         else:
             src_ptr, dst_ptr, action = self.ptr, self.ptr, 'update'
 
-        def make_update(key: MichelsonType, val: Optional[MichelsonType]) -> dict:
+        def make_update(key: MichelsonType, key_hash: str, val: Optional[MichelsonType]) -> dict:
             update = {
                 'key': key.to_micheline_value(mode=mode),
-                'key_hash': forge_script_expr(key.pack(legacy=True)),
+                'key_hash': key_hash,
             }
             if val is not None:
                 update['value'] = val.to_micheline_value(mode=mode)
             return update
 
+        entries = list(self)
+        key_hashes = self.args[0].get_script_exprs(key for key, _ in entries)
         diff = {
             'action': action,
-            'updates': [make_update(key, val) for key, val in self],
+            'updates': [make_update(key, key_hash, val) for (key, val), key_hash in zip(entries, key_hashes)],
         }
         if action == 'alloc':
             key_type, val_type = [arg.as_micheline_expr() for arg in self.args]
@@ -239,6 +248,14 @@ class BigMapType(MapType, prim='big_map', args_len=2):
         key = self.args[0].from_python_object(key_obj)
         return forge_script_expr(key.pack(legacy=True))
 
+    def get_key_hashes(self, key_objs: Iterable[Any]) -> List[str]:
+        """Get key hashes (`expr...`) of multiple keys at once.
+
+        :param key_objs: keys (Python objects)
+        """
+        key_type = self.args[0]
+        return key_type.get_script_exprs(key_type.from_python_object(key_obj) for key_obj in key_objs)
+
     def duplicate(self):
         res = type(self)(
             items=deepcopy(self.items),
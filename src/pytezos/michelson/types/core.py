@@ -1,6 +1,7 @@
 from typing import Type
 
 from pytezos.context.abstract import AbstractContext
+from pytezos.michelson.forge import forge_int
 from pytezos.michelson.micheline import Micheline
 from pytezos.michelson.micheline import MichelineLiteral
 from pytezos.michelson.micheline import blind_unpack
@@ -85,6 +86,19 @@ class StringType(MichelsonType, prim='string'):
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return {'string': self.value}
 
+    @classmethod
+    def get_forger(cls, mode='optimized'):
+        if cls.to_micheline_value is not StringType.to_micheline_value:
+            return super().get_forger(mode)
+
+        def forge(item, buf):
+            data = item.value.encode()
+            buf.append(0x01)
+            buf += len(data).to_bytes(4, 'big')
+            buf += data
+
+        return forge
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
@@ -141,6 +155,17 @@ class IntType(MichelsonType, prim='int'):
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return {'int': str(self.value)}
 
+    @classmethod
+    def get_forger(cls, mode='optimized'):
+        if cls.to_micheline_value is not IntType.to_micheline_value:
+            return super().get_forger(mode)
+
+        def forge(item, buf):
+            buf.append(0x00)
+            buf += forge_int(item.value)
+
+        return forge
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
@@ -218,6 +243,18 @@ class BytesType(MichelsonType, prim='bytes'):
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return {'bytes': self.value.hex()}
 
+    @classmethod
+    def get_forger(cls, mode='optimized'):
+        if cls.to_micheline_value is not BytesType.to_micheline_value:
+            return super().get_forger(mode)
+
+        def forge(item, buf):
+            buf.append(0x0A)
+            buf += len(item.value).to_bytes(4, 'big')
+            buf += item.value
+
+        return forge
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         if try_unpack:
             return blind_unpack(self.value)
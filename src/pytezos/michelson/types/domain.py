@@ -136,6 +136,19 @@ class AddressType(StringType, prim='address'):
         else:
             raise AssertionError(f'unsupported mode {mode}')
 
+    @classmethod
+    def get_forger(cls, mode='optimized'):
+        if cls.to_micheline_value is not AddressType.to_micheline_value or mode == 'readable':
+            return super().get_forger(mode)
+
+        def forge(item, buf):
+            data = forge_contract(item.value)
+            buf.append(0x0A)
+            buf += len(data).to_bytes(4, 'big')
+            buf += data
+
+        return forge
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
@@ -285,6 +298,19 @@ class KeyHashType(StringType, prim='key_hash'):
         else:
             raise AssertionError(f'unsupported mode {mode}')
 
+    @classmethod
+    def get_forger(cls, mode='optimized'):
+        if cls.to_micheline_value is not KeyHashType.to_micheline_value or mode == 'readable':
+            return super().get_forger(mode)
+
+        def forge(item, buf):
+            data = forge_address(item.value, tz_only=True)
+            buf.append(0x0A)
+            buf += len(data).to_bytes(4, 'big')
+            buf += data
+
+        return forge
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
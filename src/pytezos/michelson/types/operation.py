@@ -4,6 +4,7 @@ from typing import Type
 
 from pytezos.michelson.micheline import MichelineSequence
 from pytezos.michelson.types.base import MichelsonType
+from pytezos.michelson.types.base import reduce_state
 
 
 class OperationType(MichelsonType, prim='operation'):
@@ -15,6 +16,9 @@ class OperationType(MichelsonType, prim='operation'):
     def __repr__(self):
         return self.content['kind']
 
+    def __reduce__(self):
+        return reduce_state(self)
+
     def __eq__(self, other):
         if not isinstance(other, OperationType):
             return False
@@ -7,7 +7,9 @@ from typing import Union
 from typing import cast
 
 from pytezos.context.abstract import AbstractContext
+from pytezos.michelson.forge import get_tag
 from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.tags import prim_tags
 from pytezos.michelson.types.adt import ADTMixin
 from pytezos.michelson.types.adt import Nested
 from pytezos.michelson.types.adt import wrap_pair
@@ -204,6 +206,23 @@ class PairType(MichelsonType, ADTMixin, prim='pair', args_len=None):
         else:
             raise AssertionError(f'unsupported mode {mode}')
 
+    @classmethod
+    def get_forger(cls, mode='optimized'):
+        # NOTE: optimized form flattens right combs, those are left to the generic path
+        if len(cls.args) != 2 or (mode == 'optimized' and cls.args[1].prim == 'pair'):
+            return super().get_forger(mode)
+
+        prefix = get_tag(2, 0) + prim_tags['Pair']
+        forge_left, forge_right = (cast(Type[MichelsonType], arg).get_forger(mode) for arg in cls.args)
+
+        def forge(item, buf):
+            left, right = item.items
+            buf += prefix
+            forge_left(left, buf)
+            forge_right(right, buf)
+
+        return forge
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False) -> Union[dict, tuple]:
         flat_values = self.get_flat_values(force_tuple=comparable)
         if isinstance(flat_values, dict):
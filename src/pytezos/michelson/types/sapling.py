@@ -9,6 +9,7 @@ from pytezos.michelson.micheline import MichelineLiteral
 from pytezos.michelson.micheline import MichelineSequence
 from pytezos.michelson.micheline import parse_micheline_literal
 from pytezos.michelson.types.base import MichelsonType
+from pytezos.michelson.types.base import reduce_state
 
 
 class SaplingTransactionType(MichelsonType, prim='sapling_transaction', args_len=1):
@@ -25,6 +26,9 @@ class SaplingStateType(MichelsonType, prim='sapling_state', args_len=1):
         self.ptr = ptr
         self.context: Optional[AbstractContext] = None
 
+    def __reduce__(self):
+        return reduce_state(self)
+
     def __repr__(self):
         if self.ptr:
             return f'<{self.ptr}>'
@@ -1,6 +1,22 @@
+from pytezos.rpc.cache import MemoryCache
+from pytezos.rpc.cache import SqliteCache
+from pytezos.rpc.cassette import Cassette
 from pytezos.rpc.helpers import *
+from pytezos.rpc.limits import RateLimiter
+from pytezos.rpc.limits import RetryBudget
+from pytezos.rpc.metrics import RpcHook
+from pytezos.rpc.metrics import RpcMetrics
 from pytezos.rpc.node import RpcMultiNode
 from pytezos.rpc.node import RpcNode
 from pytezos.rpc.protocol import *
 from pytezos.rpc.search import *
 from pytezos.rpc.shell import *
+
+
+def __getattr__(name):
+    # NOTE: async transport depends on aiohttp, import it on first use
+    if name in ('AsyncRpcNode', 'AsyncShellQuery'):
+        from pytezos.rpc import aio
+
+        return getattr(aio, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,357 @@
+import asyncio
+import logging
+import time
+from types import ModuleType
+from typing import Any
+from typing import Awaitable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+import requests
+
+from pytezos.logging import logger
+from pytezos.rpc.cache import DEFAULT_FINALITY_DEPTH
+from pytezos.rpc.cache import ResponseCache
+from pytezos.rpc.cache import get_cache_key
+from pytezos.rpc.cache import get_request_key
+from pytezos.rpc.codec import decode_response
+from pytezos.rpc.codec import loads
+from pytezos.rpc.limits import RateLimiter
+from pytezos.rpc.limits import RetryBudget
+from pytezos.rpc.metrics import RpcHook
+from pytezos.rpc.node import DEFAULT_BACKOFF_FACTOR
+from pytezos.rpc.node import DEFAULT_POOL_MAXSIZE
+from pytezos.rpc.node import DEFAULT_RETRIES
+from pytezos.rpc.node import DEFAULT_TIMEOUT
+from pytezos.rpc.node import IDEMPOTENT_METHODS
+from pytezos.rpc.node import RETRY_STATUSES
+from pytezos.rpc.node import THROTTLE_STATUSES
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.node import _check_response
+from pytezos.rpc.node import _get_retry_after
+from pytezos.rpc.node import _urljoin
+from pytezos.rpc.protocol import BlockQuery
+from pytezos.rpc.shell import ShellQuery
+
+aiohttp: Optional[ModuleType]
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def _get_aiohttp() -> ModuleType:
+    if aiohttp is None:
+        raise ImportError('Please, install `aiohttp` Python library to use async RPC transport')
+    return aiohttp
+
+
+def _encode_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    # NOTE: encode query the same way `requests` does: skip None values, stringify the rest
+    if not params:
+        return None
+    res: Dict[str, Any] = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            res[key] = [str(x) for x in value]
+        else:
+            res[key] = str(value)
+    return res
+
+
+class AsyncRpcNode(RpcNode):
+    """Asyncio request proxy for a single Tezos node, requires `aiohttp`.
+
+    Can be used in place of :class:`RpcNode`: all query endpoints return coroutines instead of results.
+
+    :param uri: node address
+    :param headers: extra HTTP headers sent with every request
+    :param pool_maxsize: maximum number of simultaneous connections per host
+    :param keep_alive: reuse connections between requests
+    :param retries: number of retries on connection errors (idempotent methods only)
+    :param backoff_factor: backoff factor between retries
+    :param session: use existing `aiohttp.ClientSession` instead of creating a new one
+    :param cache: cache for responses which never change (addressed by block hash or finalized level)
+    :param finality_depth: number of blocks after which a block is considered final
+    :param coalesce: share a single HTTP call between concurrent identical GET requests
+    :param rate_limiter: request rate and adaptive concurrency limiter, waits without blocking the event loop
+    :param retry_budget: budget for retrying idempotent requests rejected with 429/502/503/504, \
+        such retries are disabled by default
+    :param hooks: request hooks (e.g. :class:`RpcMetrics`), called for every HTTP request
+    """
+
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        headers: Optional[Dict[str, str]] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        session=None,
+        cache: Optional[ResponseCache] = None,
+        finality_depth: int = DEFAULT_FINALITY_DEPTH,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hooks: Optional[List[RpcHook]] = None,
+    ) -> None:
+        super().__init__(
+            uri=uri,
+            headers=headers,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            cache=cache,
+            finality_depth=finality_depth,
+            coalesce=coalesce,
+            rate_limiter=rate_limiter,
+            retry_budget=retry_budget,
+            hooks=hooks,
+        )
+        self._aio_session = session
+        self._aio_flights: Dict[str, asyncio.Future] = {}
+
+    @property
+    def session(self):  # type: ignore
+        """Pooled `aiohttp.ClientSession`, created on first use within the running event loop."""
+        if self._aio_session is None or self._aio_session.closed:
+            aio = _get_aiohttp()
+            connector = aio.TCPConnector(
+                limit=0,
+                limit_per_host=self.pool_maxsize,
+                force_close=not self.keep_alive,
+            )
+            self._aio_session = aio.ClientSession(connector=connector)
+        return self._aio_session
+
+    async def close(self) -> None:  # type: ignore
+        """Close all pooled connections."""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+
+    async def request(self, method: str, path: str, **kwargs) -> requests.Response:  # type: ignore
+        """Perform HTTP request to node.
+
+        :param method: one of GET/POST/PUT/DELETE
+        :param path: path to endpoint
+        :param kwargs: aiohttp request arguments (`params`, `json`, `timeout`)
+        :raises RpcError: node has returned an error
+        :returns: node response (body is fully read)
+        """
+        if not self.hooks:
+            return await self._request(method, path, **kwargs)
+
+        info = self._before_request(method, path, kwargs)
+        try:
+            res = await self._request(method, path, **kwargs)
+        except BaseException as e:
+            self._after_request(info, error=e)
+            raise
+        self._after_request(info, response=res)
+        return res
+
+    async def _request(self, method: str, path: str, **kwargs) -> requests.Response:  # type: ignore
+        aio = _get_aiohttp()
+        logger.debug('>>>>> %s %s (async)', method, path)
+        timeout = aio.ClientTimeout(total=kwargs.pop('timeout', None) or DEFAULT_TIMEOUT)
+        params = _encode_params(kwargs.pop('params', None))
+        attempts = 1 + (self.retries if method in IDEMPOTENT_METHODS else 0)  # type: ignore
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+
+        status_attempt = 0
+        for attempt in range(attempts):
+            try:
+                res = await self._send(method, path, params=params, timeout=timeout, **kwargs)
+                if res.status_code in RETRY_STATUSES and self._can_retry(method, status_attempt):
+                    delay = _get_retry_after(res)
+                    await asyncio.sleep(self.backoff_factor * 2**status_attempt if delay is None else delay)
+                    status_attempt += 1
+                    continue
+                break
+            except aio.ClientConnectionError:
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(self.backoff_factor * 2**attempt)
+
+        _check_response(res, path)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('<<<<< %s\n%s', res.status_code, res.text)
+        return res
+
+    async def _send(self, method: str, path: str, **kwargs) -> requests.Response:  # type: ignore
+        limiter = self.rate_limiter
+        if limiter is not None:
+            await limiter.acquire_async()
+        # NOTE: connection errors and timeouts are congestion signals as well
+        started_at, throttled = time.monotonic(), True
+        try:
+            async with self.session.request(
+                method=method,
+                url=_urljoin(self.uri[0], path),
+                headers={'content-type': 'application/json', 'user-agent': 'PyTezos', **self.headers},
+                **kwargs,
+            ) as aio_res:
+                res = requests.Response()
+                res.status_code = aio_res.status
+                res.headers.update(aio_res.headers)
+                res.url = str(aio_res.url)
+                res._content = await aio_res.read()
+            throttled = res.status_code in THROTTLE_STATUSES
+            return res
+        finally:
+            if limiter is not None:
+                limiter.release(time.monotonic() - started_at, throttled=throttled)
+
+    async def stream(self, path: str, params: Optional[Dict[str, Any]] = None):  # type: ignore
+        """Open a streaming GET request, yield raw chunks as they arrive.
+
+        :param path: path to endpoint
+        :param params: query parameters
+        """
+        aio = _get_aiohttp()
+        async with self.session.request(
+            method='GET',
+            url=_urljoin(self.uri[0], path),
+            headers={'content-type': 'application/json', 'user-agent': 'PyTezos', **self.headers},
+            params=_encode_params(params),
+            timeout=aio.ClientTimeout(total=None, sock_connect=DEFAULT_TIMEOUT),
+        ) as aio_res:
+            if aio_res.status != 200:
+                res = requests.Response()
+                res.status_code = aio_res.status
+                res.headers.update(aio_res.headers)
+                res._content = await aio_res.read()
+                _check_response(res, path)
+            async for chunk in aio_res.content.iter_any():
+                yield chunk
+
+    async def _get_cache_key(self, path: str, params: Optional[Dict[str, Any]]) -> Optional[str]:  # type: ignore
+        if self.cache is None:
+            return None
+        res = get_cache_key(path, params)
+        if res is None:
+            return None
+        key, level = res
+        if level is not None:
+            if self._finalized_level_expired(level):
+                header = await self.request('GET', f'chains/main/blocks/head~{self.finality_depth}/header/shell')
+                self._update_finalized_level(decode_response(header))
+            if level > self._finalized_level:
+                return None
+        return key
+
+    async def get(  # type: ignore
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        raw: bool = False,
+    ):
+        cache_key = await self._get_cache_key(path, params)
+        if cache_key is not None:
+            content = self.cache.get(cache_key)  # type: ignore
+            if content is not None:
+                return content if raw else loads(content)
+
+        if self.coalesce:
+            res = await self._coalesced_get(path, params, timeout)
+        else:
+            res = await self.request('GET', path, params=params, timeout=timeout)
+        if cache_key is not None:
+            self.cache.set(cache_key, res.content)  # type: ignore
+        return res.content if raw else decode_response(res)
+
+    async def _coalesced_get(  # type: ignore
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[int],
+    ) -> requests.Response:
+        key = get_request_key(path, params)
+        task = self._aio_flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.request('GET', path, params=params, timeout=timeout))
+            self._aio_flights[key] = task
+            task.add_done_callback(lambda _: self._aio_flights.pop(key, None))
+        else:
+            logger.debug('===== GET %s (coalesced)', path)
+        # NOTE: cancellation of one of the callers must not affect the others
+        return await asyncio.shield(task)
+
+    async def post(  # type: ignore
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json=None,
+        timeout: Optional[int] = None,
+    ):
+        res = await self.request('POST', path, params=params, json=json, timeout=timeout)
+        try:
+            return decode_response(res)
+        except ValueError:
+            return res.text
+
+    async def delete(  # type: ignore
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ):
+        res = await self.request('DELETE', path, params=params, timeout=timeout)
+        return decode_response(res)
+
+    async def put(  # type: ignore
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ):
+        res = await self.request('PUT', path, params=params, timeout=timeout)
+        return decode_response(res)
+
+
+class AsyncShellQuery(ShellQuery, path=[]):  # type: ignore
+    """Awaitable mirror of :class:`ShellQuery`.
+
+    Shares the query tree with the synchronous version, so every endpoint is available:
+
+    .. code-block:: python
+
+        async with AsyncShellQuery('https://rpc.tzkt.io/mainnet') as shell:
+            operations = await shell.blocks[1000000].operations()
+
+    NOTE: helpers combining several requests (e.g. `.level()`, `wait_blocks()`) are synchronous only.
+    """
+
+    def __init__(self, node: Union[AsyncRpcNode, str], path: str = '', params=None, timeout=None):
+        if isinstance(node, str):
+            node = AsyncRpcNode(node)
+        super().__init__(node=node, path=path, params=params, timeout=timeout)
+        self._block: Optional[BlockQuery] = None
+
+    @property
+    def block(self) -> Awaitable[BlockQuery]:  # type: ignore
+        """Cached head block, awaitable: `block = await shell.block`."""
+        return self._get_block()
+
+    async def _get_block(self) -> BlockQuery:
+        if self._block is None:
+            self._block = self.blocks[await self.head.hash()]
+        return self._block
+
+    async def close(self) -> None:
+        await self.node.close()  # type: ignore
+
+    async def __aenter__(self) -> 'AsyncShellQuery':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -0,0 +1,170 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from os.path import expanduser
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from urllib.parse import urlencode
+
+from pytezos.crypto.encoding import is_bh
+
+DEFAULT_CACHE_SIZE = 10000
+DEFAULT_FINALITY_DEPTH = 2
+
+
+def get_request_key(path: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build a canonical key for the request: normalized path and sorted query."""
+    key = path.strip('/')
+    if params:
+        query = urlencode(sorted((k, v) for k, v in params.items() if v is not None), doseq=True)
+        if query:
+            key = f'{key}?{query}'
+    return key
+
+
+def get_cache_key(path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Tuple[str, Optional[int]]]:
+    """Check if response for the given request never changes and build a cache key for it.
+
+    Only block-scoped requests (`/chains/{}/blocks/{}/...`) are cacheable: the block has to be identified
+    either by hash or by level. Head-relative identifiers (`head`, `head~N`, etc) are never cached.
+
+    :param path: request path
+    :param params: query parameters
+    :returns: tuple (cache key, block level if it has to be finalized) or None if request is not cacheable
+    """
+    chunks = path.strip('/').split('/', 4)
+    if len(chunks) < 4 or chunks[0] != 'chains' or chunks[2] != 'blocks':
+        return None
+
+    block_id = chunks[3]
+    if block_id.isdigit():
+        if chunks[1] != 'main':
+            return None
+        level: Optional[int] = int(block_id)
+    elif is_bh(block_id):
+        level = None
+    else:
+        return None
+
+    return get_request_key(path, params), level
+
+
+class ResponseCache:
+    """Base class for immutable RPC response caches, stores raw response bodies."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """In-memory LRU cache.
+
+    :param max_size: maximum number of entries
+    :param max_bytes: maximum total size of stored responses (optional)
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, max_bytes: Optional[int] = None) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self)} entries, {self._size} bytes)'
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+        with self._lock:
+            prev = self._data.pop(key, None)
+            if prev is not None:
+                self._size -= len(prev)
+            self._data[key] = value
+            self._size += len(value)
+            while len(self._data) > self.max_size or (self.max_bytes is not None and self._size > self.max_bytes):
+                _, evicted = self._data.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SqliteCache(ResponseCache):
+    """On-disk cache backed by SQLite, evicts least recently used entries.
+
+    :param path: path to the database file
+    :param max_size: maximum number of entries
+    """
+
+    def __init__(self, path: str, max_size: int = DEFAULT_CACHE_SIZE * 100) -> None:
+        self.path = expanduser(path)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB, atime REAL)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS responses_atime ON responses (atime)')
+        self._count = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path}, {len(self)} entries)'
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE responses SET atime = ? WHERE key = ?', (time.time(), key))
+            return bytes(row[0])
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            cur = self._conn.execute(
+                'INSERT OR IGNORE INTO responses (key, value, atime) VALUES (?, ?, ?)',
+                (key, value, time.time()),
+            )
+            self._count += cur.rowcount
+            if self._count > self.max_size:
+                # NOTE: evict in batches to amortize the cost of the ordered scan
+                excess = self._count - self.max_size + self.max_size // 10
+                self._conn.execute(
+                    'DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY atime LIMIT ?)',
+                    (excess,),
+                )
+                self._count = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+            self._count = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,214 @@
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from os.path import exists
+from os.path import expanduser
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from pytezos.logging import logger
+from pytezos.rpc.node import RpcMultiNode
+from pytezos.rpc.node import RpcNode
+
+CASSETTE_VERSION = 1
+
+
+def get_interaction_key(request: requests.PreparedRequest) -> str:
+    """Request identity independent of the node address: method, path, sorted query and body digest."""
+    url = urlsplit(request.url or '')
+    key = f'{request.method} {url.path.strip("/")}'
+    if url.query:
+        key += '?' + urlencode(sorted(parse_qsl(url.query, keep_blank_values=True)))
+    body = request.body.encode() if isinstance(request.body, str) else request.body
+    # NOTE: streamed (iterable or file) bodies are not part of the key, RpcNode always sends them encoded
+    if isinstance(body, bytes) and body:
+        key += ' ' + hashlib.sha256(body).hexdigest()[:16]
+    return key
+
+
+class Cassette:
+    """Recorded RPC request/response pairs for offline replay, stored as gzipped JSON.
+
+    .. code-block:: python
+
+        cassette = Cassette('rpc.cassette.gz')
+        node = cassette.record(RpcNode('https://rpc.tzkt.io/mainnet'))
+        ...  # run the code
+        cassette.save()
+
+        node = RpcNode('http://replay', session=Cassette('rpc.cassette.gz').replay())
+
+    Identical requests returning different responses (e.g. head) are replayed in the recorded order,
+    the last response is repeated once they run out. Streaming responses are not recorded.
+
+    :param path: path to the cassette file, loaded if exists
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = expanduser(path)
+        self.interactions: Dict[str, List[list]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if exists(self.path):
+            self.load()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path}, {len(self)} interactions)'
+
+    def __len__(self) -> int:
+        return sum(len(x) for x in self.interactions.values())
+
+    def load(self) -> None:
+        with gzip.open(self.path, 'rt') as f:
+            data = json.load(f)
+        if data.get('version') != CASSETTE_VERSION:
+            raise ValueError(f'Unsupported cassette version `{data.get("version")}`')
+        self.interactions = data['interactions']
+        self._cursors.clear()
+
+    def save(self, path: Optional[str] = None) -> None:
+        with self._lock, gzip.open(expanduser(path or self.path), 'wt') as f:
+            json.dump({'version': CASSETTE_VERSION, 'interactions': self.interactions}, f, separators=(',', ':'))
+
+    def append(self, key: str, res: requests.Response, latency: float) -> None:
+        try:
+            body, encoding = res.content.decode(), ''
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(res.content).decode(), 'base64'
+        entry = [res.status_code, res.headers.get('content-type', ''), round(latency, 4), body, encoding]
+        with self._lock:
+            self.interactions.setdefault(key, []).append(entry)
+
+    def next(self, key: str) -> Optional[list]:
+        with self._lock:
+            entries = self.interactions.get(key)
+            if not entries:
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            return entries[min(cursor, len(entries) - 1)]
+
+    def rewind(self) -> None:
+        """Start replaying from the beginning."""
+        with self._lock:
+            self._cursors.clear()
+
+    def record(self, node: RpcNode) -> RpcNode:
+        """Instrument node session in place: real responses are captured into the cassette.
+
+        Node's own transport (connection pool, retries) is kept, so recorded traffic matches the real one.
+
+        :param node: RpcNode instance, for RpcMultiNode every underlying node is instrumented
+        :returns: the same node
+        """
+        for target in node.nodes if isinstance(node, RpcMultiNode) else [node]:
+            session = target.session
+            for prefix in ('http://', 'https://'):
+                adapter = session.get_adapter(prefix)
+                if not isinstance(adapter, RecordingAdapter):
+                    session.mount(prefix, RecordingAdapter(self, adapter))
+        return node
+
+    def replay(self, latency: Optional[float] = None, recorded_latency: bool = False) -> requests.Session:
+        """Create session serving responses from the cassette, no network access is made.
+
+        :param latency: inject fixed delay (seconds) into every response
+        :param recorded_latency: reproduce delays observed while recording
+        """
+        session = requests.Session()
+        adapter = ReplayAdapter(self, latency=latency, recorded_latency=recorded_latency)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+
+class RecordingAdapter(BaseAdapter):
+    """Transport adapter passing requests through and capturing responses.
+
+    :param cassette: cassette to record to
+    :param adapter: underlying adapter, `HTTPAdapter` by default
+    """
+
+    def __init__(self, cassette: Cassette, adapter: Optional[BaseAdapter] = None) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter or HTTPAdapter()
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout=None,
+        verify=True,
+        cert=None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        started_at = time.monotonic()
+        res = self.adapter.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        if not stream:
+            self.cassette.append(get_interaction_key(request), res, time.monotonic() - started_at)
+        return res
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter serving recorded responses.
+
+    :param cassette: cassette to replay
+    :param latency: fixed delay (seconds)
+    :param recorded_latency: reproduce recorded delays
+    """
+
+    def __init__(self, cassette: Cassette, latency: Optional[float] = None, recorded_latency: bool = False) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+        self.recorded_latency = recorded_latency
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout=None,
+        verify=True,
+        cert=None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        key = get_interaction_key(request)
+        entry = self.cassette.next(key)
+        if entry is None:
+            raise requests.exceptions.ConnectionError(f'Request `{key}` is not recorded', request=request)
+        status_code, content_type, latency, body, encoding = entry
+
+        delay = (latency if self.recorded_latency else 0.0) + (self.latency or 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        logger.debug('===== %s (replay)', key)
+
+        res = requests.Response()
+        res.status_code = status_code
+        res.headers = CaseInsensitiveDict({'content-type': content_type} if content_type else {})
+        res._content = base64.b64decode(body) if encoding == 'base64' else body.encode()
+        res._content_consumed = True  # type: ignore
+        res.url = request.url  # type: ignore
+        res.request = request
+        res.encoding = 'utf-8'
+        return res
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,69 @@
+from types import ModuleType
+from typing import Any
+from typing import Optional
+from typing import Union
+
+import requests
+import simplejson
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKENDS = ('orjson', 'simplejson')
+
+# NOTE: orjson silently turns integers wider than 64 bits into floats; Tezos RPC returns big numbers as strings,
+# so unquoted long digit runs are rare and such payloads are decoded with simplejson instead.
+# Payload is mapped to `0` (digit), `:` (may precede a number) and `x` (anything else), which is much faster than regex
+_BIG_INT_TABLE = bytes(
+    ord('0') if c in b'0123456789' else ord(':') if c in b'[:,- \t\r\n' else ord('x') for c in range(256)
+)
+_BIG_INT_NEEDLE = b':' + b'0' * 19
+
+_backend = 'orjson' if orjson is not None else 'simplejson'
+
+
+def get_json_backend() -> str:
+    """Get the name of the JSON library used to decode RPC responses."""
+    return _backend
+
+
+def set_json_backend(name: Optional[str] = None) -> None:
+    """Choose the JSON library used to decode RPC responses.
+
+    :param name: one of `orjson`, `simplejson`; the fastest available by default
+    """
+    global _backend
+    if name is None:
+        name = 'orjson' if orjson is not None else 'simplejson'
+    if name not in JSON_BACKENDS:
+        raise ValueError(f'Unknown JSON backend `{name}`, expected one of {JSON_BACKENDS}')
+    if name == 'orjson' and orjson is None:
+        raise ImportError('Please, install `orjson` Python library to use it as JSON backend')
+    _backend = name
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode JSON document.
+
+    :param data: raw payload
+    :raises ValueError: invalid JSON
+    """
+    if _backend == 'orjson' and orjson is not None:
+        raw = data.encode() if isinstance(data, str) else bytes(data)
+        if _BIG_INT_NEEDLE not in raw.translate(_BIG_INT_TABLE):
+            return orjson.loads(raw)
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    return simplejson.loads(data)
+
+
+def decode_response(res: requests.Response) -> Any:
+    """Decode response body once, bypassing `requests` charset detection.
+
+    :param res: node response
+    :raises ValueError: invalid JSON
+    """
+    return loads(res.content)
@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import suppress
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_BACKOFF_RATIO = 0.5
+DEFAULT_DECREASE_COOLDOWN = 1.0
+DEFAULT_RETRY_RATIO = 0.2
+DEFAULT_MIN_RETRIES_PER_SEC = 1.0
+DEFAULT_RETRY_WINDOW = 10.0
+
+
+class RateLimiter:
+    """Per-node traffic limiter: token bucket for request rate plus AIMD adaptive concurrency.
+
+    Concurrency limit grows by one per "window" of successful requests (additive increase) and is cut by
+    `backoff_ratio` when node throttles us, fails to respond or gets slower than `target_latency`
+    (multiplicative decrease, at most once per `cooldown` seconds).
+
+    :param rate: maximum number of requests per second, unlimited by default
+    :param burst: token bucket size, defaults to `rate`
+    :param max_concurrency: upper bound for the number of requests in flight
+    :param min_concurrency: lower bound for the number of requests in flight
+    :param target_latency: treat responses slower than this (seconds) as congestion signal
+    :param backoff_ratio: multiplicative decrease factor
+    :param cooldown: minimum interval between two decreases (seconds)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+        target_latency: Optional[float] = None,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+        cooldown: float = DEFAULT_DECREASE_COOLDOWN,
+    ) -> None:
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError('Expected 1 <= min_concurrency <= max_concurrency')
+        self.rate = rate
+        self.burst = burst or rate
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.target_latency = target_latency
+        self.backoff_ratio = backoff_ratio
+        self.cooldown = cooldown
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._tokens = self.burst or 0.0
+        self._refilled_at = time.monotonic()
+        self._decreased_at = 0.0
+        self._throttled = 0
+        self._cond = threading.Condition()
+        self._bucket_lock = threading.Lock()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(rate={self.rate}, concurrency={self.concurrency}/{self.max_concurrency})'
+
+    def clone(self) -> 'RateLimiter':
+        """Create a fresh limiter with the same settings (for another node)."""
+        return RateLimiter(
+            rate=self.rate,
+            burst=self.burst,
+            max_concurrency=self.max_concurrency,
+            min_concurrency=self.min_concurrency,
+            target_latency=self.target_latency,
+            backoff_ratio=self.backoff_ratio,
+            cooldown=self.cooldown,
+        )
+
+    @property
+    def concurrency(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        """Wait for a free concurrency slot and a token."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+        delay = self._take_token()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Same as `acquire`, but waits without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+        delay = self._take_token()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _take_token(self) -> float:
+        if self.rate is None:
+            return 0.0
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)  # type: ignore
+            self._refilled_at = now
+            # NOTE: token is reserved even if it's not there yet, so that waiters are served in order
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def release(self, latency: float, throttled: bool = False) -> None:
+        """Free the slot and adjust concurrency limit.
+
+        :param latency: request duration (seconds)
+        :param throttled: node has rejected the request due to overload or did not respond
+        """
+        with self._cond:
+            self._in_flight -= 1
+            congested = throttled or (self.target_latency is not None and latency > self.target_latency)
+            if congested:
+                self._throttled += 1
+                now = time.monotonic()
+                if now - self._decreased_at > self.cooldown:
+                    self._decreased_at = now
+                    self._limit = max(float(self.min_concurrency), self._limit * self.backoff_ratio)
+            else:
+                self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+            self._cond.notify()
+            # NOTE: async waiters may live in different event loops, all of them re-check the limit
+            async_waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in async_waiters:
+            with suppress(RuntimeError):  # loop is closed
+                loop.call_soon_threadsafe(_wake_up, waiter)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'rate': self.rate,
+            'concurrency': self.concurrency,
+            'in_flight': self._in_flight,
+            'throttled': self._throttled,
+        }
+
+
+def _wake_up(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RetryBudget:
+    """Limits retries to a fraction of regular requests, so that retries cannot amplify an outage.
+
+    Retries of throttled requests are disabled unless a budget is set; share a single instance between nodes
+    (and clients) to make the budget global.
+
+    :param ratio: number of retries allowed per request
+    :param min_retries_per_sec: retries always allowed regardless of traffic (for low-volume clients)
+    :param window: sliding window over which requests and retries are counted (seconds)
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_RETRY_RATIO,
+        min_retries_per_sec: float = DEFAULT_MIN_RETRIES_PER_SEC,
+        window: float = DEFAULT_RETRY_WINDOW,
+    ) -> None:
+        self.ratio = ratio
+        self.min_retries_per_sec = min_retries_per_sec
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(ratio={self.ratio}, available={self.available:.1f})'
+
+    def _expire(self, now: float) -> None:
+        for events in (self._requests, self._retries):
+            while events and events[0] < now - self.window:
+                events.popleft()
+
+    @property
+    def available(self) -> float:
+        """Number of retries currently allowed."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return self.min_retries_per_sec * self.window + self.ratio * len(self._requests) - len(self._retries)
+
+    def deposit(self) -> None:
+        """Register a regular request."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            self._requests.append(now)
+
+    def withdraw(self) -> bool:
+        """Try to spend the budget on a retry, return False if exhausted."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            allowed = self.min_retries_per_sec * self.window + self.ratio * len(self._requests)
+            if len(self._retries) + 1 > allowed:
+                return False
+            self._retries.append(now)
+            return True
@@ -0,0 +1,303 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import requests
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_METRICS_PREFIX = 'pytezos_rpc'
+ERROR_STATUS = 'error'
+
+# NOTE: block/chain aliases, levels and base58 hashes/addresses, so that ad-hoc paths do not explode label cardinality
+_path_param_re = re.compile(r'^(\d+|(head|main|test|genesis)([~+-]\d+)?|[1-9A-HJ-NP-Za-km-z]{32,})$')
+
+
+class RpcPath(str):
+    """Request path remembering the wildcard template it was made from (e.g. `chains/{}/blocks/{}/header`)."""
+
+    template: str
+
+    def __new__(cls, path: str, template: str) -> 'RpcPath':
+        res = super().__new__(cls, path)
+        res.template = template
+        return res
+
+    def __getnewargs__(self) -> Tuple[str, str]:  # type: ignore
+        # NOTE: used by pickle and copy, default implementation passes the string only
+        return str(self), self.template
+
+
+def get_path_template(path: str) -> str:
+    """Get wildcard path template: taken from :class:`RpcPath` or guessed by replacing ids with `{}`.
+
+    :param path: request path
+    """
+    template = getattr(path, 'template', None)
+    if template is not None:
+        return template.strip('/')
+    return '/'.join('{}' if _path_param_re.match(x) else x for x in path.strip('/').split('/'))
+
+
+class RequestInfo:
+    """Single HTTP request passed to the hooks.
+
+    :param node: node address
+    :param method: HTTP method
+    :param path: request path
+    :param kwargs: request arguments (`params`, `json`, etc.)
+    """
+
+    def __init__(self, node: str, method: str, path: str, kwargs: Dict[str, Any]) -> None:
+        self.node = node
+        self.method = method
+        self.path = path
+        self.kwargs = kwargs
+        self.started_at = time.monotonic()
+        self.latency: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.response: Optional[requests.Response] = None
+        self.error: Optional[BaseException] = None
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}({self.method} {self.path}, status={self.status_code}, latency={self.latency})'
+        )
+
+    @property
+    def template(self) -> str:
+        return get_path_template(self.path)
+
+    def finish(self, response: Optional[requests.Response] = None, error: Optional[BaseException] = None) -> None:
+        """Fill in the outcome.
+
+        :param response: node response
+        :param error: exception raised instead
+        """
+        self.latency = time.monotonic() - self.started_at
+        self.response = response
+        self.error = error
+        if response is None:
+            self.status_code = getattr(error, 'status_code', None)
+            return
+        self.status_code = response.status_code
+        body = response.request.body if response.request is not None else None
+        # NOTE: streamed (iterable or file) bodies are not measured
+        if isinstance(body, str):
+            self.request_bytes = len(body.encode())
+        elif isinstance(body, bytes):
+            self.request_bytes = len(body)
+        if self.kwargs.get('stream'):
+            # NOTE: accessing content would consume the stream
+            self.response_bytes = int(response.headers.get('content-length', 0))
+        else:
+            self.response_bytes = len(response.content)
+
+
+class RpcHook:
+    """Base class for request hooks, see `RpcNode.hooks`. Exceptions raised by hooks are propagated."""
+
+    def before_request(self, info: RequestInfo) -> None:
+        """Called before the request is sent (before retries)."""
+
+    def after_request(self, info: RequestInfo) -> None:
+        """Called once the request has completed or failed."""
+
+
+class Histogram:
+    """Cumulative latency histogram.
+
+    :param buckets: upper bounds (seconds), +Inf is implied
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Get (upper bound, number of observations <= bound) pairs including +Inf."""
+        res, total = [], 0
+        for bound, count in zip((*map(str, self.buckets), '+Inf'), self.counts):
+            total += count
+            res.append((bound, total))
+        return res
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate quantile (upper bound of the bucket containing it)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, (_, total) in zip((*self.buckets, float('inf')), self.cumulative()):
+            if total >= rank:
+                return bound
+        return None
+
+
+class EndpointMetrics:
+    """Counters for a single (method, path template) pair."""
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.statuses: Dict[str, int] = {}
+        self.latency = Histogram(buckets)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.latency.count,
+            'statuses': dict(self.statuses),
+            'latency_sum': self.latency.sum,
+            'latency_p50': self.latency.quantile(0.5),
+            'latency_p99': self.latency.quantile(0.99),
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+        }
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class RpcMetrics(RpcHook):
+    """Per-endpoint request metrics: counters by status, latency histograms and transferred bytes.
+
+    Endpoints are identified by HTTP method and wildcard path template, so that all blocks (contracts, etc.)
+    share the same series.
+
+    .. code-block:: python
+
+        metrics = RpcMetrics()
+        client = pytezos.using(shell=ShellQuery(RpcNode(uri, hooks=[metrics])))
+        ...
+        print(metrics.to_openmetrics())
+
+    :param buckets: latency histogram bounds (seconds)
+    :param prefix: metric name prefix used by exporters
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS, prefix: str = DEFAULT_METRICS_PREFIX):
+        self.buckets = buckets
+        self.prefix = prefix
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self._endpoints)} endpoints)'
+
+    def after_request(self, info: RequestInfo) -> None:
+        key = (info.method, info.template)
+        status = ERROR_STATUS if info.status_code is None else str(info.status_code)
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = EndpointMetrics(self.buckets)
+            endpoint.statuses[status] = endpoint.statuses.get(status, 0) + 1
+            endpoint.latency.observe(info.latency or 0.0)
+            endpoint.request_bytes += info.request_bytes
+            endpoint.response_bytes += info.response_bytes
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics per endpoint (`METHOD path/{}/template`), slowest in total first."""
+        with self._lock:
+            items = sorted(self._endpoints.items(), key=lambda x: -x[1].latency.sum)
+            return {f'{method} {template}': endpoint.to_dict() for (method, template), endpoint in items}
+
+    def _samples(self) -> Iterator[Tuple[str, str, Dict[str, str], float]]:
+        # NOTE: (family, sample suffix, labels, value)
+        with self._lock:
+            items = sorted(self._endpoints.items())
+            for (method, template), endpoint in items:
+                labels = {'method': method, 'path': template}
+                for status, count in sorted(endpoint.statuses.items()):
+                    yield 'requests', '_total', {**labels, 'status': status}, count
+                for bound, count in endpoint.latency.cumulative():
+                    yield 'request_duration_seconds', '_bucket', {**labels, 'le': bound}, count
+                yield 'request_duration_seconds', '_sum', labels, endpoint.latency.sum
+                yield 'request_duration_seconds', '_count', labels, endpoint.latency.count
+                yield 'request_bytes', '_total', labels, endpoint.request_bytes
+                yield 'response_bytes', '_total', labels, endpoint.response_bytes
+
+    def to_openmetrics(self) -> str:
+        """Render metrics in OpenMetrics text exposition format (no extra dependencies)."""
+        types = {
+            'requests': 'counter',
+            'request_duration_seconds': 'histogram',
+            'request_bytes': 'counter',
+            'response_bytes': 'counter',
+        }
+        families: Dict[str, List[str]] = {family: [] for family in types}
+        for family, suffix, labels, value in self._samples():
+            label_str = ','.join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+            families[family].append(f'{self.prefix}_{family}{suffix}{{{label_str}}} {value}')
+        lines = []
+        for family, samples in families.items():
+            lines.append(f'# TYPE {self.prefix}_{family} {types[family]}')
+            lines.extend(samples)
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def collect(self):
+        """Custom collector protocol of `prometheus_client`, see :meth:`register`."""
+        from prometheus_client.core import CounterMetricFamily  # type: ignore
+        from prometheus_client.core import HistogramMetricFamily  # type: ignore
+
+        families = {
+            'requests': CounterMetricFamily(
+                f'{self.prefix}_requests', 'RPC requests', labels=['method', 'path', 'status']
+            ),
+            'request_bytes': CounterMetricFamily(
+                f'{self.prefix}_request_bytes', 'RPC request bytes', labels=['method', 'path']
+            ),
+            'response_bytes': CounterMetricFamily(
+                f'{self.prefix}_response_bytes', 'RPC response bytes', labels=['method', 'path']
+            ),
+        }
+        histograms: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for family, suffix, labels, value in self._samples():
+            if family in families:
+                families[family].add_metric(list(labels.values()), value)
+                continue
+            histogram = histograms.setdefault((labels['method'], labels['path']), {'buckets': []})
+            if suffix == '_bucket':
+                histogram['buckets'].append((labels['le'], value))
+            elif suffix == '_sum':
+                histogram['sum'] = value
+
+        duration = HistogramMetricFamily(
+            f'{self.prefix}_request_duration_seconds', 'RPC request latency', labels=['method', 'path']
+        )
+        for labels, histogram in histograms.items():
+            duration.add_metric(list(labels), histogram['buckets'], histogram['sum'])
+
+        yield from families.values()
+        yield duration
+
+    def register(self, registry=None) -> None:
+        """Expose metrics via `prometheus_client` (optional dependency).
+
+        :param registry: collector registry, default one by default
+        """
+        try:
+            from prometheus_client import REGISTRY  # type: ignore
+        except ImportError as e:
+            raise ImportError('Please, install `prometheus_client` Python library to export metrics') from e
+        (registry or REGISTRY).register(self)
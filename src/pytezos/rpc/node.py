@@ -1,16 +1,58 @@
+import copy
 import json
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from pprint import pformat
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Literal
 from typing import Optional
+from typing import Set
 from typing import Union
+from typing import cast
+from typing import overload
 
 import requests
 import requests.exceptions
-from simplejson import JSONDecodeError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pytezos.logging import logger
+from pytezos.rpc.cache import DEFAULT_FINALITY_DEPTH
+from pytezos.rpc.cache import ResponseCache
+from pytezos.rpc.cache import get_cache_key
+from pytezos.rpc.cache import get_request_key
+from pytezos.rpc.codec import decode_response
+from pytezos.rpc.codec import loads
+from pytezos.rpc.limits import RateLimiter
+from pytezos.rpc.limits import RetryBudget
+from pytezos.rpc.metrics import RequestInfo
+from pytezos.rpc.metrics import RpcHook
+
+DEFAULT_TIMEOUT = 60
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+FINALIZED_LEVEL_TTL = 10
+DEFAULT_EWMA_ALPHA = 0.2
+DEFAULT_EJECT_AFTER = 3
+DEFAULT_EJECT_FOR = 30.0
+DEFAULT_MAX_LAG = 2
+DEFAULT_HEDGE_WORKERS = 2 * DEFAULT_POOL_MAXSIZE
+ERROR_RATE_PENALTY = 10
+FAILOVER_STATUSES = frozenset([429, 502, 503, 504])
+RETRY_STATUSES = FAILOVER_STATUSES
+THROTTLE_STATUSES = frozenset([429, 503])
+MAX_RETRY_AFTER = 60.0
 
 
 def _urljoin(*args: str) -> str:
@@ -29,6 +71,7 @@ def _gen_error_variants(error_id: str) -> List[str]:
 
 class RpcError(Exception):
     __handlers__ = {}  # type: ignore
+    status_code: Optional[int] = None
 
     @classmethod
     def __init_subclass__(cls, error_id: Union[str, List[str]]) -> None:
@@ -58,8 +101,8 @@ class RpcError(Exception):
         """Create RpcError from requests Response."""
         if res.headers.get('content-type') == 'application/json':
             try:
-                errors = res.json()
-            except JSONDecodeError:
+                errors = decode_response(res)
+            except ValueError:
                 # sometimes rpc returns invalid json
                 return RpcError(res.text)
             assert isinstance(errors, list)
@@ -71,16 +114,96 @@ class RpcError(Exception):
         return pformat(self.args)
 
 
+def _get_retry_after(res: requests.Response) -> Optional[float]:
+    value = res.headers.get('retry-after')
+    if value is None:
+        return None
+    try:
+        return min(max(0.0, float(value)), MAX_RETRY_AFTER)
+    except ValueError:
+        return None  # NOTE: HTTP-date form is not supported
+
+
+def _check_response(res: requests.Response, path: str) -> None:
+    if res.status_code == 200:
+        return
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('<<<<< %s\n%s', res.status_code, pformat(res.text, indent=4))
+    if res.status_code == 401:
+        error = RpcError(f'Unauthorized: {path}')
+    elif res.status_code == 404:
+        error = RpcError(f'Not found: {path}')
+    else:
+        error = RpcError.from_response(res)
+    error.status_code = res.status_code
+    raise error
+
+
 class RpcNode:
-    """Request proxy for a single Tezos node."""
+    """Request proxy for a single Tezos node.
+
+    All queries spawned from the same node share a single pooled keep-alive HTTP session.
+
+    :param uri: node address
+    :param headers: extra HTTP headers sent with every request
+    :param pool_connections: number of per-host connection pools to cache
+    :param pool_maxsize: maximum number of connections kept alive per host
+    :param pool_block: block when all connections to the host are busy instead of opening a new one
+    :param keep_alive: reuse connections between requests
+    :param retries: number of retries on connection errors (idempotent methods only) or `urllib3.Retry` instance
+    :param backoff_factor: backoff factor between retries
+    :param session: use existing `requests.Session` instead of creating a new one
+    :param cache: cache for responses which never change (addressed by block hash or finalized level)
+    :param finality_depth: number of blocks after which a block is considered final
+    :param coalesce: share a single HTTP call between concurrent identical GET requests
+    :param rate_limiter: request rate and adaptive concurrency limiter
+    :param retry_budget: budget for retrying idempotent requests rejected with 429/502/503/504, \
+        such retries are disabled by default; share one instance between nodes to make the budget global
+    :param hooks: request hooks (e.g. :class:`RpcMetrics`), called for every HTTP request
+    """
 
-    def __init__(self, uri: Union[str, List[str]], headers: Optional[Dict[str, str]] = None) -> None:
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        headers: Optional[Dict[str, str]] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retries: Union[int, Retry] = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        session: Optional[requests.Session] = None,
+        cache: Optional[ResponseCache] = None,
+        finality_depth: int = DEFAULT_FINALITY_DEPTH,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hooks: Optional[List[RpcHook]] = None,
+    ) -> None:
         if not uri:
             raise RuntimeError()
         if not isinstance(uri, list):
             uri = [uri]
         self.uri = uri
         self.headers = headers or {}
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._session = session
+        self._session_lock = threading.Lock()
+        self.cache = cache
+        self.finality_depth = finality_depth
+        self._finalized_level = -1
+        self._finalized_level_time = 0.0
+        self.coalesce = coalesce
+        self._flights: Dict[str, Future] = {}
+        self._flights_lock = threading.Lock()
+        self.rate_limiter = rate_limiter
+        self.retry_budget = retry_budget
+        self.hooks = hooks if hooks is not None else []
 
     def __repr__(self) -> str:
         res = [
@@ -90,6 +213,64 @@ class RpcNode:
         ]
         return '\n'.join(res)
 
+    def _make_retry(self) -> Retry:
+        if isinstance(self.retries, Retry):
+            return self.retries
+        return Retry(
+            total=self.retries,
+            read=0,
+            status=0,
+            backoff_factor=self.backoff_factor,
+            allowed_methods=IDEMPOTENT_METHODS,
+            raise_on_status=False,
+        )
+
+    def _make_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=self._make_retry(),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not self.keep_alive:
+            session.headers['connection'] = 'close'
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session, created on first use and shared between threads."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._make_session()
+        return self._session
+
+    def using(
+        self, rate_limiter: Optional[RateLimiter] = None, retry_budget: Optional[RetryBudget] = None
+    ) -> 'RpcNode':
+        """Get a copy of the node with different traffic limits, sharing connection pool and cache.
+
+        :param rate_limiter: request rate and adaptive concurrency limiter
+        :param retry_budget: retry budget
+        """
+        node = copy.copy(self)
+        node._session = self.session
+        if rate_limiter is not None:
+            node.rate_limiter = rate_limiter
+        if retry_budget is not None:
+            node.retry_budget = retry_budget
+        return node
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
     def request(self, method: str, path: str, **kwargs) -> requests.Response:
         """Perform HTTP request to node.
 
@@ -99,39 +280,200 @@ class RpcNode:
         :raises RpcError: node has returned an error
         :returns: node response
         """
-        logger.debug('>>>>> %s %s\n%s', method, path, json.dumps(kwargs, indent=4))
-        res = requests.request(
-            method=method,
-            url=_urljoin(self.uri[0], path),
-            headers={'content-type': 'application/json', 'user-agent': 'PyTezos', **self.headers},
-            timeout=kwargs.pop('timeout', None) or 60,
-            **kwargs,
-        )
-        if res.status_code == 401:
-            logger.debug('<<<<< %s\n%s', res.status_code, res.text)
-            raise RpcError(f'Unauthorized: {path}')
-        if res.status_code == 404:
-            logger.debug('<<<<< %s\n%s', res.status_code, res.text)
-            raise RpcError(f'Not found: {path}')
-        if res.status_code != 200:
-            logger.debug('<<<<< %s\n%s', res.status_code, pformat(res.text, indent=4))
-            raise RpcError.from_response(res)
-
-        logger.debug('<<<<< %s\n%s', res.status_code, json.dumps(res.json(), indent=4))
+        if not self.hooks:
+            return self._request(method, path, **kwargs)
+
+        info = self._before_request(method, path, kwargs)
+        try:
+            res = self._request(method, path, **kwargs)
+        except BaseException as e:
+            self._after_request(info, error=e)
+            raise
+        self._after_request(info, response=res)
         return res
 
+    def _before_request(self, method: str, path: str, kwargs: Dict[str, Any]) -> RequestInfo:
+        info = RequestInfo(self.uri[0], method, path, kwargs)
+        for hook in self.hooks:
+            hook.before_request(info)
+        return info
+
+    def _after_request(
+        self, info: RequestInfo, response: Optional[requests.Response] = None, error: Optional[BaseException] = None
+    ) -> None:
+        info.finish(response=response, error=error)
+        for hook in self.hooks:
+            hook.after_request(info)
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('>>>>> %s %s\n%s', method, path, json.dumps(kwargs, indent=4))
+        timeout = kwargs.pop('timeout', None) or DEFAULT_TIMEOUT
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+
+        attempt = 0
+        while True:
+            res = self._send(method, path, timeout=timeout, **kwargs)
+            if res.status_code not in RETRY_STATUSES or not self._can_retry(method, attempt):
+                break
+            delay = _get_retry_after(res)
+            if delay is None:
+                delay = self.backoff_factor * 2**attempt
+            logger.debug('<<<<< %s, retrying in %s seconds', res.status_code, delay)
+            res.close()
+            time.sleep(delay)
+            attempt += 1
+
+        _check_response(res, path)
+        if logger.isEnabledFor(logging.DEBUG):
+            if kwargs.get('stream'):
+                logger.debug('<<<<< %s (stream)', res.status_code)
+            else:
+                logger.debug('<<<<< %s\n%s', res.status_code, res.text)
+        return res
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        limiter = self.rate_limiter
+        if limiter is not None:
+            limiter.acquire()
+        # NOTE: connection errors and timeouts are congestion signals as well
+        started_at, throttled = time.monotonic(), True
+        try:
+            res = self.session.request(
+                method=method,
+                url=_urljoin(self.uri[0], path),
+                headers={'content-type': 'application/json', 'user-agent': 'PyTezos', **self.headers},
+                **kwargs,
+            )
+            throttled = res.status_code in THROTTLE_STATUSES
+            return res
+        finally:
+            if limiter is not None:
+                limiter.release(time.monotonic() - started_at, throttled=throttled)
+
+    def _can_retry(self, method: str, attempt: int) -> bool:
+        if self.retry_budget is None or method not in IDEMPOTENT_METHODS:
+            return False
+        if isinstance(self.retries, Retry):
+            max_retries = self.retries.status if self.retries.status is not None else (self.retries.total or 0)
+        else:
+            max_retries = self.retries
+        if attempt >= max_retries:
+            return False
+        if not self.retry_budget.withdraw():
+            logger.warning('Retry budget is exhausted, not retrying')
+            return False
+        return True
+
+    def stream(self, path: str, params: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+        """Open a streaming GET request, yield raw chunks as they arrive.
+
+        :param path: path to endpoint
+        :param params: query parameters
+        """
+        res = self.request('GET', path, params=params, stream=True)
+        try:
+            yield from res.iter_content(chunk_size=None)
+        finally:
+            res.close()
+
+    def _finalized_level_expired(self, level: int) -> bool:
+        if level <= self._finalized_level:
+            return False
+        return time.monotonic() - self._finalized_level_time > FINALIZED_LEVEL_TTL
+
+    def _update_finalized_level(self, header: Dict[str, Any]) -> None:
+        self._finalized_level = max(self._finalized_level, int(header['level']))
+        self._finalized_level_time = time.monotonic()
+
+    def _get_cache_key(self, path: str, params: Optional[Dict[str, Any]]) -> Optional[str]:
+        if self.cache is None:
+            return None
+        res = get_cache_key(path, params)
+        if res is None:
+            return None
+        key, level = res
+        if level is not None:
+            if self._finalized_level_expired(level):
+                header = decode_response(
+                    self.request('GET', f'chains/main/blocks/head~{self.finality_depth}/header/shell')
+                )
+                self._update_finalized_level(header)
+            if level > self._finalized_level:
+                return None
+        return key
+
+    @overload
     def get(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
-    ) -> requests.Response:
-        return self.request(
-            'GET',
-            path,
-            params=params,
-            timeout=timeout,
-        ).json()
+        raw: Literal[False] = False,
+    ) -> Any: ...
+
+    @overload
+    def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        *,
+        raw: Literal[True],
+    ) -> bytes: ...
+
+    def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        raw: bool = False,
+    ) -> Union[bytes, Any]:
+        """Get decoded JSON response.
+
+        :param path: path to endpoint
+        :param params: query parameters
+        :param timeout: request timeout (seconds)
+        :param raw: return response body as is (bytes), skip decoding
+        """
+        cache_key = self._get_cache_key(path, params)
+        if cache_key is not None:
+            content = self.cache.get(cache_key)  # type: ignore
+            if content is not None:
+                return content if raw else loads(content)
+
+        if self.coalesce:
+            res = self._coalesced_get(path, params, timeout)
+        else:
+            res = self.request('GET', path, params=params, timeout=timeout)
+        if cache_key is not None:
+            self.cache.set(cache_key, res.content)  # type: ignore
+        return res.content if raw else decode_response(res)
+
+    def _coalesced_get(self, path: str, params: Optional[Dict[str, Any]], timeout: Optional[int]) -> requests.Response:
+        # NOTE: followers wait for the leader's response; every caller decodes its own copy since results are mutable
+        key = get_request_key(path, params)
+        with self._flights_lock:
+            future = self._flights.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._flights[key] = Future()
+        if not is_leader:
+            logger.debug('===== GET %s (coalesced)', path)
+            return future.result()
+
+        try:
+            res = self.request('GET', path, params=params, timeout=timeout)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(res)
+            return res
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
 
     def post(
         self,
@@ -148,8 +490,8 @@ class RpcNode:
             timeout=timeout,
         )
         try:
-            return response.json()
-        except JSONDecodeError:
+            return decode_response(response)
+        except ValueError:
             return response.text
 
     def delete(
@@ -158,12 +500,13 @@ class RpcNode:
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
     ) -> requests.Response:
-        return self.request(
+        res = self.request(
             'DELETE',
             path,
             params=params,
             timeout=timeout,
-        ).json()
+        )
+        return decode_response(res)
 
     def put(
         self,
@@ -171,21 +514,121 @@ class RpcNode:
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
     ) -> requests.Response:
-        return self.request(
+        res = self.request(
             'PUT',
             path,
             params=params,
             timeout=timeout,
-        ).json()
+        )
+        return decode_response(res)
+
+
+class NodeStats:
+    """Health statistics of a single node, used by :class:`RpcMultiNode` to pick the best one.
+
+    :param alpha: EWMA smoothing factor
+    """
+
+    def __init__(self, alpha: float = DEFAULT_EWMA_ALPHA) -> None:
+        self.alpha = alpha
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.head_level: Optional[int] = None
+        self.ejected_until: Optional[float] = None
+
+    def record_success(self, latency: float) -> None:
+        self.requests += 1
+        self.consecutive_errors = 0
+        self.ejected_until = None
+        self.latency = latency if self.latency is None else self.alpha * latency + (1 - self.alpha) * self.latency
+        self.error_rate = (1 - self.alpha) * self.error_rate
+
+    def record_error(self) -> None:
+        self.requests += 1
+        self.errors += 1
+        self.consecutive_errors += 1
+        self.error_rate = self.alpha + (1 - self.alpha) * self.error_rate
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until is not None and time.monotonic() < self.ejected_until
+
+    @property
+    def score(self) -> float:
+        # NOTE: nodes without measurements go first to get them
+        return (self.latency or 0.0) * (1 + ERROR_RATE_PENALTY * self.error_rate)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'latency': self.latency,
+            'error_rate': self.error_rate,
+            'requests': self.requests,
+            'errors': self.errors,
+            'head_level': self.head_level,
+            'ejected': self.ejected,
+        }
+
+
+def _is_node_failure(error: Exception) -> bool:
+    if isinstance(error, RpcError):
+        return error.status_code in FAILOVER_STATUSES
+    return isinstance(error, requests.exceptions.RequestException)
 
 
 class RpcMultiNode(RpcNode):
-    """Request proxy for multiple nodes chosen for each request in round-robin order."""
+    """Request proxy for multiple nodes, picks the fastest healthy node for each request.
+
+    Nodes are ranked by EWMA latency penalized by error rate. Failing nodes are ejected for a while and re-probed
+    in background afterwards, nodes lagging behind the others are skipped. On node failure request is retried on
+    the next best node.
 
-    def __init__(self, uri: Union[str, List[str]]) -> None:
-        super().__init__(uri)
-        self.nodes = list(map(RpcNode, self.uri))
-        self._next_i = 0
+    :param uri: list of node addresses
+    :param eject_after: number of consecutive failures after which node is ejected
+    :param eject_for: ejection period (seconds)
+    :param max_lag: maximum number of levels node head is allowed to lag behind the best one
+    :param hedge_after: send GET request to the second best node if the first one hasn't responded in time (seconds)
+    :param hedge_workers: maximum number of in-flight hedged attempts, requests are not hedged when all are busy
+    :param probe_interval: check node heads in background every N seconds (disabled by default)
+    :param kwargs: :class:`RpcNode` arguments
+    """
+
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        eject_after: int = DEFAULT_EJECT_AFTER,
+        eject_for: float = DEFAULT_EJECT_FOR,
+        max_lag: int = DEFAULT_MAX_LAG,
+        hedge_after: Optional[float] = None,
+        hedge_workers: int = DEFAULT_HEDGE_WORKERS,
+        probe_interval: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(uri, **kwargs)
+        kwargs.pop('cache', None)  # NOTE: responses are cached once, at the top level
+        kwargs.pop('rate_limiter', None)
+        kwargs['retry_budget'] = None  # NOTE: failover is the retry, budget is checked at the top level
+        self.nodes = [RpcNode(node_uri, **kwargs) for node_uri in self.uri]
+        for node in self.nodes:
+            node.hooks = self.hooks  # NOTE: hooks observe actual HTTP requests, including failover attempts
+        if self.rate_limiter is not None:
+            for node in self.nodes:
+                node.rate_limiter = self.rate_limiter.clone()
+        self.eject_after = eject_after
+        self.eject_for = eject_for
+        self.max_lag = max_lag
+        self.hedge_after = hedge_after
+        self.hedge_workers = hedge_workers
+        self.probe_interval = probe_interval
+        self._stats = [NodeStats() for _ in self.nodes]
+        self._stats_lock = threading.Lock()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_slots = threading.BoundedSemaphore(hedge_workers)
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
+        self._probing: Set[int] = set()
+        self._last_probe = time.monotonic()
 
     def __repr__(self) -> str:
         res = [
@@ -195,8 +638,178 @@ class RpcMultiNode(RpcNode):
         ]
         return '\n'.join(res)
 
-    def request(self, method: str, path: str, **kwargs) -> requests.Response:
-        assert self._next_i < len(self.nodes)
-        res = self.nodes[self._next_i].request(method, path, **kwargs)
-        self._next_i = (self._next_i + 1) % len(self.nodes)
+    def using(
+        self, rate_limiter: Optional[RateLimiter] = None, retry_budget: Optional[RetryBudget] = None
+    ) -> 'RpcNode':
+        node = cast(RpcMultiNode, super().using(rate_limiter=rate_limiter, retry_budget=retry_budget))
+        if rate_limiter is not None:
+            # NOTE: limits are per node, health statistics are still shared
+            node.nodes = [child.using(rate_limiter=rate_limiter.clone()) for child in self.nodes]
+        return node
+
+    def close(self) -> None:
+        for node in self.nodes:
+            node.close()
+        for executor in (self._hedge_executor, self._probe_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self._hedge_executor = None
+        self._probe_executor = None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-node statistics: EWMA latency and error rate, request counters, head level, ejection status."""
+        with self._stats_lock:
+            return {node.uri[0]: stats.to_dict() for node, stats in zip(self.nodes, self._stats)}
+
+    def probe(self, indices: Optional[List[int]] = None) -> None:
+        """Request current head level from nodes, updates health statistics.
+
+        :param indices: node indices, all nodes by default
+        """
+        for i in range(len(self.nodes)) if indices is None else indices:
+            try:
+                header = decode_response(self._call(i, 'GET', 'chains/main/blocks/head/header/shell'))
+            except (RpcError, requests.exceptions.RequestException) as e:
+                logger.debug('Node %s probe failed: %s', self.nodes[i].uri[0], e)
+            else:
+                with self._stats_lock:
+                    self._stats[i].head_level = int(header['level'])
+            finally:
+                self._probing.discard(i)
+
+    def _get_probe_executor(self) -> ThreadPoolExecutor:
+        with self._stats_lock:
+            if self._probe_executor is None:
+                # NOTE: probes are sequential and never compete with requests for workers
+                self._probe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rpc-probe')
+            return self._probe_executor
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._stats_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.hedge_workers, thread_name_prefix='rpc-hedge'
+                )
+            return self._hedge_executor
+
+    def _submit_attempt(self, i: int, path: str, **kwargs) -> Optional[Future]:
+        # NOTE: attempts are only submitted when there is an idle worker, so they never wait in the executor queue
+        if not self._hedge_slots.acquire(blocking=False):
+            return None
+        try:
+            future = self._get_hedge_executor().submit(self._call, i, 'GET', path, **kwargs)
+        except BaseException:
+            self._hedge_slots.release()
+            raise
+        future.add_done_callback(lambda _: self._hedge_slots.release())
+        return future
+
+    def _schedule_probes(self) -> None:
+        now = time.monotonic()
+        with self._stats_lock:
+            indices = [
+                i
+                for i, stats in enumerate(self._stats)
+                if stats.ejected_until is not None and not stats.ejected and i not in self._probing
+            ]
+            if self.probe_interval is not None and now - self._last_probe > self.probe_interval:
+                self._last_probe = now
+                indices = [i for i in range(len(self.nodes)) if i not in self._probing]
+            self._probing.update(indices)
+        if indices:
+            self._get_probe_executor().submit(self.probe, indices)
+
+    def _rank(self) -> List[int]:
+        with self._stats_lock:
+            levels = [stats.head_level for stats in self._stats if stats.head_level is not None]
+            min_level = max(levels) - self.max_lag if levels else None
+
+            def is_healthy(stats: NodeStats) -> bool:
+                if stats.ejected:
+                    return False
+                return min_level is None or stats.head_level is None or stats.head_level >= min_level
+
+            healthy = [i for i, stats in enumerate(self._stats) if is_healthy(stats)]
+            healthy.sort(key=lambda i: self._stats[i].score)
+            # NOTE: unhealthy nodes are still used as a last resort
+            rest = [i for i in range(len(self.nodes)) if i not in healthy]
+            rest.sort(key=lambda i: self._stats[i].ejected_until or 0)
+            return healthy + rest
+
+    def _call(self, i: int, method: str, path: str, **kwargs) -> requests.Response:
+        started_at = time.monotonic()
+        try:
+            res = self.nodes[i].request(method, path, **kwargs)
+        except (RpcError, requests.exceptions.RequestException) as e:
+            if _is_node_failure(e):
+                self._record_error(i)
+            else:
+                self._record_success(i, time.monotonic() - started_at)
+            raise
+        self._record_success(i, time.monotonic() - started_at)
         return res
+
+    def _record_success(self, i: int, latency: float) -> None:
+        with self._stats_lock:
+            self._stats[i].record_success(latency)
+
+    def _record_error(self, i: int) -> None:
+        with self._stats_lock:
+            stats = self._stats[i]
+            stats.record_error()
+            if stats.consecutive_errors >= self.eject_after and not stats.ejected:
+                logger.warning('Node %s is ejected for %s seconds', self.nodes[i].uri[0], self.eject_for)
+                stats.ejected_until = time.monotonic() + self.eject_for
+
+    def _failover(self, indices: List[int], method: str, path: str, error: Optional[Exception], **kwargs):
+        for i in indices:
+            if error is not None and self.retry_budget is not None and not self.retry_budget.withdraw():
+                logger.warning('Retry budget is exhausted, not failing over')
+                raise error
+            try:
+                return self._call(i, method, path, **kwargs)
+            except (RpcError, requests.exceptions.RequestException) as e:
+                if not _is_node_failure(e):
+                    raise
+                logger.debug('Node %s has failed, trying the next one', self.nodes[i].uri[0])
+                error = e
+        assert error
+        raise error
+
+    def _hedge(self, indices: List[int], path: str, **kwargs) -> requests.Response:
+        primary = self._submit_attempt(indices[0], path, **kwargs)
+        if primary is None:
+            # NOTE: client is saturated, hedging would only double the load
+            return self._failover(indices, 'GET', path, None, **kwargs)
+
+        pending = {primary}
+        tried = 1
+        done, _ = wait(pending, timeout=self.hedge_after)
+        if not done:
+            hedge = self._submit_attempt(indices[1], path, **kwargs)
+            if hedge is not None:
+                logger.debug('Node %s is slow, hedging request to %s', self.nodes[indices[0]].uri[0], path)
+                pending.add(hedge)
+                tried = 2
+
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    return future.result()
+                except (RpcError, requests.exceptions.RequestException) as e:
+                    if not _is_node_failure(e):
+                        raise
+                    error = e
+
+        return self._failover(indices[tried:], 'GET', path, error, **kwargs)
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+        self._schedule_probes()
+        indices = self._rank()
+        if self.hedge_after is not None and method == 'GET' and not kwargs.get('stream') and len(indices) > 1:
+            return self._hedge(indices, path, **kwargs)
+        return self._failover(indices, method, path, None, **kwargs)
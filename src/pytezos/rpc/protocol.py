@@ -1,7 +1,14 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from datetime import datetime
 from itertools import count
+from typing import Any
+from typing import Deque
+from typing import Generator
 from typing import Iterator
+from typing import List
+from typing import Optional
 
 import simple_bson as bson  # type: ignore
 import strict_rfc3339  # type: ignore
@@ -10,8 +17,11 @@ from pytezos.crypto.encoding import is_bh
 from pytezos.crypto.encoding import is_ogh
 from pytezos.jupyter import get_attr_docstring
 from pytezos.rpc.query import RpcQuery
+from pytezos.rpc.search import DEFAULT_FETCH_WORKERS
 from pytezos.rpc.search import BlockSliceQuery
 
+DEFAULT_BIG_MAP_PAGE_SIZE = 1000
+
 
 def to_timestamp(v):
     if isinstance(v, str):
@@ -196,6 +206,47 @@ class BigMapGetQuery(RpcQuery, path='/chains/{}/blocks/{}/context/contracts/{}/b
         return self._post(json=query)
 
 
+class BigMapQuery(RpcQuery, path='/chains/{}/blocks/{}/context/big_maps/{}'):
+    def __call__(self, offset: Optional[int] = None, length: Optional[int] = None) -> List[Any]:  # type: ignore
+        """Get the (optionally paginated) list of values in a big map.
+
+        Order of values is unspecified, but is guaranteed to be consistent.
+
+        :param offset: skip the first `offset` values
+        :param length: only retrieve `length` values
+        :returns: list of Micheline expressions
+        """
+        return super().__call__(offset=offset, length=length)
+
+    def values(
+        self,
+        page_size: int = DEFAULT_BIG_MAP_PAGE_SIZE,
+        workers: int = DEFAULT_FETCH_WORKERS,
+    ) -> Generator[Any, None, None]:
+        """Iterate over all values in a big map, fetching pages concurrently.
+
+        Pages are delivered in order, the number of pages in flight (hence memory) is bounded.
+
+        :param page_size: number of values per request
+        :param workers: number of concurrent requests
+        :returns: Generator (lazy) of Micheline expressions
+        """
+        offsets = count(0, page_size)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # NOTE: total size is unknown, so pages are requested speculatively until a short one is received
+            window: Deque = deque(executor.submit(self, next(offsets), page_size) for _ in range(workers))
+            try:
+                while window:
+                    page = window.popleft().result()
+                    yield from page
+                    if len(page) < page_size:
+                        break
+                    window.append(executor.submit(self, next(offsets), page_size))
+            finally:
+                for future in window:
+                    future.cancel()
+
+
 class ContextRawBytesQuery(RpcQuery, path='/chains/{}/blocks/{}/context/raw/bytes'):
     def __init__(self, *args, **kwargs):
         kwargs.update(timeout=60)
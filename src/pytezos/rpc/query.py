@@ -1,13 +1,17 @@
+import sys
+from functools import lru_cache
 from os.path import dirname
 
 from pytezos.jupyter import InlineDocstring
 from pytezos.jupyter import get_attr_docstring
 from pytezos.jupyter import get_class_docstring
-from pytezos.rpc.docs import rpc_docs
+from pytezos.rpc.metrics import RpcPath
 from pytezos.rpc.node import RpcNode
 
 
 def format_docstring(class_type, query_path):
+    from pytezos.rpc.docs import rpc_docs  # NOTE: large table, loaded on first docstring access
+
     res = ['']
     methods = {
         'GET': '()',
@@ -56,24 +60,53 @@ def format_docstring(class_type, query_path):
     return '\n'.join(res)
 
 
+@lru_cache(maxsize=None)
+def _get_docstring(class_type, query_path):
+    return format_docstring(class_type, query_path)
+
+
+@lru_cache(maxsize=4096)
+def _join_path(wild_path: str, name: str) -> str:
+    # NOTE: path templates are interned, so that extension lookup and docstring cache hit by identity
+    return sys.intern(f'{wild_path}/{name}')
+
+
+class QueryDocstring(str):
+    """Instance docstring generated on first access (`help()`, `__repr__`), shared by queries with the same path.
+
+    Class-level access returns the class docstring as is (it is also the string value, for tools reading raw `__dict__`).
+    """
+
+    def __new__(cls, doc):
+        res = super().__new__(cls, doc or '')
+        res.doc = doc
+        return res
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.doc
+        return _get_docstring(owner, instance._wild_path or '/')
+
+
 class RpcQuery(metaclass=InlineDocstring):
     __extensions__ = {}  # type: ignore
+    __doc__ = QueryDocstring(None)  # type: ignore
 
     @classmethod
     def __init_subclass__(cls, path: str = '', **kwargs):
         super().__init_subclass__(**kwargs)  # type: ignore
+        cls.__doc__ = QueryDocstring(cls.__dict__.get('__doc__'))  # type: ignore
         if isinstance(path, list):
             for sub_path in path:
-                cls.__extensions__[sub_path] = cls
+                cls.__extensions__[sys.intern(sub_path)] = cls
         else:
-            cls.__extensions__[path] = cls
+            cls.__extensions__[sys.intern(path)] = cls
 
     def __init__(self, node: RpcNode, path: str = '', params=None, timeout=None):
         self.node = node
         self._wild_path = path
         self._timeout = timeout
         self._params = params or []
-        self.__doc__ = format_docstring(self.__class__, self._wild_path or '/')
 
     def __repr__(self):
         res = [
@@ -95,7 +128,7 @@ class RpcQuery(metaclass=InlineDocstring):
 
     @property
     def path(self):
-        return self._wild_path.format(*self._params)
+        return RpcPath(self._wild_path.format(*self._params), self._wild_path)
 
     def __call__(self, **params):
         return self.node.get(
@@ -103,8 +136,17 @@ class RpcQuery(metaclass=InlineDocstring):
             params=params,
         )
 
+    def get_bytes(self, **params) -> bytes:
+        """Get raw response body without decoding, e.g. to forward it as is."""
+        return self.node.get(
+            path=self.path,
+            params=params,
+            timeout=self._timeout,
+            raw=True,
+        )
+
     def _getitem(self, item):
-        return self._spawn_query(wild_path=self._wild_path + '/{}', params=self._params + [item])
+        return self._spawn_query(wild_path=_join_path(self._wild_path, '{}'), params=self._params + [item])
 
     def __getattr__(self, attr):
         if not attr.startswith('_'):
@@ -112,7 +154,7 @@ class RpcQuery(metaclass=InlineDocstring):
                 return self._getitem(attr)
             else:
                 return self._spawn_query(
-                    wild_path=f'{self._wild_path}/{attr}',
+                    wild_path=_join_path(self._wild_path, attr),
                     params=self._params,
                 )
         raise AttributeError(attr)
@@ -1,14 +1,66 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from threading import Lock
+from time import sleep
 from typing import Any
 from typing import Callable
+from typing import Deque
+from typing import Dict
 from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import Optional
 from typing import Tuple
 
+import requests
+
 from pytezos.crypto.encoding import is_bh
 from pytezos.jupyter import get_attr_docstring
 from pytezos.logging import logger
 from pytezos.rpc.node import RpcError
 from pytezos.rpc.query import RpcQuery
 
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_FETCH_RETRIES = 3
+FETCH_BACKOFF_FACTOR = 0.5
+
+
+class ProbeCache:
+    """Thread-safe memoized state getter, lets interval walking and bisection share probed levels.
+
+    :param get: function returning state at the given level
+    """
+
+    def __init__(self, get: Callable) -> None:
+        self._get = get
+        self._values: Dict[int, Any] = {}
+        self._lock = Lock()
+
+    def __call__(self, level: int) -> Any:
+        with self._lock:
+            if level in self._values:
+                return self._values[level]
+        value = self._get(level)
+        with self._lock:
+            self._values[level] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+def _memoize(get: Callable) -> ProbeCache:
+    return get if isinstance(get, ProbeCache) else ProbeCache(get)
+
+
+def _probe(get: Callable, levels: List[int], workers: int) -> List[Any]:
+    if workers <= 1 or len(levels) <= 1:
+        return [get(level) for level in levels]
+    with ThreadPoolExecutor(max_workers=min(workers, len(levels))) as executor:
+        return list(executor.map(get, levels))
+
 
 def find_state_change_intervals(
     head: int,
@@ -16,18 +68,23 @@ def find_state_change_intervals(
     get: Callable,
     equals: Callable,
     step=60,
+    workers: int = 1,
 ) -> Generator:
+    get = _memoize(get)
     succ_value = get(head)
-    logger.debug('%s at head %s' % succ_value, head)
+    logger.debug('%s at head %s', succ_value, head)
 
-    for level in range(head - step, last, -step):
-        value = get(level)
-        logger.debug('%s at level %s' % value, level)
+    levels = list(range(head - step, last, -step))
+    # NOTE: in parallel mode probe next `workers` levels at once, the last batch may be wasted
+    for i in range(0, len(levels), max(1, workers)):
+        batch = levels[i : i + max(1, workers)]
+        for level, value in zip(batch, _probe(get, batch, workers)):
+            logger.debug('%s at level %s', value, level)
 
-        if not equals(value, succ_value):
-            logger.debug('%s -> %s at (%s, {level + step})' % value, succ_value, level)
-            yield level + step, succ_value, level, value
-            succ_value = value
+            if not equals(value, succ_value):
+                logger.debug('%s -> %s at (%s, %s)', value, succ_value, level, level + step)
+                yield level + step, succ_value, level, value
+                succ_value = value
 
 
 def find_state_change(
@@ -36,21 +93,33 @@ def find_state_change(
     get: Callable,
     equals: Callable,
     pred_value: Any,
+    workers: int = 1,
 ) -> (int, Any):  # type: ignore
-    def bisect(start: int, end: int):
-        if end == start + 1:
-            return end, get(end)
-
-        level = (end + start) // 2
-        value = get(level)
-        logger.debug('%s at level %s' % value, level)
-
-        if equals(value, pred_value):
-            return bisect(level, end)
-        else:
-            return bisect(start, level)
+    """Find the first level in (last, head] where state differs from `pred_value`.
+
+    :param head: upper bound, state is expected to be changed there
+    :param last: lower bound, state is expected to be equal to `pred_value` there
+    :param get: function returning state at the given level
+    :param equals: state comparator
+    :param pred_value: state at `last`
+    :param workers: number of levels probed concurrently per round (k-ary search), 1 means bisection
+    :returns: tuple (level, value)
+    """
+    get = _memoize(get)
+    start, end = last, head
+    while end > start + 1:
+        k = min(max(1, workers), end - start - 1)
+        levels = sorted({start + (end - start) * (i + 1) // (k + 1) for i in range(k)})
+        values = _probe(get, levels, workers)
+        for level, value in zip(levels, values):
+            logger.debug('%s at level %s', value, level)
+            if equals(value, pred_value):
+                start = level
+            else:
+                end = level
+                break
 
-    return bisect(last, head)
+    return end, get(end)
 
 
 def walk_state_change_interval(
@@ -60,12 +129,15 @@ def walk_state_change_interval(
     equals: Callable,
     head_value: Any,
     last_value: Any,
+    workers: int = 1,
 ) -> Generator:
+    get = _memoize(get)
     level = last
     value = last_value
     while not equals(value, head_value):
-        level, value = find_state_change(head, level, get, equals, pred_value=value)
-        logger.debug('%s -> %s at %s' % last_value, value, level)
+        pred_value = value
+        level, value = find_state_change(head, level, get, equals, pred_value=value, workers=workers)
+        logger.debug('%s -> %s at %s', pred_value, value, level)
         yield level, value
 
 
@@ -75,8 +147,10 @@ def find_state_changes(
     get: Callable,
     equals: Callable,
     step=60,
+    workers: int = 1,
 ) -> Generator:
-    state_change_intervals = find_state_change_intervals(head, last, get, equals, step)
+    get = _memoize(get)
+    state_change_intervals = find_state_change_intervals(head, last, get, equals, step, workers)
     for int_head, int_head_value, int_tail, int_last_value in state_change_intervals:
         yield from walk_state_change_interval(
             int_head,
@@ -85,6 +159,7 @@ def find_state_changes(
             equals,
             head_value=int_head_value,
             last_value=int_last_value,
+            workers=workers,
         )
 
 
@@ -145,10 +220,72 @@ class BlockSliceQuery(RpcQuery):
 
         return get_level(self._start), get_level(self._stop)
 
-    def find_proposal_injection(self, proposal_id):
+    def _fetch_block(self, level: int, parts: Iterable[str], retries: int) -> Dict[str, Any]:
+        for attempt in range(retries + 1):
+            try:
+                block = self._getitem(level)
+                res = {'level': level}
+                for part in parts:
+                    res[part] = reduce(getattr, part.split('.'), block)()
+                return res
+            except (RpcError, requests.exceptions.RequestException) as e:
+                if attempt == retries:
+                    raise
+                logger.warning('Failed to fetch block %s (attempt %d/%d): %s', level, attempt + 1, retries, e)
+                sleep(FETCH_BACKOFF_FACTOR * 2**attempt)
+        raise AssertionError('unreachable')
+
+    def fetch(
+        self,
+        parts: Iterable[str] = ('header', 'operations'),
+        workers: int = DEFAULT_FETCH_WORKERS,
+        retries: int = DEFAULT_FETCH_RETRIES,
+        checkpoint: Optional[str] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Download blocks in this range concurrently, yield them one by one in ascending order.
+
+        :param parts: block endpoints to fetch, e.g. `header`, `operations`, `metadata`, `context.constants`
+        :param workers: number of concurrent requests
+        :param retries: number of retries for a failed block
+        :param checkpoint: path to a file storing the last processed level, used to resume after interruption
+        :returns: Generator (lazy) of dicts `{'level': <level>, <part>: <response>, ...}`
+        """
+        parts = list(parts)
+        start, stop = self.get_range()
+        if checkpoint and os.path.exists(checkpoint):
+            with open(checkpoint) as f:
+                start = max(start, int(f.read().strip()) + 1)
+            logger.info('Resuming from level %d', start)
+
+        levels = iter(range(start, stop + 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # NOTE: keep a bounded window of requests in flight, deliver in order
+            window: Deque = deque()
+            for level in levels:
+                window.append(executor.submit(self._fetch_block, level, parts, retries))
+                if len(window) >= workers * 2:
+                    break
+
+            try:
+                while window:
+                    block = window.popleft().result()
+                    next_level = next(levels, None)
+                    if next_level is not None:
+                        window.append(executor.submit(self._fetch_block, next_level, parts, retries))
+                    yield block
+                    if checkpoint:
+                        with open(f'{checkpoint}.tmp', 'w') as f:
+                            f.write(str(block['level']))
+                        os.replace(f'{checkpoint}.tmp', checkpoint)
+            finally:
+                for future in window:
+                    future.cancel()
+
+    def find_proposal_injection(self, proposal_id, workers: int = 1):
         """Find proposal injection.
 
         :param proposal_id: Proposal hash (base58)
+        :param workers: number of levels probed concurrently
         """
         last, head = self.get_range()
         level, _ = find_state_change(
@@ -157,15 +294,17 @@ class BlockSliceQuery(RpcQuery):
             get=lambda x: self._getitem(x).votes.proposals[proposal_id](),
             equals=lambda x, y: x == y,
             pred_value=0,
+            workers=workers,
         )
         votes = self._getitem(level).operations.find_votes(proposal_id)
         assert len(votes) == 1
         return votes
 
-    def find_upvotes(self, proposal_id) -> Generator:
+    def find_upvotes(self, proposal_id, workers: int = 1) -> Generator:
         """Find upvoting operations for the given proposal.
 
         :param proposal_id: Proposal hash (base58)
+        :param workers: number of levels probed concurrently
         :returns: Generator (lazy)
         """
         last, head = self.get_range()
@@ -174,13 +313,15 @@ class BlockSliceQuery(RpcQuery):
             last=last,
             get=lambda x: self._getitem(x).votes.proposals[proposal_id](),
             equals=lambda x, y: x == y,
+            workers=workers,
         )
         for level, _ in state_changes:
             yield from self._getitem(level).operations.find_upvotes(proposal_id)
 
-    def find_ballots(self) -> Generator:
+    def find_ballots(self, workers: int = 1) -> Generator:
         """Find ballot operations for the current period.
 
+        :param workers: number of levels probed concurrently
         :returns: Generator (lazy)
         """
         last, head = self.get_range()
@@ -189,14 +330,16 @@ class BlockSliceQuery(RpcQuery):
             last=last,
             get=lambda x: self._getitem(x).votes.ballots(),
             equals=lambda x, y: x == y,
+            workers=workers,
         )
         for level, _ in state_changes:
             yield from self._getitem(level).operations.find_ballots()
 
-    def find_origination(self, contract_id):
+    def find_origination(self, contract_id, workers: int = 1):
         """Find contract origination.
 
         :param contract_id: Contract ID (KT-address)
+        :param workers: number of levels probed concurrently
         """
 
         def get_counter(x):
@@ -211,6 +354,7 @@ class BlockSliceQuery(RpcQuery):
             get=get_counter,
             equals=lambda x, y: x == y,
             pred_value=None,
+            workers=workers,
         )
         return self._getitem(level).operations.find_origination(contract_id)
 
@@ -227,7 +371,7 @@ class BlockSliceQuery(RpcQuery):
             levels = range(last, head + 1, 1)
 
         for block_level in levels:
-            logger.debug(f'Looking for operation %s in block %s...' % (operation_group_hash, block_level))
+            logger.debug('Looking for operation %s in block %s...', operation_group_hash, block_level)
             try:
                 return self._getitem(block_level).operations[operation_group_hash]()
             except StopIteration:
@@ -3,15 +3,16 @@ from datetime import datetime
 from datetime import timezone
 from functools import cached_property
 from functools import lru_cache
+from time import monotonic
 from time import sleep
 from typing import Any
 from typing import Dict
 from typing import Generator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import requests
-import simplejson as json
 from deprecation import deprecated  # type: ignore
 
 from pytezos.crypto.encoding import base58_decode
@@ -23,6 +24,13 @@ from pytezos.rpc.protocol import BlocksQuery
 from pytezos.rpc.query import RpcQuery
 from pytezos.rpc.search import CyclesQuery
 from pytezos.rpc.search import VotingPeriodsQuery
+from pytezos.rpc.stream import DEFAULT_MAX_BUFFER
+from pytezos.rpc.stream import JsonStream
+from pytezos.rpc.watch import HEADS
+from pytezos.rpc.watch import MEMPOOL
+from pytezos.rpc.watch import ChainTracker
+from pytezos.rpc.watch import Subscription
+from pytezos.rpc.watch import get_chain_monitor
 
 MAX_BLOCK_TIMEOUT = 86400
 
@@ -84,6 +92,7 @@ class ShellQuery(RpcQuery, path=''):
         yield_current=False,
         time_between_blocks: Optional[int] = None,
         block_timeout: Optional[int] = None,
+        monitor: bool = False,
     ) -> Generator[str, None, None]:
         """Iterates over future blocks (waits and yields block hash), handles reorgs
 
@@ -92,15 +101,31 @@ class ShellQuery(RpcQuery, path=''):
         :param yield_current: yield current block hash at the very beginning
         :param time_between_blocks: override protocol constant
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param monitor: follow `/monitor/heads/main` instead of polling the head, the stream is shared by all \
+            waiters using the same node
         :return: block hashes
         """
+        if block_timeout is None:
+            block_timeout = MAX_BLOCK_TIMEOUT
+
+        if monitor:
+            if yield_current:
+                yield current_block_hash
+            if max_blocks <= 0:
+                return
+            with get_chain_monitor(self.node).subscribe() as subscription:
+                max_level = self.blocks[current_block_hash].header()['level'] + max_blocks
+                for _, head in self._monitor_heads(subscription, current_block_hash, block_timeout):
+                    logger.info('Current level: %d (max %d)', head['level'], max_level)
+                    yield head['hash']
+                    if head['level'] >= max_level:
+                        return
+            return
+
         if time_between_blocks is None:
             constants = self.blocks[current_block_hash].context.constants()
             time_between_blocks = int(constants.get('minimal_block_delay', 0))
 
-        if block_timeout is None:
-            block_timeout = MAX_BLOCK_TIMEOUT
-
         if yield_current:
             yield current_block_hash
 
@@ -144,6 +169,7 @@ class ShellQuery(RpcQuery, path=''):
         current_block_hash: Optional[str] = None,
         time_between_blocks: Optional[int] = None,
         block_timeout: Optional[int] = None,
+        monitor: bool = False,
     ) -> List[dict]:
         """Wait for one or many operations gain enough confirmations
 
@@ -153,8 +179,19 @@ class ShellQuery(RpcQuery, path=''):
         :param current_block_hash: current block hash (head)
         :param time_between_blocks: override protocol constant
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param monitor: follow `/monitor/heads/main` and `mempool/monitor_operations` streams shared by all waiters \
+            using the same node instead of polling; inclusions reverted by reorgs are tracked again, operations \
+            rejected by the mempool stop waiting immediately
         :return: list of operation contents with metadata
         """
+        if monitor:
+            return self._monitor_operations(
+                opg_hashes=opg_hashes,
+                ttl=ttl,
+                min_confirmations=min_confirmations,
+                current_block_hash=current_block_hash,
+                block_timeout=block_timeout,
+            )
 
         confirmations = {}
         pending = set(opg_hashes)
@@ -216,6 +253,74 @@ class ShellQuery(RpcQuery, path=''):
 
         return operations
 
+    def _monitor_heads(
+        self, subscription: Subscription, current_block_hash: str, block_timeout: float
+    ) -> Generator[Tuple[str, Any], None, None]:
+        last_seen = monotonic()
+        while True:
+            timeout = last_seen + block_timeout - monotonic()
+            try:
+                stream, value = subscription.get(timeout=timeout)
+            except TimeoutError as e:
+                raise TimeoutError(f'Reached timeout ({block_timeout} sec) while waiting for the next block') from e
+            if value is None:
+                return
+            if stream == HEADS:
+                if value['hash'] == current_block_hash:
+                    continue
+                logger.info('Found new block %s (%d sec delay)', value['hash'], monotonic() - last_seen)
+                current_block_hash, last_seen = value['hash'], monotonic()
+            yield stream, value
+
+    def _monitor_operations(
+        self,
+        opg_hashes: List[str],
+        ttl: int,
+        min_confirmations: int,
+        current_block_hash: Optional[str] = None,
+        block_timeout: Optional[int] = None,
+    ) -> List[dict]:
+        tracker = ChainTracker(self, opg_hashes)
+        with get_chain_monitor(self.node).subscribe(mempool=True) as subscription:
+            header = self.blocks[current_block_hash].header() if current_block_hash else self.head.header()
+            max_level = header['level'] + ttl
+            tracker.apply(header)
+
+            def is_confirmed() -> bool:
+                return tracker.included and all(
+                    tracker.confirmations(x) >= min_confirmations for x in tracker.opg_hashes
+                )
+
+            if not is_confirmed():
+                events = self._monitor_heads(subscription, header['hash'], block_timeout or MAX_BLOCK_TIMEOUT)
+                for stream, value in events:
+                    if stream == MEMPOOL:
+                        tracker.apply_mempool(value)
+                        if tracker.rejections:
+                            opg_hash, errors = next(iter(tracker.rejections.items()))
+                            raise StopIteration(f'Operation {opg_hash} is rejected by mempool: {errors}')
+                        continue
+                    tracker.apply(value)
+                    for opg_hash in tracker.inclusions:
+                        logger.info(
+                            'Operation %s has %d/%d confirmations',
+                            opg_hash,
+                            tracker.confirmations(opg_hash),
+                            min_confirmations,
+                        )
+                    if is_confirmed():
+                        break
+                    if not tracker.included and tracker.head_level >= max_level:  # type: ignore
+                        break
+
+        if not tracker.included:
+            raise StopIteration(
+                'Only %d of %d operations were included, stopping' % (len(tracker.inclusions), len(tracker.opg_hashes))
+            )
+        if not is_confirmed():
+            raise StopIteration('Stream has ended before operations got enough confirmations')
+        return tracker.get_operations()
+
     @deprecated(deprecated_in='3.2.2', removed_in='4.0.0', details=f'Use wait_blocks() instead')
     def wait_next_block(
         self,
@@ -472,18 +577,17 @@ class ProtocolInjectionQuery(RpcQuery, path='/injection/protocol'):
         )
 
 
-class ResponseGenerator:
-    def __init__(self, res: requests.Response):
-        self._lines = res.iter_lines()
+class ResponseGenerator(JsonStream):
+    """Iterate over JSON values of an already opened streaming response."""
 
-    def __iter__(self):
-        for line in self._lines:
-            yield json.loads(line.decode())
+    def __init__(self, res: requests.Response):
+        super().__init__(lambda: res.iter_content(chunk_size=None), reconnect=False)
 
 
 class MonitorQuery(
     RpcQuery,
     path=[
+        '/chains/{}/mempool/monitor_operations',
         '/monitor/active_chains',
         '/monitor/bootstrapped',
         '/monitor/commit_hash',
@@ -492,14 +596,17 @@ class MonitorQuery(
         '/monitor/valid_blocks',
     ],
 ):
-    def __call__(self, *args, **kwargs):
-        return ResponseGenerator(
-            self.node.request(
-                method='GET',
-                path=self.path,
-                params=kwargs,
-                stream=True,
-            )
+    def __call__(self, reconnect=True, max_buffer=DEFAULT_MAX_BUFFER, **kwargs):
+        """Subscribe to the stream, works with both sync and async nodes (`for` and `async for` respectively).
+
+        :param reconnect: reconnect on connection errors, skip values already seen
+        :param max_buffer: maximum size of a single value (bytes)
+        :param kwargs: query parameters
+        """
+        return JsonStream(
+            lambda: self.node.stream(self.path, params=kwargs),
+            reconnect=reconnect,
+            max_buffer=max_buffer,
         )
 
     def __repr__(self):
@@ -523,11 +630,5 @@ class NetworkItems(RpcQuery, path=['/network/peers', '/network/points']):
 class NetworkLogQuery(RpcQuery, path=['/network/peers/{}/log', '/network/points/{}/log']):
     def __call__(self, monitor=False):
         if monitor:
-            return ResponseGenerator(
-                self.node.request(
-                    method='GET',
-                    path=self.path,
-                    stream=True,
-                )
-            )
+            return JsonStream(lambda: self.node.stream(self.path))
         return self._get()
@@ -0,0 +1,254 @@
+import asyncio
+import re
+from collections import deque
+from time import sleep
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Deque
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Union
+
+import requests
+
+from pytezos.logging import logger
+from pytezos.rpc.codec import loads
+
+DEFAULT_MAX_BUFFER = 64 * 1024 * 1024
+DEFAULT_RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 60.0
+DEDUPE_WINDOW = 10000
+
+_NON_WHITESPACE = re.compile(rb'[^ \t\r\n]')
+_SCALAR_END = re.compile(rb'[ \t\r\n\[\]{}"]')
+_STRUCTURAL = re.compile(rb'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+STREAM_ERRORS: tuple = (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError)
+
+
+def get_async_stream_errors() -> tuple:
+    # NOTE: aiohttp is imported only when async transport is actually used
+    import aiohttp  # type: ignore
+
+    return (aiohttp.ClientError, asyncio.TimeoutError)
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class JsonStreamDecoder:
+    """Incremental decoder for a sequence of JSON values split into arbitrary chunks.
+
+    Value boundaries are located by scanning only the newly received bytes, each value is parsed exactly once.
+
+    :param max_buffer: maximum size of a single incomplete value (bytes)
+    """
+
+    def __init__(self, max_buffer: int = DEFAULT_MAX_BUFFER) -> None:
+        self.max_buffer = max_buffer
+        self._buffer = bytearray()
+        self._pos = 0
+        self._start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume next chunk, return all values completed by it."""
+        buf = self._buffer
+        buf += chunk
+        values = []
+        pos, end = self._pos, len(buf)
+
+        while pos < end:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                    pos += 1
+                    continue
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.end()
+                if buf[match.start()] == 0x5C:  # backslash
+                    self._escaped = True
+                    continue
+                self._in_string = False
+                if self._depth > 0:
+                    continue
+            elif self._start is None:
+                match = _NON_WHITESPACE.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = self._start = match.start()
+                char = buf[pos]
+                if char in b'{[':
+                    self._depth = 1
+                    pos += 1
+                    continue
+                if char == 0x22:  # quote
+                    self._in_string = True
+                    pos += 1
+                    continue
+                match = _SCALAR_END.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.start()
+            elif self._depth == 0:
+                # NOTE: continuation of a top-level scalar split between chunks
+                match = _SCALAR_END.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.start()
+            else:
+                match = _STRUCTURAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.end()
+                char = buf[match.start()]
+                if char == 0x22:
+                    self._in_string = True
+                    continue
+                if char in b'{[':
+                    self._depth += 1
+                    continue
+                self._depth -= 1
+                if self._depth > 0:
+                    continue
+
+            values.append(loads(buf[self._start : pos]))
+            self._start = None
+
+        if self._start is None:
+            del buf[:pos]
+            pos = 0
+        elif self._start > 0:
+            del buf[: self._start]
+            pos -= self._start
+            self._start = 0
+        self._pos = pos
+
+        if len(buf) > self.max_buffer:
+            raise JsonStreamError(f'Stream value exceeds buffer limit ({self.max_buffer} bytes)')
+        return values
+
+    def flush(self) -> List[Any]:
+        """Finish the stream: decode trailing scalar if any, fail on incomplete value."""
+        if self._start is None:
+            return []
+        if self._depth > 0 or self._in_string:
+            raise JsonStreamError('Stream ended in the middle of a value')
+        value = loads(self._buffer[self._start :])
+        self._buffer.clear()
+        self._start, self._pos = None, 0
+        return [value]
+
+
+class JsonStream:
+    """Iterable over JSON values sent by a streaming (monitor) endpoint, supports both `for` and `async for`.
+
+    :param open_stream: callable opening a new connection, returns (async) iterator of raw chunks
+    :param reconnect: reopen the stream on connection errors
+    :param max_buffer: maximum size of a single value (bytes)
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[], Union[Iterator[bytes], AsyncIterator[bytes]]],
+        reconnect: bool = True,
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+    ) -> None:
+        self._open_stream = open_stream
+        self.reconnect = reconnect
+        self.max_buffer = max_buffer
+        self._seen: Set[str] = set()
+        self._seen_order: Deque[str] = deque()
+        self._resumed = False
+
+    def _remember(self, key: str) -> bool:
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self._seen_order.append(key)
+        if len(self._seen_order) > DEDUPE_WINDOW:
+            self._seen.discard(self._seen_order.popleft())
+        return True
+
+    def _resume(self, value: Any) -> Any:
+        # NOTE: after reconnect node sends current state again (head, pending operations), items that were already
+        # yielded are skipped until the first new one, after that values are passed through as is
+        if isinstance(value, dict) and isinstance(value.get('hash'), str):
+            keys = [value['hash']]
+        elif (
+            isinstance(value, list)
+            and value
+            and all(isinstance(x, dict) and isinstance(x.get('hash'), str) for x in value)
+        ):
+            keys = [x['hash'] for x in value]
+        else:
+            self._resumed = False
+            return value
+
+        is_new = [self._remember(key) for key in keys]
+        if not self._resumed:
+            return value
+        if any(is_new):
+            self._resumed = False
+        if isinstance(value, dict):
+            return value if is_new[0] else None
+        return [x for x, new in zip(value, is_new) if new] or None
+
+    def _on_error(self, error: Exception, delay: float) -> float:
+        if not self.reconnect:
+            raise error
+        logger.warning('Stream is interrupted (%s), reconnecting in %s seconds', error, delay)
+        self._resumed = True
+        return min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def __iter__(self) -> Iterator[Any]:
+        delay = DEFAULT_RECONNECT_DELAY
+        while True:
+            decoder = JsonStreamDecoder(self.max_buffer)
+            try:
+                for chunk in self._open_stream():  # type: ignore
+                    for value in decoder.feed(chunk):
+                        delay = DEFAULT_RECONNECT_DELAY
+                        value = self._resume(value)
+                        if value is not None:
+                            yield value
+                yield from decoder.flush()
+                return
+            except STREAM_ERRORS as e:
+                next_delay = self._on_error(e, delay)
+            sleep(delay)
+            delay = next_delay
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        stream_errors = get_async_stream_errors()
+        delay = DEFAULT_RECONNECT_DELAY
+        while True:
+            decoder = JsonStreamDecoder(self.max_buffer)
+            try:
+                async for chunk in self._open_stream():  # type: ignore
+                    for value in decoder.feed(chunk):
+                        delay = DEFAULT_RECONNECT_DELAY
+                        value = self._resume(value)
+                        if value is not None:
+                            yield value
+                for value in decoder.flush():
+                    yield value
+                return
+            except stream_errors as e:
+                next_delay = self._on_error(e, delay)
+            await asyncio.sleep(delay)
+            delay = next_delay
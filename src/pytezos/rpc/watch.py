@@ -0,0 +1,277 @@
+import threading
+import weakref
+from queue import Empty
+from queue import Queue
+from time import sleep
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pytezos.logging import logger
+
+MAX_TRACKED_DEPTH = 120
+HEADS = 'heads'
+MEMPOOL = 'mempool'
+# NOTE: node closes the mempool stream on every new head, reopening immediately would spin if it keeps failing
+MEMPOOL_REOPEN_DELAY = 0.5
+MEMPOOL_FLAGS = {
+    'validated': 'true',
+    'refused': 'true',
+    'outdated': 'true',
+    'branch_refused': 'false',
+    'branch_delayed': 'false',
+}
+
+
+class Subscription:
+    """Events received by a single waiter from the shared streams, see :class:`ChainMonitor`.
+
+    Every event is a `(stream, value)` tuple, where value is a block header for `heads`, a list of operations for
+    `mempool`, or None if the stream has ended.
+    """
+
+    def __init__(self, monitor: 'ChainMonitor', streams: Tuple[str, ...]) -> None:
+        self.monitor = monitor
+        self.streams = streams
+        self.queue: Queue = Queue()
+
+    def __enter__(self) -> 'Subscription':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get(self, timeout: float) -> Tuple[str, Any]:
+        """Wait for the next event.
+
+        :param timeout: maximum time to wait (seconds)
+        :raises TimeoutError: nothing was received in time
+        """
+        try:
+            stream, value = self.queue.get(timeout=max(timeout, 0))
+        except Empty as e:
+            raise TimeoutError(f'Nothing was received within {timeout:.1f} sec') from e
+        if isinstance(value, Exception):
+            raise value
+        return stream, value
+
+    def close(self) -> None:
+        self.monitor.unsubscribe(self)
+
+
+class ChainMonitor:
+    """Shared subscription to `/monitor/heads/main` and `/chains/main/mempool/monitor_operations` of a node.
+
+    Each stream is opened once however many waiters follow it and is read in a background thread broadcasting values
+    to all subscribers; the stream is closed once a value arrives and nobody is subscribed anymore.
+
+    :param node: RpcNode instance
+    """
+
+    def __init__(self, node) -> None:
+        self._node = weakref.ref(node)
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, List[Subscription]] = {HEADS: [], MEMPOOL: []}
+        self._readers: Dict[str, threading.Thread] = {}
+        self._last_head: Optional[dict] = None
+
+    def subscribe(self, mempool: bool = False) -> Subscription:
+        """Start receiving new heads (and mempool operations), use as a context manager.
+
+        :param mempool: also receive operations entering or rejected by the mempool
+        """
+        subscription = Subscription(self, (HEADS, MEMPOOL) if mempool else (HEADS,))
+        with self._lock:
+            for stream in subscription.streams:
+                self._subscriptions[stream].append(subscription)
+                if stream not in self._readers:
+                    self._readers[stream] = reader = threading.Thread(
+                        target=self._read,
+                        args=(stream,),
+                        name=f'pytezos-monitor-{stream}',
+                        daemon=True,
+                    )
+                    reader.start()
+                elif stream == HEADS and self._last_head is not None:
+                    # NOTE: stream is already running, so the current head won't be sent again
+                    subscription.queue.put((HEADS, self._last_head))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for stream in subscription.streams:
+                if subscription in self._subscriptions[stream]:
+                    self._subscriptions[stream].remove(subscription)
+
+    def _broadcast(self, stream: str, value: Any) -> bool:
+        with self._lock:
+            subscriptions = self._subscriptions[stream]
+            if not subscriptions:
+                self._stop(stream)
+                return False
+            if stream == HEADS:
+                self._last_head = value
+            for subscription in subscriptions:
+                subscription.queue.put((stream, value))
+            return True
+
+    def _stop(self, stream: str) -> None:
+        if self._readers.get(stream) is threading.current_thread():
+            del self._readers[stream]
+            if stream == HEADS:
+                self._last_head = None
+
+    def _open(self, stream: str) -> Optional[Generator[Any, None, None]]:
+        node = self._node()
+        if node is None:
+            return None
+        from pytezos.rpc.shell import ShellQuery
+
+        shell = ShellQuery(node)
+        if stream == HEADS:
+            return iter(shell.monitor.heads.main())  # type: ignore
+        return iter(shell.mempool.monitor_operations(**MEMPOOL_FLAGS))  # type: ignore
+
+    def _read(self, stream: str) -> None:
+        try:
+            while True:
+                values = self._open(stream)
+                if values is None:
+                    return
+                try:
+                    for value in values:
+                        if not self._broadcast(stream, value):
+                            return
+                finally:
+                    values.close()
+                if stream == HEADS:
+                    self._broadcast(stream, None)
+                    return
+                with self._lock:
+                    if not self._subscriptions[stream]:
+                        self._stop(stream)
+                        return
+                sleep(MEMPOOL_REOPEN_DELAY)
+        except Exception as e:
+            logger.debug('%s stream has failed: %s', stream, e)
+            self._broadcast(stream, e)
+        finally:
+            with self._lock:
+                self._stop(stream)
+
+
+_monitors: 'weakref.WeakKeyDictionary[Any, ChainMonitor]' = weakref.WeakKeyDictionary()
+_monitors_lock = threading.Lock()
+
+
+def get_chain_monitor(node) -> ChainMonitor:
+    """Get monitor shared by all waiters using the same node.
+
+    :param node: RpcNode instance
+    """
+    with _monitors_lock:
+        monitor = _monitors.get(node)
+        if monitor is None:
+            monitor = _monitors[node] = ChainMonitor(node)
+        return monitor
+
+
+class ChainTracker:
+    """Follows the main chain head by head, tracks inclusion of operation groups and handles reorgs.
+
+    :param shell: ShellQuery instance
+    :param opg_hashes: operation group hashes to track
+    :param max_depth: number of recent blocks to keep for reorg detection
+    """
+
+    def __init__(self, shell, opg_hashes: Iterable[str], max_depth: int = MAX_TRACKED_DEPTH) -> None:
+        self.shell = shell
+        self.opg_hashes = set(opg_hashes)
+        self.max_depth = max_depth
+        self.blocks: Dict[int, str] = {}
+        self.inclusions: Dict[str, Tuple[int, str, int, int]] = {}
+        self.rejections: Dict[str, Any] = {}
+        self.head_level: Optional[int] = None
+
+    def apply(self, head: dict) -> List[str]:
+        """Apply new head (a header, e.g. from `/monitor/heads/main`).
+
+        Missing blocks are fetched, blocks orphaned by a reorg are rolled back along with inclusions.
+
+        :param head: block header, `hash`, `level` and `predecessor` fields are required
+        :returns: list of new block hashes in ascending order
+        """
+        level, block_hash, predecessor = head['level'], head['hash'], head['predecessor']
+        if self.blocks.get(level) == block_hash and level == self.head_level:
+            return []
+
+        branch = [(level, block_hash)]
+        while self.blocks and level - 1 >= min(self.blocks) and self.blocks.get(level - 1) != predecessor:
+            header = self.shell.blocks[predecessor].header()
+            level, block_hash, predecessor = header['level'], header['hash'], header['predecessor']
+            branch.append((level, block_hash))
+
+        fork_level = branch[-1][0]
+        for orphan_level in sorted(lvl for lvl in self.blocks if lvl >= fork_level):
+            orphan_hash = self.blocks.pop(orphan_level)
+            logger.info('Block %s at level %d is orphaned', orphan_hash, orphan_level)
+            for opg_hash, inclusion in list(self.inclusions.items()):
+                if inclusion[1] == orphan_hash:
+                    logger.info('Operation %s is reverted by reorg', opg_hash)
+                    del self.inclusions[opg_hash]
+
+        branch.reverse()
+        for level, block_hash in branch:
+            self._apply_block(level, block_hash)
+
+        self.head_level = branch[-1][0]
+        for old_level in [lvl for lvl in self.blocks if lvl <= self.head_level - self.max_depth]:
+            del self.blocks[old_level]
+        return [block_hash for _, block_hash in branch]
+
+    def apply_mempool(self, operations: List[dict]) -> None:
+        """Apply operations from `monitor_operations` stream, remember errors of tracked ones.
+
+        :param operations: operations with `hash`, rejected ones also have `error` field
+        """
+        for operation in operations:
+            opg_hash = operation.get('hash')
+            if opg_hash not in self.opg_hashes or opg_hash in self.inclusions:
+                continue
+            if 'error' in operation:
+                logger.info('Operation %s is rejected by mempool', opg_hash)
+                self.rejections[opg_hash] = operation['error']
+            else:
+                logger.info('Operation %s is in mempool', opg_hash)
+                self.rejections.pop(opg_hash, None)
+
+    def _apply_block(self, level: int, block_hash: str) -> None:
+        self.blocks[level] = block_hash
+        if len(self.inclusions) == len(self.opg_hashes):
+            return
+        operation_hashes = self.shell.blocks[block_hash].operation_hashes()
+        for i, validation_pass in enumerate(operation_hashes):
+            for j, opg_hash in enumerate(validation_pass):
+                if opg_hash in self.opg_hashes and opg_hash not in self.inclusions:
+                    logger.info('Operation %s has been included to block %s', opg_hash, block_hash)
+                    self.inclusions[opg_hash] = (level, block_hash, i, j)
+                    self.rejections.pop(opg_hash, None)
+
+    def confirmations(self, opg_hash: str) -> int:
+        """Number of blocks on top of the inclusion block (including it), 0 if not included."""
+        if opg_hash not in self.inclusions or self.head_level is None:
+            return 0
+        return self.head_level - self.inclusions[opg_hash][0] + 1
+
+    @property
+    def included(self) -> bool:
+        return len(self.inclusions) == len(self.opg_hashes)
+
+    def get_operations(self) -> List[dict]:
+        """Fetch included operation groups with metadata, in order of inclusion."""
+        inclusions = sorted(self.inclusions.values())
+        return [self.shell.blocks[block_hash].operations[i][j]() for _, block_hash, i, j in inclusions]
@@ -0,0 +1,75 @@
+import csv
+import json
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from pytezos import ContractInterface
+from pytezos.contract.export import export_big_map
+from pytezos.contract.export import to_json_compatible
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.protocol import BigMapQuery
+from pytezos.rpc.shell import ShellQuery
+
+code = """
+parameter unit;
+storage (big_map nat (pair (nat %balance) (bytes %meta)));
+code { CDR ; NIL operation ; PAIR }
+"""
+values = [{'prim': 'Pair', 'args': [{'int': str(i)}, {'bytes': 'cafe'}]} for i in range(25)]
+
+
+def node_get(self, path, params=None, timeout=None, raw=False):
+    assert path == '/chains/main/blocks/head/context/big_maps/17', path
+    return values[params['offset'] : params['offset'] + params['length']]
+
+
+class BigMapExportTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.ci = ContractInterface.from_michelson(code).using(shell='http://localhost:8732')
+        self.ci.storage_from_micheline({'int': '17'})
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_pagination(self) -> None:
+        query = ShellQuery(RpcNode('http://localhost:8732')).head.context.big_maps[17]
+        self.assertIsInstance(query, BigMapQuery)
+        with patch.object(RpcNode, 'get', autospec=True, side_effect=node_get) as get_mock:
+            self.assertEqual(values, list(query.values(page_size=10, workers=3)))
+        offsets = sorted(call.kwargs['params']['offset'] for call in get_mock.call_args_list)
+        self.assertEqual([0, 10, 20], offsets[:3])
+
+    def test_export_jsonl(self) -> None:
+        path = join(self.tmp.name, 'ledger.jsonl')
+        with patch.object(RpcNode, 'get', node_get):
+            self.assertEqual(25, self.ci.storage.export(path, page_size=10, workers=2))
+        with open(path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(list(range(25)), [x['index'] for x in records])
+        self.assertEqual({'balance': 7, 'meta': 'cafe'}, records[7]['value'])
+
+    def test_export_csv(self) -> None:
+        path = join(self.tmp.name, 'ledger.csv')
+        with patch.object(RpcNode, 'get', node_get):
+            self.ci.storage.export(path, page_size=7)
+        with open(path) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(25, len(rows))
+        self.assertEqual({'index': '24', 'balance': '24', 'meta': 'cafe'}, rows[-1])
+
+    def test_export_raw_micheline(self) -> None:
+        path = join(self.tmp.name, 'ledger.jsonl')
+        query = ShellQuery(RpcNode('http://localhost:8732')).head.context.big_maps[17]
+        with patch.object(RpcNode, 'get', node_get):
+            export_big_map(query, path, page_size=100)
+        with open(path) as f:
+            self.assertEqual(values[0], json.loads(f.readline())['value'])
+
+    def test_unsupported_format(self) -> None:
+        self.assertRaises(ValueError, self.ci.storage.export, join(self.tmp.name, 'ledger.xml'))
+
+    def test_json_compatible(self) -> None:
+        self.assertEqual([[[1, 'a'], '00']], to_json_compatible({(1, 'a'): b'\x00'}))
@@ -0,0 +1,59 @@
+from threading import Lock
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+from pytezos import ContractInterface
+from pytezos.michelson.forge import forge_script_expr
+from pytezos.michelson.types.base import MichelsonType
+from pytezos.rpc.node import RpcError
+from pytezos.rpc.node import RpcNode
+
+code = """
+parameter unit;
+storage (big_map address nat);
+code { CDR ; NIL operation ; PAIR }
+"""
+alice = 'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb'
+bob = 'tz1aSkwEot3L2kmUvcoxzjMomb9mvBNuzFK6'
+carol = 'tz1iBobBobBobBobBobBobBobBobBodTWLCX'
+balances = {alice: 100, bob: 42}
+
+
+def get_key_hash(address: str) -> str:
+    key = MichelsonType.match({'prim': 'address'}).from_python_object(address)
+    return forge_script_expr(key.pack(legacy=True))
+
+
+class BigMapGetManyTest(TestCase):
+    def setUp(self) -> None:
+        self.ci = ContractInterface.from_michelson(code).using(shell='http://localhost:8732')
+        self.ci.storage_from_micheline({'int': '17'})
+        self.requested: List[str] = []
+        self.lock = Lock()
+        values = {get_key_hash(address): {'int': str(balance)} for address, balance in balances.items()}
+
+        def node_get(node, path, params=None, timeout=None, raw=False):
+            key_hash = path.split('/')[-1]
+            with self.lock:
+                self.requested.append(key_hash)
+            if key_hash not in values:
+                raise RpcError(f'Not found: {path}')
+            return values[key_hash]
+
+        self.node_get = node_get
+
+    def test_get_many(self) -> None:
+        with patch.object(RpcNode, 'get', self.node_get):
+            res = self.ci.storage.get_many([bob, carol, alice, bob], workers=3)
+        self.assertEqual([42, None, 100, 42], res)
+        # NOTE: duplicate keys are requested once
+        self.assertEqual(3, len(self.requested))
+
+    def test_same_as_single_get(self) -> None:
+        with patch.object(RpcNode, 'get', self.node_get):
+            self.assertEqual([self.ci.storage[alice]()], self.ci.storage.get_many([alice]))
+
+    def test_not_a_big_map(self) -> None:
+        ci = ContractInterface.from_michelson(code.replace('big_map', 'map'))
+        self.assertRaises(TypeError, ci.storage.get_many, [alice])
@@ -0,0 +1,156 @@
+import json
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from pytezos.contract.indexer import ChainIndexer
+from pytezos.contract.indexer import ContractCallRecord
+from pytezos.contract.indexer import ContractEvent
+from pytezos.michelson.cache import ProgramCache
+from pytezos.michelson.cache import get_program_cache
+from pytezos.michelson.cache import set_program_cache
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+
+vault = 'KT1BEqzn5Wx8uJrZNvuS9DVHmLvG9td3fDLi'
+other = 'KT1VG2WtYdSWz5E7chTeAdDPZNy2MpP8pTfL'
+alice = 'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb'
+script = {
+    'code': michelson_to_micheline(
+        'parameter (or (nat %deposit) (unit %withdraw)); storage nat; code { CDR ; NIL operation ; PAIR }'
+    ),
+    'storage': {'int': '0'},
+}
+other_script = {
+    'code': michelson_to_micheline('parameter unit; storage unit; code { CDR ; NIL operation ; PAIR }'),
+    'storage': {'prim': 'Unit'},
+}
+
+
+def make_transaction(destination: str, entrypoint: str, value: dict, status: str = 'applied', events=()) -> dict:
+    storage = {'int': '5'} if destination == vault else {'prim': 'Unit'}
+    return {
+        'kind': 'transaction',
+        'source': alice,
+        'counter': '10',
+        'amount': '1000',
+        'destination': destination,
+        'parameters': {'entrypoint': entrypoint, 'value': value},
+        'metadata': {
+            'operation_result': {'status': status, 'storage': storage},
+            'internal_operation_results': list(events),
+        },
+    }
+
+
+def make_event(tag: str, amount: int) -> dict:
+    return {
+        'kind': 'event',
+        'source': vault,
+        'nonce': 1,
+        'type': {'prim': 'nat'},
+        'tag': tag,
+        'payload': {'int': str(amount)},
+        'result': {'status': 'applied'},
+    }
+
+
+def make_block(level: int) -> dict:
+    contents = [make_transaction(vault, 'deposit', {'int': str(level)}, events=[make_event('deposited', level)])]
+    if level % 2 == 0:
+        contents.append(make_transaction(vault, 'withdraw', {'prim': 'Unit'}, status='failed'))
+        contents.append(make_transaction(other, 'default', {'prim': 'Unit'}))
+    return {
+        'header': {'level': level, 'hash': f'BL{level}', 'timestamp': '2024-01-01T00:00:00Z'},
+        'operations': [[], [], [], [{'hash': f'oo{level}', 'contents': contents}]],
+    }
+
+
+def node_get(node, path, params=None, timeout=None, raw=False):
+    parts = path.strip('/').split('/')
+    if parts[-1] == 'script':
+        return script if parts[-2] == vault else other_script
+    block = make_block(100 if parts[3] == 'head' else int(parts[3]))
+    return block[parts[-1]]
+
+
+class ChainIndexerTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.shell = ShellQuery(RpcNode('http://localhost:8732'))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_index_range(self) -> None:
+        indexer = ChainIndexer(self.shell, contracts=[vault], fetch_workers=2)
+        with patch.object(RpcNode, 'get', node_get):
+            records = list(indexer.index(start=10, stop=13))
+
+        self.assertEqual([10, 10, 11, 11, 12, 12, 13, 13], [x.level for x in records])
+        call, event = records[0], records[1]
+        assert isinstance(call, ContractCallRecord)
+        self.assertEqual({'deposit': 10}, call.parameters)
+        self.assertEqual(('deposit', 1000, 'oo10'), (call.entrypoint, call.amount, call.operation_hash))
+        assert isinstance(event, ContractEvent)
+        self.assertEqual(('deposited', 10), (event.tag, event.payload))
+
+    def test_program_cache(self) -> None:
+        default_cache = get_program_cache()
+        set_program_cache(ProgramCache())
+        try:
+            with patch.object(RpcNode, 'get', node_get):
+                list(ChainIndexer(self.shell, contracts=[vault]).index(start=10, stop=12))
+            stats = get_program_cache().stats()  # type: ignore
+        finally:
+            set_program_cache(default_cache)
+        self.assertEqual((1, 1, 2), (stats['size'], stats['misses'], stats['hits']))
+
+    def test_implicit_accounts_are_skipped(self) -> None:
+        def get(node, path, params=None, timeout=None, raw=False):
+            if path.strip('/').split('/')[-1] == 'script':
+                raise AssertionError(f'unexpected script request {path}')
+            block = node_get(node, path, params, timeout, raw)
+            if 'hash' in block:
+                return block
+            block[3][0]['contents'].append(make_transaction(alice, 'default', {'prim': 'Unit'}))
+            return block
+
+        indexer = ChainIndexer(self.shell, contracts=[alice])
+        with patch.object(RpcNode, 'get', get):
+            self.assertEqual([], list(indexer.index(start=10, stop=11)))
+
+    def test_all_contracts_and_storage(self) -> None:
+        indexer = ChainIndexer(self.shell, decode_storage=True, applied_only=False)
+        with patch.object(RpcNode, 'get', node_get):
+            calls = [x for x in indexer.index(start=12, stop=12) if isinstance(x, ContractCallRecord)]
+        self.assertEqual([vault, vault, other], [x.destination for x in calls])
+        self.assertEqual(['applied', 'failed', 'applied'], [x.status for x in calls])
+        self.assertEqual(5, calls[0].storage)
+
+    def test_resume_from_checkpoint(self) -> None:
+        checkpoint = join(self.tmp.name, 'indexer.json')
+        indexer = ChainIndexer(self.shell, contracts=[vault], checkpoint=checkpoint, checkpoint_interval=0)
+        with patch.object(RpcNode, 'get', node_get):
+            records = indexer.index(start=10, stop=20)
+            consumed = [next(records) for _ in range(5)]  # NOTE: block 12 is processed partially
+            records.close()
+            self.assertEqual(12, consumed[-1].level)
+
+            resumed = list(ChainIndexer(self.shell, contracts=[vault], checkpoint=checkpoint).index(start=10, stop=20))
+        self.assertEqual(list(range(12, 21)), sorted({x.level for x in resumed}))
+
+    def test_decode_workers(self) -> None:
+        with patch.object(RpcNode, 'get', node_get):
+            expected = list(ChainIndexer(self.shell, contracts=[vault]).index(start=1, stop=6))
+            records = list(ChainIndexer(self.shell, contracts=[vault], decode_workers=2, max_pending=2).index(1, 6))
+        self.assertEqual(expected, records)
+
+    def test_follow(self) -> None:
+        heads = b''.join(json.dumps({'level': level, 'hash': f'BL{level}'}).encode() for level in (30, 33))
+        indexer = ChainIndexer(self.shell, contracts=[vault], confirmations=2)
+        with patch.object(RpcNode, 'get', node_get), patch.object(RpcNode, 'stream', return_value=iter([heads])):
+            records = list(indexer.follow(start=27))
+        self.assertEqual([27, 28, 29, 30, 31], sorted({x.level for x in records}))
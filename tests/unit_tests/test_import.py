@@ -0,0 +1,54 @@
+import subprocess
+import sys
+from typing import Dict
+from typing import Tuple
+from unittest import TestCase
+
+# NOTE: budgets are relative to `import requests` measured in the same environment, so that slow runners do not matter
+REFERENCE_IMPORT = 'import requests'
+IMPORT_BUDGET = 1.0
+CLIENT_IMPORT_BUDGET = 10.0
+HEAVY_MODULES = [
+    'aiohttp',
+    'jsonschema',
+    'py_ecc.bls',
+    'py_ecc.optimized_bls12_381',
+    'pytezos.rpc.docs',
+]
+
+
+def measure_import(code: str) -> Tuple[float, Dict[str, float]]:
+    """Run code in a fresh interpreter with `-X importtime`, return total time and cumulative time per module."""
+    res = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total, modules = 0.0, {}
+    for line in res.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:') :].split('|')
+        modules[name.strip()] = int(cumulative) / 1e6
+        if not name.startswith('  '):  # top-level import
+            total += int(cumulative) / 1e6
+    return total, modules
+
+
+class TestImportTime(TestCase):
+    def assert_budget(self, code: str, budget: float) -> Dict[str, float]:
+        # NOTE: best of three to filter out noise
+        reference = min(measure_import(REFERENCE_IMPORT)[0] for _ in range(3))
+        total, modules = min((measure_import(code) for _ in range(3)), key=lambda x: x[0])
+        self.assertLess(total, reference * budget, f'`{code}` takes {total:.3f} sec (reference {reference:.3f} sec)')
+        return modules
+
+    def test_import_pytezos(self) -> None:
+        modules = self.assert_budget('import pytezos', IMPORT_BUDGET)
+        self.assertNotIn('pytezos.client', modules)
+
+    def test_import_client(self) -> None:
+        modules = self.assert_budget('from pytezos import pytezos', CLIENT_IMPORT_BUDGET)
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, modules)
@@ -1,11 +1,21 @@
+import gc
+import weakref
+from copy import deepcopy
 from unittest import TestCase
 
 from parameterized import parameterized  # type: ignore
 
+from pytezos.crypto.encoding import base58_encode
+from pytezos.crypto.key import blake2b_32
 from pytezos.michelson.forge import forge_micheline
 from pytezos.michelson.forge import forge_script_expr
+from pytezos.michelson.forge import forge_script_exprs
 from pytezos.michelson.forge import unforge_micheline
+from pytezos.michelson.instructions import DupInstruction
+from pytezos.michelson.instructions import PushInstruction
+from pytezos.michelson.micheline import MichelineSequence
 from pytezos.michelson.micheline import blind_unpack
+from pytezos.michelson.types import NatType
 from pytezos.michelson.types.base import MichelsonType
 from pytezos.operation.forge import forge_operation_group
 
@@ -75,32 +85,99 @@ unknown_data = [
 ]
 
 
+key_hashes = [
+    (
+        {"bytes": "000018896fcfc6690baefa9aedc6d759f9bf05727e8c"},
+        {"prim": "address"},
+        "expru2YV8AanTTUSV4K21P7X4DzbuWQFVk7NewDuP1A5uamffiiFA3",
+    ),
+    (
+        {"string": "tz1MsmYzmqxHs9trE1qQugZxxcLPqAXdQaX9"},
+        {"prim": "address"},
+        "expru2YV8AanTTUSV4K21P7X4DzbuWQFVk7NewDuP1A5uamffiiFA3",
+    ),
+    ({"string": "Game one!"}, {"prim": "string"}, "exprtiRSZkLKYRess9GZ3ryb4cVQD36WLo2oysZBFxKTZ2jXqcHWGj"),
+    ({"int": "505506"}, {"prim": "int"}, "exprufzwVGdAX7zG91UpiAkR2yVxEDE75tHD5YgSBmYMUx22teZTCM"),
+    (
+        [{"int": "1"}, {"int": "1"}, {"int": "1"}, {"int": "1"}],
+        {"prim": "pair", "args": [{"prim": "int"}, {"prim": "int"}, {"prim": "int"}, {"prim": "int"}]},
+        "expruN32WETsB2Dx1AynDmMufVr1As9qdnjRxKQ82rk2qZ4uxuKVMK",
+    ),
+]
+
+
 class TestPacking(TestCase):
-    @parameterized.expand(
-        [
+    @parameterized.expand(key_hashes)
+    def test_get_key_hash(self, val_expr, type_expr, expected):
+        ty = MichelsonType.match(type_expr)
+        key = ty.from_micheline_value(val_expr).pack(legacy=True)
+        self.assertEqual(expected, forge_script_expr(key))
+
+    def test_get_script_exprs(self):
+        for type_expr in ({'prim': 'address'}, {'prim': 'string'}, {'prim': 'int'}):
+            ty = MichelsonType.match(type_expr)
+            cases = [(val_expr, expected) for val_expr, ty_expr, expected in key_hashes if ty_expr == type_expr]
+            keys = [ty.from_micheline_value(val_expr) for val_expr, _ in cases]
+            self.assertEqual([expected for _, expected in cases], ty.get_script_exprs(keys))
+
+    def test_pack_many(self):
+        cases = [
+            ({'prim': 'nat'}, [0, 1, 63, 64, 2**70]),
+            ({'prim': 'int'}, [-1, 0, -(2**70), 505506]),
+            ({'prim': 'mutez'}, [0, 10**12]),
+            ({'prim': 'string'}, ['', 'Game one!', 'x' * 300]),
+            ({'prim': 'bytes'}, [b'', b'\x00\xff' * 100]),
             (
-                {"bytes": "000018896fcfc6690baefa9aedc6d759f9bf05727e8c"},
-                {"prim": "address"},
-                "expru2YV8AanTTUSV4K21P7X4DzbuWQFVk7NewDuP1A5uamffiiFA3",
+                {'prim': 'address'},
+                ['tz1MsmYzmqxHs9trE1qQugZxxcLPqAXdQaX9', 'KT1VYUxhLoSvouozCaDGL1XcswnagNfwr3yi%transfer'],
             ),
+            ({'prim': 'key_hash'}, ['tz1MsmYzmqxHs9trE1qQugZxxcLPqAXdQaX9', 'tz3WXYtyDUNL91qfiCJtVUX746QpNv5i5ve5']),
+            ({'prim': 'key'}, ['edpkuBknW28nW72KG6RoHtYW7p12T6GKc7nAbwYX5m8Wd9sDVC9yav']),
+            ({'prim': 'timestamp'}, [0, 1600000000]),
+            ({'prim': 'bool'}, [True, False]),
             (
-                {"string": "tz1MsmYzmqxHs9trE1qQugZxxcLPqAXdQaX9"},
-                {"prim": "address"},
-                "expru2YV8AanTTUSV4K21P7X4DzbuWQFVk7NewDuP1A5uamffiiFA3",
+                {'prim': 'pair', 'args': [{'prim': 'address'}, {'prim': 'nat'}]},
+                [('tz1MsmYzmqxHs9trE1qQugZxxcLPqAXdQaX9', 42)],
             ),
-            ({"string": "Game one!"}, {"prim": "string"}, "exprtiRSZkLKYRess9GZ3ryb4cVQD36WLo2oysZBFxKTZ2jXqcHWGj"),
-            ({"int": "505506"}, {"prim": "int"}, "exprufzwVGdAX7zG91UpiAkR2yVxEDE75tHD5YgSBmYMUx22teZTCM"),
             (
-                [{"int": "1"}, {"int": "1"}, {"int": "1"}, {"int": "1"}],
-                {"prim": "pair", "args": [{"prim": "int"}, {"prim": "int"}, {"prim": "int"}, {"prim": "int"}]},
-                "expruN32WETsB2Dx1AynDmMufVr1As9qdnjRxKQ82rk2qZ4uxuKVMK",
+                {'prim': 'pair', 'args': [{'prim': 'nat'}, {'prim': 'nat'}, {'prim': 'string'}]},
+                [(1, 2, 'a'), (3, 4, 'b')],
             ),
+            (
+                {'prim': 'pair', 'args': [{'prim': 'nat'}, {'prim': 'nat'}, {'prim': 'nat'}, {'prim': 'nat'}]},
+                [(1, 2, 3, 4)],
+            ),
+            ({'prim': 'option', 'args': [{'prim': 'nat'}]}, [None, 7]),
         ]
-    )
-    def test_get_key_hash(self, val_expr, type_expr, expected):
-        ty = MichelsonType.match(type_expr)
-        key = ty.from_micheline_value(val_expr).pack(legacy=True)
-        self.assertEqual(expected, forge_script_expr(key))
+        for type_expr, py_objs in cases:
+            ty = MichelsonType.match(type_expr)
+            keys = [ty.from_python_object(py_obj) for py_obj in py_objs]
+            for legacy in (False, True):
+                self.assertEqual([key.pack(legacy=legacy) for key in keys], ty.pack_many(keys, legacy=legacy))
+            expected = [forge_script_expr(key.pack(legacy=True)) for key in keys]
+            self.assertEqual(expected, ty.get_script_exprs(keys))
+
+    def test_forge_many(self):
+        ty = MichelsonType.match({'prim': 'string'})
+        buf, offsets = ty.forge_many([ty.from_value(value) for value in ('a', 'bc')])
+        self.assertEqual([0, 7, 15], offsets)
+        self.assertEqual(b'\x05\x01\x00\x00\x00\x01a\x05\x01\x00\x00\x00\x02bc', bytes(buf))
+
+    def test_forge_script_exprs(self):
+        packed_keys = [NatType.from_value(i).pack(legacy=True) for i in range(1000)]
+        expected = [base58_encode(blake2b_32(key).digest(), b'expr').decode() for key in packed_keys]
+        self.assertEqual(expected, forge_script_exprs(packed_keys))
+
+    def test_big_map_get_key_hashes(self):
+        ty = MichelsonType.match(
+            {
+                'prim': 'big_map',
+                'args': [{'prim': 'pair', 'args': [{'prim': 'address'}, {'prim': 'nat'}]}, {'prim': 'nat'}],
+            }
+        )
+        big_map = ty.from_micheline_value([])
+        keys = [('tz1MsmYzmqxHs9trE1qQugZxxcLPqAXdQaX9', i) for i in range(3)]
+        self.assertEqual([big_map.get_key_hash(key) for key in keys], big_map.get_key_hashes(keys))
 
     @parameterized.expand([(x,) for x in unknown_data])
     def test_blind_unpack(self, data):
@@ -185,3 +262,64 @@ class TestPacking(TestCase):
         self.assertListEqual(result, expected_result)
 
         self.assertListEqual(expected_result, unforge_micheline(forge_micheline(expected_result)))
+
+    def test_forge_deep_nesting(self):
+        expr: dict = {'int': '1'}
+        for i in range(10000):
+            expr = {'prim': 'Some', 'args': [[expr] if i % 2 else expr]}
+        data = forge_micheline(expr)
+        self.assertEqual(data, forge_micheline(unforge_micheline(data)))
+
+    def test_unforge_buffers(self):
+        data = forge_micheline([{'prim': 'Elt', 'args': [{'int': '-42'}, {'string': 'foo'}], 'annots': ['%bar']}])
+        expected = unforge_micheline(data)
+        self.assertEqual(expected, unforge_micheline(bytearray(data)))
+        self.assertEqual(expected, unforge_micheline(memoryview(b'\x05' + data)[1:]))
+
+    @parameterized.expand(
+        [
+            ('020000000500',),
+            ('0200000001000000',),
+            ('0701000000',),
+            ('0b',),
+        ]
+    )
+    def test_unforge_malformed(self, data):
+        with self.assertRaises((AssertionError, IndexError)):
+            unforge_micheline(bytes.fromhex(data))
+
+
+class TestTypeInterning(TestCase):
+    type_expr = {
+        'prim': 'pair',
+        'args': [
+            {'prim': 'address', 'annots': ['%owner']},
+            {'prim': 'map', 'args': [{'prim': 'nat'}, {'prim': 'list', 'args': [{'prim': 'bytes'}]}]},
+        ],
+    }
+
+    def test_identical_types_shared(self):
+        self.assertIs(MichelsonType.match(self.type_expr), MichelsonType.match(deepcopy(self.type_expr)))
+
+    def test_annotations_distinguish_types(self):
+        ty = MichelsonType.match(self.type_expr)
+        other = MichelsonType.match({**self.type_expr, 'annots': [':storage']})
+        self.assertIsNot(ty, other)
+        self.assertIs(ty.args[1], other.args[1])
+        ty.assert_type_equal(other)
+        self.assertEqual('storage', other.type_name)
+        self.assertIsNone(ty.type_name)
+
+    def test_instructions_shared(self):
+        code = [{'prim': 'DUP', 'annots': ['@x']}, {'prim': 'PUSH', 'args': [{'prim': 'nat'}, {'int': '1'}]}]
+        seq = MichelineSequence.match(code)
+        self.assertIs(seq, MichelineSequence.match(deepcopy(code)))
+        self.assertTrue(issubclass(seq.args[0], DupInstruction))
+        self.assertTrue(issubclass(seq.args[1], PushInstruction))
+        self.assertIsNot(seq, MichelineSequence.match(code[:1]))
+        self.assertIs(seq.args[0], MichelineSequence.match(code[:1]).args[0])
+
+    def test_unused_types_released(self):
+        ref = weakref.ref(MichelsonType.match({'prim': 'list', 'args': [{'prim': 'string', 'annots': [':unique']}]}))
+        gc.collect()
+        self.assertIsNone(ref())
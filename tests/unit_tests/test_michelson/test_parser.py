@@ -1,8 +1,57 @@
+import json
+import random
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from os.path import dirname
+from os.path import join
 from unittest import TestCase
+from unittest.mock import patch
 
+from pytezos.michelson.parse import FastMichelsonParser
 from pytezos.michelson.parse import MichelsonParser
+from pytezos.michelson.parse import MichelsonParserError
+from pytezos.michelson.parse import get_parser
+from pytezos.michelson.parse import get_parser_engine
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.parse import set_parser_engine
 from pytezos.michelson.types import TimestampType
 
+CORPUS = sorted(glob(join(dirname(__file__), 'test_repl', '**', '*.tz'), recursive=True))
+MALFORMED = [
+    '',
+    ';',
+    '{ DROP',
+    '{ DROP ; } }',
+    'PUSH nat 1 @a',
+    'DROP )',
+    'DUUUX )',
+    '(DIIP 1 2',
+    'PUSH string "\\q" ;',
+    'PUSH string "\\q" @a',
+    '"\\q" "a"',
+    '{ 1 ; 0x ; "a" } 2',
+    'PAIR $ 1',
+    'CMPEQ { }',
+    'DIP { DUUP @x } % ;',
+    'x',
+    '- 1',
+    '( 1 )',
+    '{ /* comment */ UNIT # comment\n ; FOO }',
+]
+MUTATIONS = [' ', ';', '{', '}', '(', ')', '"', '@', '%a', '0x', '-1', '$', '"\\q"', 'DUUP', 'PAIR', 'CMPEQ', 'FOO']
+
+
+def parse_result(parser, source: str):
+    try:
+        return json.dumps(parser.parse(source))
+    except MichelsonParserError as e:
+        return e.line, e.pos, e.message
+    except AttributeError:
+        # NOTE: PLY parser fails on unexpected end of input
+        return None
+    except ValueError as e:
+        return str(e)
+
 
 class TestParsing(TestCase):
     def test_wrapped_expr(self):
@@ -16,3 +65,74 @@ class TestParsing(TestCase):
     def test_timestamp_with_millis(self):
         res = TimestampType.from_micheline_value({'string': '2021-01-06T14:57:27.821Z'})
         self.assertEqual(1609945047, int(res))
+
+    def test_bundled_tables_up_to_date(self):
+        with patch('ply.yacc.LRGeneratedTable') as generate:
+            MichelsonParser()
+        generate.assert_not_called()
+
+    def test_shared_parser_per_thread(self):
+        self.assertIs(get_parser(), get_parser())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(get_parser).result()
+        self.assertIsNot(get_parser(), other)
+
+    def test_parse_concurrently(self):
+        sources = [f'{{ PUSH nat {i} ; DROP ; UNPAIR @a ; DIIP {{ CDR }} }}' for i in range(200)]
+        expected = [MichelsonParser().parse(source) for source in sources]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            actual = list(executor.map(michelson_to_micheline, sources))
+        self.assertEqual(expected, actual)
+
+
+class TestFastParser(TestCase):
+    def setUp(self):
+        self.ply = MichelsonParser()
+        self.fast = FastMichelsonParser()
+
+    def assert_same_result(self, source: str):
+        expected = parse_result(self.ply, source)
+        if expected is not None:
+            self.assertEqual(expected, parse_result(self.fast, source), source)
+
+    def test_corpus(self):
+        for path in CORPUS:
+            with self.subTest(path=path), open(path) as f:
+                self.assert_same_result(f.read())
+
+    def test_malformed(self):
+        for source in MALFORMED:
+            with self.subTest(source=source):
+                self.assert_same_result(source)
+
+    def test_mutations(self):
+        rnd = random.Random(42)
+        sources = []
+        for path in CORPUS[::8]:
+            with open(path) as f:
+                sources.append(f.read())
+        for _ in range(2000):
+            source = rnd.choice(sources)
+            pos = rnd.randrange(len(source) + 1)
+            if rnd.random() < 0.5:
+                source = source[:pos] + rnd.choice(MUTATIONS) + source[pos:]
+            else:
+                source = source[:pos] + source[pos + rnd.randrange(1, 5) :]
+            self.assert_same_result(source)
+
+    def test_unexpected_end(self):
+        with self.assertRaises(MichelsonParserError) as ctx:
+            self.fast.parse('{ DROP')
+        self.assertEqual(6, ctx.exception.pos)
+
+    def test_engine(self):
+        self.assertIsInstance(get_parser('fast'), FastMichelsonParser)
+        self.assertEqual(michelson_to_micheline('DUUP', engine='fast'), michelson_to_micheline('DUUP', engine='ply'))
+        set_parser_engine('fast')
+        try:
+            self.assertEqual('fast', get_parser_engine())
+            self.assertIsInstance(get_parser(), FastMichelsonParser)
+        finally:
+            set_parser_engine()
+        with self.assertRaises(ValueError):
+            set_parser_engine('yacc')
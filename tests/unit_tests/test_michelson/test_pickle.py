@@ -0,0 +1,148 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from unittest import TestCase
+
+from parameterized import parameterized  # type: ignore
+
+from pytezos.contract.result import ContractCallResult
+from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.stack import MichelsonStack
+from pytezos.michelson.types import BigMapType
+from pytezos.michelson.types import MichelsonType
+from pytezos.michelson.types import NatType
+from pytezos.michelson.types import OperationType
+from pytezos.michelson.types import StringType
+
+samples = [
+    ('address', '"KT1VG2WtYdSWz5E7chTeAdDPZNy2MpP8pTfL%foo"'),
+    ('big_map nat string', '{ Elt 1 "a" ; Elt 2 "b" }'),
+    ('big_map nat string', '42'),
+    ('bls12_381_fr', '0x01'),
+    ('bls12_381_g1', '0x' + '00' * 96),
+    ('bls12_381_g2', '0x' + '00' * 192),
+    ('bool', 'True'),
+    ('bytes', '0xdeadbeef'),
+    ('chain_id', '"NetXdQprcVkpaWU"'),
+    ('chest', '0x00'),
+    ('chest_key', '0x00'),
+    ('contract (pair nat string)', '"KT1VG2WtYdSWz5E7chTeAdDPZNy2MpP8pTfL"'),
+    ('int', '-42'),
+    ('key', '"edpku976gpuAD2bXyx1XGraeKuCo1gUZ3LAJcHM12W1ecxZwoiu22R"'),
+    ('key_hash', '"tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb"'),
+    ('lambda int int', '{ PUSH int 1 ; ADD }'),
+    ('list (option nat)', '{ Some 1 ; None }'),
+    ('map string (list nat)', '{ Elt "a" { 1 ; 2 } ; Elt "b" {} }'),
+    ('mutez', '1000000'),
+    ('nat', '42'),
+    ('option (pair nat string)', 'Some (Pair 1 "a")'),
+    ('or (nat %a) (string %b)', 'Right "b"'),
+    ('pair (nat %a) (string %b) (bool %c)', 'Pair 1 "a" True'),
+    ('sapling_state 8', '0'),
+    ('set nat', '{ 1 ; 2 ; 3 }'),
+    (
+        'signature',
+        '"edsigtzLBGCyadERX1QsYHKpwnxSxEYQeGLnJGsSkHEsyY8vB5GcNdnvzUZDdFevJK7YZQ2ujwVjvQZn62ahCEcy74AwtbA8HuN"',
+    ),
+    ('string', '"hello"'),
+    ('ticket nat', 'Pair "KT1VG2WtYdSWz5E7chTeAdDPZNy2MpP8pTfL" 1 10'),
+    ('timestamp', '"2021-01-01T00:00:00Z"'),
+    ('tx_rollup_l2_address', '"txr1YNMEtkj5Vkqsbdmt7xaxBTMRZjzS96UAi"'),
+    ('unit', 'Unit'),
+]
+
+# NOTE: no literal form
+no_values = {'never', 'operation', 'sapling_transaction', 'sapling_transaction_deprecated'}
+
+
+def load_value(type_src: str, value_src: str) -> MichelsonType:
+    ty = MichelsonType.match(michelson_to_micheline(type_src))
+    return ty.from_micheline_value(michelson_to_micheline(value_src))
+
+
+def pickle_roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+class TestPickle(TestCase):
+    def test_samples_cover_all_types(self):
+        prims = {prim for (prim, _), cls in Micheline.classes.items() if issubclass(cls, MichelsonType)}
+        covered = {michelson_to_micheline(ty)['prim'] for ty, _ in samples}
+        self.assertEqual(set(), prims - covered - no_values)
+
+    @parameterized.expand(samples)
+    def test_value_roundtrip(self, type_src, value_src):
+        value = load_value(type_src, value_src)
+        res = pickle_roundtrip(value)
+        self.assertIs(type(value), type(res))
+        self.assertEqual(value.to_micheline_value(lazy_diff=None), res.to_micheline_value(lazy_diff=None))
+
+    @parameterized.expand(samples)
+    def test_type_roundtrip(self, type_src, _):
+        ty = MichelsonType.match(michelson_to_micheline(type_src))
+        self.assertIs(ty, pickle_roundtrip(ty))
+
+    def test_big_map_diff(self):
+        ty = BigMapType.create_type(args=[NatType, StringType])
+        value = ty(items=[(NatType.from_value(1), StringType.from_value('a'))], ptr=42, removed_keys=[NatType(2)])
+        res = pickle_roundtrip(value)
+        self.assertEqual(42, res.ptr)
+        self.assertIsNone(res.context)
+        self.assertEqual(value.items, res.items)
+        self.assertEqual(value.removed_keys, res.removed_keys)
+
+    def test_operation(self):
+        value = OperationType.transaction(
+            source='KT1VG2WtYdSWz5E7chTeAdDPZNy2MpP8pTfL',
+            destination='tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb',
+            amount=1,
+            entrypoint='default',
+            value={'int': '1'},
+            param_type=NatType,
+        )
+        res = pickle_roundtrip(value)
+        self.assertEqual(value, res)
+        self.assertEqual(1, res.to_python_object())
+
+    def test_copy_does_not_reduce(self):
+        value = load_value('pair nat (big_map nat string)', 'Pair 1 { Elt 1 "a" }')
+        res = deepcopy(value)
+        self.assertIsNot(value.items[1], res.items[1])
+        self.assertEqual(value.to_micheline_value(lazy_diff=True), res.to_micheline_value(lazy_diff=True))
+
+    def test_stack(self):
+        stack = MichelsonStack([load_value('nat', '1'), load_value('list string', '{ "a" }')])
+        stack.protect(1)
+        res = pickle_roundtrip(stack)
+        self.assertEqual(1, res.protected)
+        self.assertEqual(stack.items, res.items)
+
+    def test_program(self):
+        code = michelson_to_micheline(
+            'parameter (or (nat %add) (unit %reset)) ; storage (big_map nat string) ; code { CDR ; NIL operation ; PAIR }'
+        )
+        program = MichelsonProgram.match(code)
+        res = pickle_roundtrip(program)
+        self.assertIs(program.storage, res.storage)
+        self.assertEqual(program.as_micheline_expr(), res.as_micheline_expr())
+        self.assertIs(MichelsonProgram, pickle_roundtrip(MichelsonProgram))
+
+    def test_contract_call_result(self):
+        program = MichelsonProgram.match(
+            michelson_to_micheline(
+                'parameter (or (nat %add) (unit %reset)) ; storage nat ; code { CDR ; NIL operation ; PAIR }'
+            )
+        )
+        parameters = program.parameter.from_parameters({'entrypoint': 'add', 'value': {'int': '1'}})
+        result = ContractCallResult(parameters=parameters, storage=1, operations=[])
+        res = pickle_roundtrip(result)
+        self.assertEqual({'add': 1}, res.parameters.to_python_object())
+        self.assertEqual(result.props.keys(), res.props.keys())
+
+    def test_process_pool(self):
+        value = load_value('map string (pair nat bool)', '{ Elt "a" (Pair 1 True) }')
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            res = executor.submit(pickle_roundtrip, value).result()
+        self.assertEqual(value.to_micheline_value(), res.to_micheline_value())
@@ -0,0 +1,90 @@
+from copy import deepcopy
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.cache import ProgramCache
+from pytezos.michelson.cache import dump_program
+from pytezos.michelson.cache import get_expr_hash
+from pytezos.michelson.cache import get_program_cache
+from pytezos.michelson.cache import load_program
+from pytezos.michelson.cache import set_program_cache
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.stack import MichelsonStack
+
+code = michelson_to_micheline('''
+    parameter (or (pair %transfer (address %to) (nat %value)) (bytes %memo));
+    storage (pair (big_map %ledger address nat) (option %memo bytes));
+    code { UNPAIR ;
+           IF_LEFT
+             { UNPAIR ; DIP { SOME } ; DIIP { UNPAIR } ; UPDATE ; PAIR }
+             { SOME ; SWAP ; CAR ; PAIR } ;
+           NIL operation ; PAIR };
+    view "memo" unit (option bytes) { CDR ; CDR };
+    ''')
+
+
+class TestProgramCache(TestCase):
+    def setUp(self):
+        self.default_cache = get_program_cache()
+        self.cache = ProgramCache(max_size=2)
+        set_program_cache(self.cache)
+
+    def tearDown(self):
+        set_program_cache(self.default_cache)
+
+    def test_match_cached(self):
+        program = MichelsonProgram.match(code)
+        self.assertIs(program, MichelsonProgram.match(deepcopy(code)))
+        stats = self.cache.stats()
+        self.assertEqual((1, 1, 1), (stats['size'], stats['hits'], stats['misses']))
+
+    def test_load_cached(self):
+        context = ExecutionContext(script={'code': code})
+        program = MichelsonProgram.load(context, with_code=True)
+        self.assertIs(program, MichelsonProgram.load(context, with_code=True))
+        self.assertIsNot(program, MichelsonProgram.load(context))
+        self.assertEqual(2, self.cache.stats()['misses'])
+
+    def test_eviction(self):
+        for i in range(3):
+            MichelsonProgram.match([code[0], code[1], {'prim': 'code', 'args': [[{'prim': 'DROP'}] * (i + 1)]}])
+        self.assertEqual(2, len(self.cache))
+        self.assertEqual(1, self.cache.stats()['evictions'])
+
+    def test_disabled(self):
+        set_program_cache(None)
+        self.assertIsNot(MichelsonProgram.match(code), MichelsonProgram.match(code))
+
+    def test_dump_load(self):
+        program = MichelsonProgram.match(code)
+        res = load_program(dump_program(program))
+        self.assertIs(program.code, res.code)
+        self.assertEqual(program.as_micheline_expr(), res.as_micheline_expr())
+        self.assertEqual(['memo'], [view.name for view in res.views])
+
+    def test_disk(self):
+        with TemporaryDirectory() as tmp:
+            path = join(tmp, 'programs.sqlite')
+            ProgramCache(path=path).get_or_create(code, lambda: MichelsonProgram.match(code))
+
+            cache = ProgramCache(path=path)
+            set_program_cache(cache)
+            program = MichelsonProgram.match(code)
+            stats = cache.stats()
+            self.assertEqual((0, 1, 1), (stats['hits'], stats['misses'], stats['disk_hits']))
+            self.assertIs(program, cache.get(get_expr_hash(code)))
+            cache.close()
+
+        res = program.instantiate(
+            entrypoint='memo',
+            parameter={'bytes': '00'},
+            storage={'prim': 'Pair', 'args': [[], {'prim': 'None'}]},
+        )
+        stack, stdout = MichelsonStack(), []
+        res.begin(stack, stdout, ExecutionContext())
+        res.execute(stack, stdout, ExecutionContext())
+        _, storage, _, _ = res.end(stack, stdout)
+        self.assertEqual({'prim': 'Pair', 'args': [{'int': '0'}, {'prim': 'Some', 'args': [{'bytes': '00'}]}]}, storage)
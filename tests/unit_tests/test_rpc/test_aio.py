@@ -0,0 +1,127 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest import skipIf
+
+from pytezos.rpc.aio import AsyncRpcNode
+from pytezos.rpc.aio import AsyncShellQuery
+from pytezos.rpc.aio import aiohttp
+from pytezos.rpc.errors import MichelsonError
+from pytezos.rpc.limits import RateLimiter
+from pytezos.rpc.limits import RetryBudget
+from pytezos.rpc.node import RpcError
+
+if aiohttp:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+
+@skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestAsyncShellQuery(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        async def operations(request):
+            return web.json_response([[], [], [], [{'hash': request.match_info['level']}]])
+
+        async def constants(request):
+            self.constants_calls += 1
+            await asyncio.sleep(0.1)
+            return web.json_response({'minimal_block_delay': '8'})
+
+        async def heads(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            for level in range(1, 4):
+                await response.write(f'{{"hash": "B{level}", "level": {level}}}\n'.encode())
+                await asyncio.sleep(0.01)
+            await response.write_eof()
+            return response
+
+        async def head_hash(request):
+            self.head_calls += 1
+            return web.json_response('BLhead')
+
+        async def throttled(request):
+            self.throttled_calls += 1
+            return web.Response(body=b'[]', status=429, headers={'retry-after': '0'})
+
+        async def counter(request):
+            return web.json_response(request.query.get('flag'))
+
+        async def error(request):
+            return web.Response(
+                body=b'[{"kind": "temporary", "id": "proto.021-PsQuebec.michelson_v1.error"}]',
+                status=500,
+                headers={'content-type': 'application/json'},
+            )
+
+        app = web.Application()
+        app.router.add_get('/chains/main/blocks/head/hash', head_hash)
+        app.router.add_get('/chains/main/blocks/{level}/operations', operations)
+        app.router.add_get('/chains/main/blocks/head/context/contracts/{address}/counter', counter)
+        app.router.add_get('/chains/main/blocks/head/context/constants', error)
+        app.router.add_get('/chains/main/blocks/{level}/context/constants', constants)
+        app.router.add_get('/monitor/heads/main', heads)
+        app.router.add_get('/chains/main/blocks/head/context/delegates', throttled)
+        self.constants_calls = 0
+        self.head_calls = 0
+        self.throttled_calls = 0
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.shell = AsyncShellQuery(AsyncRpcNode(str(self.server.make_url(''))))
+
+    async def asyncTearDown(self) -> None:
+        await self.shell.close()
+        await self.server.close()
+
+    async def test_endpoint(self) -> None:
+        operations = await self.shell.blocks[42].operations()
+        self.assertEqual('42', operations[3][0]['hash'])
+
+    async def test_params(self) -> None:
+        counter = await self.shell.contracts['tz1'].counter(flag=True, skip=None)
+        self.assertEqual('True', counter)
+
+    async def test_error_mapping(self) -> None:
+        with self.assertRaises(MichelsonError):
+            await self.shell.head.context.constants()
+
+    async def test_block(self) -> None:
+        block = await self.shell.block
+        self.assertEqual('BLhead', block.path.split('/')[-1])
+        self.assertIs(block, await self.shell.block)
+        self.assertEqual(1, self.head_calls)
+
+    async def test_session_is_shared(self) -> None:
+        await self.shell.blocks[1].operations()
+        session = self.shell.node.session
+        await self.shell.blocks[2].operations()
+        self.assertIs(session, self.shell.blocks[3].node.session)
+
+    async def test_coalescing(self) -> None:
+        results = await asyncio.gather(*[self.shell.blocks[10].context.constants() for _ in range(8)])
+        self.assertEqual(1, self.constants_calls)
+        self.assertTrue(all(res == {'minimal_block_delay': '8'} for res in results))
+
+    async def test_monitor_stream(self) -> None:
+        heads = []
+        async for head in self.shell.monitor.heads.main():
+            heads.append(head)
+        self.assertEqual([1, 2, 3], [head['level'] for head in heads])
+
+    async def test_rate_limiter(self) -> None:
+        limiter = RateLimiter(max_concurrency=8, cooldown=0)
+        shell = AsyncShellQuery(
+            AsyncRpcNode(
+                str(self.server.make_url('')),
+                rate_limiter=limiter,
+                retry_budget=RetryBudget(),
+                retries=1,
+            )
+        )
+        try:
+            with self.assertRaises(RpcError):
+                await shell.head.context.delegates()
+        finally:
+            await shell.close()
+        self.assertEqual(2, self.throttled_calls)
+        self.assertEqual(2, limiter.concurrency)
+        self.assertEqual(0, limiter.to_dict()['in_flight'])
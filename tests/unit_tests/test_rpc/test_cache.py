@@ -0,0 +1,100 @@
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from pytezos.rpc.cache import MemoryCache
+from pytezos.rpc.cache import SqliteCache
+from pytezos.rpc.cache import get_cache_key
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+from tests.unit_tests.test_rpc.test_node import make_response
+
+block_hash = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+
+
+class TestCacheKey(TestCase):
+    def test_cacheable(self) -> None:
+        self.assertEqual(
+            (f'chains/main/blocks/{block_hash}/header', None), get_cache_key(f'/chains/main/blocks/{block_hash}/header')
+        )
+        self.assertEqual(
+            ('chains/main/blocks/42/context/constants', 42), get_cache_key('chains/main/blocks/42/context/constants')
+        )
+        self.assertEqual(
+            ('chains/main/blocks/42/context/big_maps/1?length=10&offset=0', 42),
+            get_cache_key('/chains/main/blocks/42/context/big_maps/1', {'offset': 0, 'length': 10, 'x': None}),
+        )
+
+    def test_not_cacheable(self) -> None:
+        for path in [
+            '/chains/main/blocks/head/header',
+            '/chains/main/blocks/head~2/header',
+            '/chains/main/blocks',
+            '/chains/main/mempool/pending_operations',
+            '/monitor/heads/main',
+            '/version',
+        ]:
+            self.assertIsNone(get_cache_key(path), path)
+
+
+class TestResponseCache(TestCase):
+    def test_memory_lru(self) -> None:
+        cache = MemoryCache(max_size=2)
+        cache.set('a', b'1')
+        cache.set('b', b'2')
+        cache.get('a')
+        cache.set('c', b'3')
+        self.assertEqual(b'1', cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(2, len(cache))
+
+    def test_memory_max_bytes(self) -> None:
+        cache = MemoryCache(max_bytes=4)
+        cache.set('a', b'12')
+        cache.set('b', b'34')
+        cache.set('c', b'56')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(b'56', cache.get('c'))
+
+    def test_sqlite(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cache = SqliteCache(join(tmp, 'cache.db'), max_size=10)
+            for i in range(20):
+                cache.set(str(i), str(i).encode())
+            self.assertLessEqual(len(cache), 10)
+            self.assertEqual(b'19', cache.get('19'))
+            cache.close()
+
+            cache = SqliteCache(join(tmp, 'cache.db'), max_size=10)
+            self.assertEqual(b'19', cache.get('19'))
+            cache.close()
+
+
+class TestNodeCache(TestCase):
+    def test_block_hash(self) -> None:
+        shell = ShellQuery(RpcNode('http://localhost:8732', cache=MemoryCache()))
+        with patch.object(requests.Session, 'request', return_value=make_response(b'{"level": 1}')) as request_mock:
+            self.assertEqual({'level': 1}, shell.blocks[block_hash].header())
+            self.assertEqual({'level': 1}, shell.blocks[block_hash].header())
+            shell.head.header()
+            shell.head.header()
+        self.assertEqual(3, request_mock.call_count)
+
+    def test_finalized_level(self) -> None:
+        shell = ShellQuery(RpcNode('http://localhost:8732', cache=MemoryCache()))
+        with patch.object(requests.Session, 'request', return_value=make_response(b'{"level": 100}')) as request_mock:
+            shell.blocks[100].header()
+            shell.blocks[100].header()
+            shell.blocks[99].header()
+            shell.blocks[99].header()
+        # NOTE: one request for the finalized level, then cache hits
+        self.assertEqual(3, request_mock.call_count)
+        self.assertTrue(request_mock.call_args_list[0].kwargs['url'].endswith('head~2/header/shell'))
+
+        with patch.object(requests.Session, 'request', return_value=make_response(b'{"level": 100}')) as request_mock:
+            shell.blocks[101].header()
+            shell.blocks[101].header()
+        self.assertEqual(2, request_mock.call_count)
@@ -0,0 +1,84 @@
+import time
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pytezos.rpc.cassette import Cassette
+from pytezos.rpc.node import RpcMultiNode
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+from tests.unit_tests.test_rpc.test_node import make_response
+
+
+def node_send(request, **kwargs):
+    if request.url.endswith('/head/hash'):
+        node_send.head += 1  # type: ignore
+        return make_response(f'"BLock{node_send.head}"'.encode())  # type: ignore
+    if request.method == 'POST':
+        return make_response(b'"ooHash"')
+    return make_response(b'{"balance": "42", "counter": "1"}')
+
+
+class TestCassette(TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.path = join(self.tmp.name, 'rpc.cassette.gz')
+        node_send.head = 0  # type: ignore
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def run_scenario(self, shell: ShellQuery) -> list:
+        return [
+            shell.head.hash(),
+            shell.head.hash(),
+            shell.head.context.contracts['tz1Record'](),
+            shell.blocks[1].context.contracts['tz1Record'].balance(),
+            shell.injection.operation.post(operation='00'),
+        ]
+
+    def test_record_and_replay(self) -> None:
+        cassette = Cassette(self.path)
+        node = cassette.record(RpcNode('http://localhost:8732', retries=5))
+        self.assertEqual(5, node.session.get_adapter('http://').adapter.max_retries.total)  # type: ignore
+        with patch.object(HTTPAdapter, 'send', side_effect=node_send) as send_mock:
+            recorded = self.run_scenario(ShellQuery(node))
+        cassette.save()
+        self.assertEqual(5, send_mock.call_count)
+        self.assertEqual(['BLock1', 'BLock2'], recorded[:2])
+
+        replay = Cassette(self.path)
+        self.assertEqual(5, len(replay))
+        # NOTE: node address does not matter
+        shell = ShellQuery(RpcNode('http://replay', session=replay.replay()))
+        with patch.object(HTTPAdapter, 'send') as send_mock:
+            replayed = self.run_scenario(shell)
+            # NOTE: last response is repeated
+            self.assertEqual('BLock2', shell.head.hash())
+        send_mock.assert_not_called()
+        self.assertEqual(recorded, replayed)
+
+    def test_record_multi_node(self) -> None:
+        cassette = Cassette(self.path)
+        node = cassette.record(RpcMultiNode(['http://localhost:8732', 'http://localhost:8733']))
+        with patch.object(HTTPAdapter, 'send', side_effect=node_send):
+            ShellQuery(node).head.hash()
+        self.assertEqual(1, len(cassette))
+
+    def test_not_recorded(self) -> None:
+        shell = ShellQuery(RpcNode('http://replay', session=Cassette(self.path).replay()))
+        self.assertRaises(requests.exceptions.ConnectionError, shell.head.hash)
+
+    def test_latency_injection(self) -> None:
+        cassette = Cassette(self.path)
+        with patch.object(HTTPAdapter, 'send', side_effect=node_send):
+            ShellQuery(cassette.record(RpcNode('http://localhost:8732'))).head.hash()
+
+        shell = ShellQuery(RpcNode('http://replay', session=cassette.replay(latency=0.05)))
+        started_at = time.monotonic()
+        shell.head.hash()
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.05)
@@ -0,0 +1,63 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from pytezos.rpc import codec
+from pytezos.rpc.cache import MemoryCache
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+from tests.unit_tests.test_rpc.test_node import make_response
+
+BLOCK_HASH = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+
+
+class TestJsonCodec(TestCase):
+    def tearDown(self) -> None:
+        codec.set_json_backend()
+
+    def test_backends_agree(self) -> None:
+        payload = b'{"level": 1, "fee": "1000", "ok": true, "ratio": 0.5, "items": [null, "\\u00e9"]}'
+        expected = {'level': 1, 'fee': '1000', 'ok': True, 'ratio': 0.5, 'items': [None, 'é']}
+        for backend in codec.JSON_BACKENDS:
+            if backend == 'orjson' and codec.orjson is None:
+                continue
+            codec.set_json_backend(backend)
+            self.assertEqual(expected, codec.loads(payload))
+            self.assertEqual(expected, codec.loads(bytearray(payload)))
+
+    def test_big_integers_are_exact(self) -> None:
+        self.assertEqual([123456789012345678901234567890], codec.loads(b'[123456789012345678901234567890]'))
+        self.assertEqual({'a': -(2**70)}, codec.loads(b'{"a": %d}' % -(2**70)))
+
+    def test_unknown_backend(self) -> None:
+        self.assertRaises(ValueError, codec.set_json_backend, 'ujson')
+
+    def test_invalid_json(self) -> None:
+        self.assertRaises(ValueError, codec.loads, b'{"a": ')
+
+
+class TestSinglePassDecoding(TestCase):
+    def setUp(self) -> None:
+        self.shell = ShellQuery(RpcNode('http://localhost:8732', cache=MemoryCache()))
+
+    def test_response_decoded_once(self) -> None:
+        request_patch = patch.object(requests.Session, 'request', return_value=make_response(b'{"level": 1}'))
+        json_patch = patch.object(requests.Response, 'json', side_effect=AssertionError)
+        decode_patch = patch('pytezos.rpc.node.decode_response', wraps=codec.decode_response)
+        with request_patch, json_patch, decode_patch as decode_mock:
+            self.assertEqual({'level': 1}, self.shell.head.header())
+        decode_mock.assert_called_once()
+
+    def test_raw_bytes(self) -> None:
+        payload = b'{"protocol": "PtMumbai", "level": 42}'
+        with patch.object(requests.Session, 'request', return_value=make_response(payload)) as request_mock:
+            self.assertEqual(payload, self.shell.blocks[BLOCK_HASH].header.get_bytes())
+            # NOTE: served from cache
+            self.assertEqual(payload, self.shell.blocks[BLOCK_HASH].header.get_bytes())
+            self.assertEqual(42, self.shell.blocks[BLOCK_HASH].header()['level'])
+        self.assertEqual(1, request_mock.call_count)
+
+    def test_post_plain_text(self) -> None:
+        with patch.object(requests.Session, 'request', return_value=make_response(b'not json')):
+            self.assertEqual('not json', self.shell.injection.operation.post(operation='00'))
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from io import BytesIO
+from unittest import IsolatedAsyncioTestCase
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from pytezos.client import PyTezosClient
+from pytezos.rpc.limits import RateLimiter
+from pytezos.rpc.limits import RetryBudget
+from pytezos.rpc.node import RpcError
+from pytezos.rpc.node import RpcMultiNode
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+from tests.unit_tests.test_rpc.test_node import make_response
+
+
+def make_throttled_response(status_code=429) -> requests.Response:
+    res = make_response(b'[]', status_code=status_code)
+    res.headers['retry-after'] = '0'
+    res.raw = BytesIO()
+    return res
+
+
+class TestRateLimiter(TestCase):
+    def test_aimd(self) -> None:
+        limiter = RateLimiter(max_concurrency=16, cooldown=0)
+        limiter.acquire()
+        limiter.release(0.1, throttled=True)
+        self.assertEqual(8, limiter.concurrency)
+
+        # NOTE: roughly +1 per window of successful requests
+        for _ in range(8 + 9 + 10):
+            limiter.acquire()
+            limiter.release(0.1)
+        self.assertEqual(10, limiter.concurrency)
+
+    def test_slow_responses_decrease_concurrency(self) -> None:
+        limiter = RateLimiter(max_concurrency=4, target_latency=1.0, cooldown=0)
+        limiter.acquire()
+        limiter.release(2.0)
+        self.assertEqual(2, limiter.concurrency)
+
+    def test_token_bucket(self) -> None:
+        limiter = RateLimiter(rate=50, burst=1)
+        started_at = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+            limiter.release(0.0)
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.09)
+
+
+class TestRateLimiterAsync(IsolatedAsyncioTestCase):
+    async def test_concurrency(self) -> None:
+        limiter = RateLimiter(max_concurrency=2, min_concurrency=2)
+        in_flight, max_in_flight = 0, 0
+
+        async def request() -> None:
+            nonlocal in_flight, max_in_flight
+            await limiter.acquire_async()
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            limiter.release(0.01)
+
+        await asyncio.gather(*[request() for _ in range(8)])
+        self.assertEqual(2, max_in_flight)
+        self.assertEqual(0, limiter.to_dict()['in_flight'])
+
+
+class TestRetryBudget(TestCase):
+    def test_budget(self) -> None:
+        budget = RetryBudget(ratio=0.5, min_retries_per_sec=0.1, window=10)
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        for _ in range(4):
+            budget.deposit()
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+
+class TestRpcNodeRetries(TestCase):
+    def test_no_retries_by_default(self) -> None:
+        node = RpcNode('http://localhost:8732')
+        with patch.object(requests.Session, 'request', side_effect=lambda *a, **kw: make_throttled_response()) as m:
+            self.assertRaises(RpcError, ShellQuery(node).head.hash)
+        self.assertEqual(1, m.call_count)
+        self.assertIsNone(node.retry_budget)
+
+    def test_retry_throttled(self) -> None:
+        node = RpcNode('http://localhost:8732', retry_budget=RetryBudget())
+        responses = [make_throttled_response(), make_throttled_response(503), make_response(b'"ok"')]
+        with patch.object(requests.Session, 'request', side_effect=responses) as request_mock:
+            self.assertEqual('ok', ShellQuery(node).head.hash())
+        self.assertEqual(3, request_mock.call_count)
+
+    def test_budget_exhausted(self) -> None:
+        node = RpcNode('http://localhost:8732', retry_budget=RetryBudget(ratio=0, min_retries_per_sec=0.1))
+        with patch.object(requests.Session, 'request', side_effect=lambda *a, **kw: make_throttled_response()):
+            with self.assertRaises(RpcError) as ctx:
+                ShellQuery(node).head.hash()
+            self.assertEqual(429, ctx.exception.status_code)
+            self.assertRaises(RpcError, ShellQuery(node).head.hash)
+        # NOTE: a single retry in total, the second request is not retried
+        self.assertEqual(0, int(node.retry_budget.available))  # type: ignore
+
+    def test_post_is_not_retried(self) -> None:
+        node = RpcNode('http://localhost:8732', retry_budget=RetryBudget())
+        with patch.object(requests.Session, 'request', return_value=make_throttled_response()) as request_mock:
+            self.assertRaises(RpcError, ShellQuery(node).injection.operation.post, operation='00')
+        self.assertEqual(1, request_mock.call_count)
+
+    def test_throttling_feeds_limiter(self) -> None:
+        node = RpcNode('http://localhost:8732', rate_limiter=RateLimiter(max_concurrency=8), retry_budget=None)
+        with patch.object(requests.Session, 'request', return_value=make_throttled_response()):
+            self.assertRaises(RpcError, ShellQuery(node).head.hash)
+        self.assertEqual(4, node.rate_limiter.concurrency)  # type: ignore
+
+    def test_multi_node_limits(self) -> None:
+        node = RpcMultiNode(['http://a:8732', 'http://b:8732'], rate_limiter=RateLimiter(rate=10))
+        limiters = [child.rate_limiter for child in node.nodes]
+        self.assertEqual(2, len({id(limiter) for limiter in limiters}))
+        self.assertTrue(all(child.retry_budget is None for child in node.nodes))
+
+
+class TestClientUsing(TestCase):
+    def test_using_limits(self) -> None:
+        client = PyTezosClient().using(shell='http://localhost:8732')
+        limited = client.using(rate_limiter=RateLimiter(rate=5), retry_budget=RetryBudget(ratio=0.1))
+        self.assertEqual(5, limited.shell.node.rate_limiter.rate)  # type: ignore
+        self.assertEqual(0.1, limited.shell.node.retry_budget.ratio)  # type: ignore
+        self.assertIsNone(client.shell.node.rate_limiter)
+        self.assertIs(client.shell.node.session, limited.shell.node.session)
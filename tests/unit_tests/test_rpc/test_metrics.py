@@ -0,0 +1,104 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import requests
+
+from pytezos.logging import logger
+from pytezos.rpc.metrics import RequestInfo
+from pytezos.rpc.metrics import RpcHook
+from pytezos.rpc.metrics import RpcMetrics
+from pytezos.rpc.metrics import get_path_template
+from pytezos.rpc.node import RpcError
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+from tests.unit_tests.test_rpc.test_node import make_response
+
+
+class TestRpcMetrics(TestCase):
+    def setUp(self) -> None:
+        self.metrics = RpcMetrics()
+        self.shell = ShellQuery(RpcNode('http://localhost:8732', hooks=[self.metrics]))
+
+    def test_path_template(self) -> None:
+        path = self.shell.blocks[100].context.contracts['KT1Test'].path
+        self.assertEqual('chains/{}/blocks/{}/context/contracts/{}', get_path_template(path))
+        self.assertEqual(
+            'chains/{}/blocks/{}/header/shell',
+            get_path_template('chains/main/blocks/head~2/header/shell'),
+        )
+        self.assertEqual(
+            'chains/{}/blocks/{}/operations',
+            get_path_template('/chains/main/blocks/BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2/operations'),
+        )
+
+    def test_endpoint_metrics(self) -> None:
+        with patch.object(requests.Session, 'request', return_value=make_response(b'"BLockHash"')):
+            self.shell.blocks[1].hash()
+            self.shell.blocks[2].hash()
+        with patch.object(requests.Session, 'request', return_value=make_response(b'[]', status_code=404)):
+            self.assertRaises(RpcError, self.shell.blocks[3].hash)
+        with patch.object(requests.Session, 'request', side_effect=requests.exceptions.ConnectionError):
+            self.assertRaises(requests.exceptions.ConnectionError, self.shell.blocks[4].hash)
+
+        metrics = self.metrics.to_dict()
+        self.assertEqual(['GET chains/{}/blocks/{}/hash'], list(metrics))
+        endpoint = metrics['GET chains/{}/blocks/{}/hash']
+        self.assertEqual(4, endpoint['requests'])
+        self.assertEqual({'200': 2, '404': 1, 'error': 1}, endpoint['statuses'])
+        self.assertEqual(2 * len(b'"BLockHash"'), endpoint['response_bytes'])
+
+    def test_request_bytes(self) -> None:
+        for body, expected in (('{"name": "ꜩ"}', 15), (b'{}', 2), (iter([b'{}']), 0), (None, 0)):
+            response = make_response(b'{}')
+            response.request = requests.PreparedRequest()
+            response.request.body = body  # type: ignore
+            info = RequestInfo('http://localhost:8732', 'POST', 'injection/operation', {})
+            info.finish(response=response)
+            self.assertEqual(expected, info.request_bytes)
+
+    def test_openmetrics(self) -> None:
+        with patch.object(requests.Session, 'request', return_value=make_response(b'"BLockHash"')):
+            self.shell.head.hash()
+        text = self.metrics.to_openmetrics()
+        labels = 'method="GET",path="chains/{}/blocks/{}/hash"'
+        self.assertIn(f'pytezos_rpc_requests_total{{{labels},status="200"}} 1', text)
+        self.assertIn(f'pytezos_rpc_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1', text)
+        self.assertIn(f'pytezos_rpc_response_bytes_total{{{labels}}} 11', text)
+        self.assertTrue(text.endswith('# EOF\n'))
+
+    def test_prometheus_collector(self) -> None:
+        try:
+            from prometheus_client import CollectorRegistry
+        except ImportError:
+            self.skipTest('prometheus_client is not installed')
+        registry = CollectorRegistry()
+        self.metrics.register(registry)
+        with patch.object(requests.Session, 'request', return_value=make_response(b'"BLockHash"')):
+            self.shell.head.hash()
+        labels = {'method': 'GET', 'path': 'chains/{}/blocks/{}/hash'}
+        self.assertEqual(1, registry.get_sample_value('pytezos_rpc_requests_total', {**labels, 'status': '200'}))
+        self.assertEqual(1, registry.get_sample_value('pytezos_rpc_request_duration_seconds_count', labels))
+
+
+class TestRpcHooks(TestCase):
+    def test_hooks_order(self) -> None:
+        hook = MagicMock(spec=RpcHook)
+        node = RpcNode('http://localhost:8732', hooks=[hook])
+        with patch.object(requests.Session, 'request', return_value=make_response(b'"ooHash"')):
+            ShellQuery(node).injection.operation.post(operation='00')
+
+        self.assertEqual(['before_request', 'after_request'], [call[0] for call in hook.method_calls])
+        info = hook.after_request.call_args[0][0]
+        self.assertEqual('POST', info.method)
+        self.assertEqual('injection/operation', info.template)
+        self.assertEqual(200, info.status_code)
+        self.assertIsNotNone(info.latency)
+
+    def test_debug_formatting_is_lazy(self) -> None:
+        node = RpcNode('http://localhost:8732')
+        debug_patch = patch.object(logger, 'isEnabledFor', return_value=False)
+        request_patch = patch.object(requests.Session, 'request', return_value=make_response(b'{"level": 1}'))
+        with debug_patch, request_patch, patch('pytezos.rpc.node.json.dumps') as dumps_mock:
+            ShellQuery(node).head.header()
+        dumps_mock.assert_not_called()
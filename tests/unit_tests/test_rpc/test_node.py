@@ -0,0 +1,178 @@
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import monotonic
+from time import sleep
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import requests
+
+from pytezos.rpc.node import RpcError
+from pytezos.rpc.node import RpcMultiNode
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+
+
+def make_response(payload=b'{}', status_code=200) -> requests.Response:
+    res = requests.Response()
+    res.status_code = status_code
+    res._content = payload
+    res.headers['content-type'] = 'application/json'
+    return res
+
+
+class TestRpcNodeSession(TestCase):
+    def test_session_is_shared_between_queries(self) -> None:
+        node = RpcNode('http://localhost:8732')
+        shell = ShellQuery(node)
+
+        with patch.object(requests.Session, 'request', return_value=make_response(b'"BLockHash"')) as request_mock:
+            shell.blocks[1].hash()
+            shell.head.context.contracts['tz1'].counter()
+
+        self.assertEqual(2, request_mock.call_count)
+        self.assertIs(node.session, shell.blocks[1].node.session)
+
+    def test_session_is_created_once_across_threads(self) -> None:
+        node = RpcNode('http://localhost:8732')
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = list(executor.map(lambda _: node.session, range(32)))
+        self.assertTrue(all(session is sessions[0] for session in sessions))
+
+    def test_pool_settings(self) -> None:
+        node = RpcNode('http://localhost:8732', pool_maxsize=42, pool_block=True, retries=5, keep_alive=False)
+        adapter = node.session.get_adapter('http://localhost:8732')
+        self.assertEqual(42, adapter._pool_maxsize)  # type: ignore
+        self.assertTrue(adapter._pool_block)  # type: ignore
+        self.assertEqual(5, adapter.max_retries.total)  # type: ignore
+        self.assertEqual('close', node.session.headers['connection'])
+
+    def test_close(self) -> None:
+        node = RpcNode('http://localhost:8732')
+        session = node.session
+        node.close()
+        self.assertIsNot(session, node.session)
+
+    def test_multi_node_settings(self) -> None:
+        session = MagicMock()
+        node = RpcMultiNode(['http://a:8732', 'http://b:8732'], session=session)
+        self.assertTrue(all(n.session is session for n in node.nodes))
+
+
+class TestRpcMultiNode(TestCase):
+    def setUp(self) -> None:
+        self.node = RpcMultiNode(['http://a:8732', 'http://b:8732', 'http://c:8732'], eject_after=2)
+        self.shell = ShellQuery(self.node)
+
+    def test_prefers_fastest_node(self) -> None:
+        with self.node._stats_lock:
+            for stats, latency in zip(self.node._stats, [0.5, 0.1, 0.3]):
+                stats.record_success(latency)
+
+        with patch.object(requests.Session, 'request', return_value=make_response(b'1')) as request_mock:
+            self.shell.head.hash()
+        self.assertTrue(request_mock.call_args.kwargs['url'].startswith('http://b:8732'))
+
+    def test_failover_and_ejection(self) -> None:
+        def request(method, url, **kwargs):
+            if url.startswith('http://a:8732'):
+                raise requests.exceptions.ConnectionError()
+            return make_response(b'"ok"')
+
+        with patch.object(requests.Session, 'request', side_effect=request) as request_mock:
+            for _ in range(3):
+                self.assertEqual('ok', self.shell.head.hash())
+
+        stats = self.node.stats()
+        self.assertTrue(stats['http://a:8732']['ejected'])
+        self.assertEqual(2, stats['http://a:8732']['errors'])
+        # NOTE: 2 failures, then ejected node is not requested anymore
+        self.assertEqual(5, request_mock.call_count)
+
+    def test_application_error_is_not_failover(self) -> None:
+        response = make_response(b'[]', status_code=500)
+        with patch.object(requests.Session, 'request', return_value=response) as request_mock:
+            self.assertRaises(RpcError, self.shell.head.hash)
+        self.assertEqual(1, request_mock.call_count)
+        self.assertEqual(0, sum(stats['errors'] for stats in self.node.stats().values()))
+
+    def test_lagging_node_is_skipped(self) -> None:
+        with self.node._stats_lock:
+            for stats, level in zip(self.node._stats, [100, 90, 100]):
+                stats.head_level = level
+        self.assertEqual(1, self.node._rank()[-1])
+
+    def test_hedging(self) -> None:
+        node = RpcMultiNode(['http://a:8732', 'http://b:8732'], hedge_after=0.01)
+
+        def request(method, url, **kwargs):
+            if url.startswith('http://a:8732'):
+                sleep(0.5)
+                return make_response(b'"slow"')
+            return make_response(b'"fast"')
+
+        with patch.object(requests.Session, 'request', side_effect=request):
+            self.assertEqual('fast', ShellQuery(node).head.hash())
+        node.close()
+
+    def test_hedging_under_load(self) -> None:
+        def request(method, url, **kwargs):
+            sleep(0.2)
+            return make_response(b'"ok"')
+
+        for hedge_workers in (2, 32):
+            node = RpcMultiNode(['http://a:8732', 'http://b:8732'], hedge_after=0.5, hedge_workers=hedge_workers)
+            shell = ShellQuery(node)
+            barrier = Barrier(8)
+
+            def get_hash(level: int, shell=shell, barrier=barrier) -> str:
+                barrier.wait()
+                return shell.blocks[level].hash()
+
+            executor = ThreadPoolExecutor(max_workers=8)
+            with patch.object(requests.Session, 'request', side_effect=request) as request_mock:
+                started_at = monotonic()
+                results = list(executor.map(get_hash, range(8)))
+                elapsed = monotonic() - started_at
+            executor.shutdown()
+            node.close()
+
+            self.assertEqual(['ok'] * 8, results)
+            # NOTE: callers are not serialized behind a small pool and queueing does not trigger false hedges
+            self.assertLess(elapsed, 0.4)
+            self.assertEqual(8, request_mock.call_count)
+
+
+class TestRequestCoalescing(TestCase):
+    def test_concurrent_identical_requests(self) -> None:
+        node = RpcNode('http://localhost:8732')
+        shell = ShellQuery(node)
+        barrier = Barrier(8)
+
+        def request(method, url, **kwargs):
+            sleep(0.2)
+            return make_response(b'{"minimal_block_delay": "8"}')
+
+        def get_constants(_):
+            barrier.wait()
+            return shell.head.context.constants()
+
+        executor = ThreadPoolExecutor(max_workers=8)
+        with patch.object(requests.Session, 'request', side_effect=request) as request_mock:
+            results = list(executor.map(get_constants, range(8)))
+        executor.shutdown()
+
+        self.assertEqual(1, request_mock.call_count)
+        self.assertTrue(all(res == {'minimal_block_delay': '8'} for res in results))
+        # NOTE: every caller gets its own copy
+        self.assertEqual(8, len({id(res) for res in results}))
+
+    def test_errors_are_shared(self) -> None:
+        node = RpcNode('http://localhost:8732')
+        future = Future()  # type: ignore
+        future.set_exception(RpcError('Not found'))
+        node._flights['chains/main/blocks/head/hash'] = future
+        with self.assertRaises(RpcError):
+            ShellQuery(node).head.hash()
@@ -0,0 +1,39 @@
+import copy
+import pickle
+from unittest import TestCase
+from unittest.mock import patch
+
+from pytezos.rpc.aio import AsyncShellQuery
+from pytezos.rpc.metrics import get_path_template
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.protocol import ContractQuery
+from pytezos.rpc.shell import ShellQuery
+
+
+class TestRpcQuery(TestCase):
+    def setUp(self) -> None:
+        self.shell = ShellQuery(RpcNode('http://localhost:8732'))
+
+    def test_docstring_is_lazy(self) -> None:
+        with patch('pytezos.rpc.query.format_docstring') as format_mock:
+            query = self.shell.blocks[1].context.contracts['KT1Lazy']
+        format_mock.assert_not_called()
+        self.assertIsInstance(query, ContractQuery)
+        self.assertIn('.storage', query.__doc__)
+        self.assertIn(query.__doc__, repr(query))
+
+    def test_class_docstring(self) -> None:
+        self.assertTrue(str(AsyncShellQuery.__doc__).startswith('Awaitable mirror'))
+        self.assertIsNone(ContractQuery.__doc__)
+
+    def test_path_templates_are_interned(self) -> None:
+        first = self.shell.blocks[1].context.contracts['KT1']
+        second = self.shell.blocks[2].context.contracts['KT2']
+        self.assertIs(first._wild_path, second._wild_path)
+        self.assertEqual('/chains/main/blocks/2/context/contracts/KT2', second.path)
+
+    def test_path_copy(self) -> None:
+        path = self.shell.blocks[2].context.contracts['KT2'].path
+        for res in (pickle.loads(pickle.dumps(path)), copy.copy(path), copy.deepcopy(path)):
+            self.assertEqual(path, res)
+            self.assertEqual('chains/{}/blocks/{}/context/contracts/{}', get_path_template(res))
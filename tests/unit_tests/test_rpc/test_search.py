@@ -0,0 +1,93 @@
+import re
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.search import ProbeCache
+from pytezos.rpc.search import find_state_change
+from pytezos.rpc.search import find_state_changes
+from pytezos.rpc.shell import ShellQuery
+from tests.unit_tests.test_rpc.test_node import make_response
+
+
+def block_request(method, url, **kwargs):
+    block_id, part = re.search(r'/blocks/([^/]+)/(.+)$', url).groups()  # type: ignore
+    level = 100 if block_id == 'head' else int(block_id)
+    if part == 'header':
+        return make_response(f'{{"level": {level}, "hash": "B{level}"}}'.encode())
+    return make_response(f'[[], [], [], [{{"level": {level}}}]]'.encode())
+
+
+class TestBlockSliceFetch(TestCase):
+    def setUp(self) -> None:
+        self.shell = ShellQuery(RpcNode('http://localhost:8732'))
+
+    def test_fetch_in_order(self) -> None:
+        with patch.object(requests.Session, 'request', side_effect=block_request):
+            blocks = list(self.shell.blocks[10:40].fetch(workers=8))
+
+        self.assertEqual(list(range(10, 41)), [block['level'] for block in blocks])
+        self.assertTrue(all(block['header']['level'] == block['level'] for block in blocks))
+        self.assertTrue(all(block['operations'][3][0]['level'] == block['level'] for block in blocks))
+
+    def test_fetch_retries(self) -> None:
+        failed = set()
+
+        def flaky_request(method, url, **kwargs):
+            if url not in failed:
+                failed.add(url)
+                raise requests.exceptions.ConnectionError()
+            return block_request(method, url, **kwargs)
+
+        backoff = patch('pytezos.rpc.search.FETCH_BACKOFF_FACTOR', 0)
+        with backoff, patch.object(requests.Session, 'request', side_effect=flaky_request):
+            blocks = list(self.shell.blocks[10:12].fetch(parts=['header']))
+        self.assertEqual([10, 11, 12], [block['level'] for block in blocks])
+
+    def test_fetch_checkpoint(self) -> None:
+        with TemporaryDirectory() as tmp, patch.object(requests.Session, 'request', side_effect=block_request):
+            checkpoint = join(tmp, 'checkpoint')
+            for block in self.shell.blocks[10:20].fetch(parts=['header'], checkpoint=checkpoint):
+                if block['level'] == 14:
+                    break
+
+            blocks = list(self.shell.blocks[10:20].fetch(parts=['header'], checkpoint=checkpoint))
+        # NOTE: block is checkpointed once consumer asks for the next one (at-least-once delivery)
+        self.assertEqual(list(range(14, 21)), [block['level'] for block in blocks])
+
+
+class TestStateChangeSearch(TestCase):
+    changes = [1000, 250_001, 250_002, 999_000]
+
+    def get_state(self, level: int) -> int:
+        return sum(level >= x for x in self.changes)
+
+    def test_k_ary_search(self) -> None:
+        for workers in [1, 2, 4, 7]:
+            get = ProbeCache(self.get_state)
+            level, value = find_state_change(1_000_000, 0, get, lambda x, y: x == y, pred_value=0, workers=workers)
+            self.assertEqual((1000, 1), (level, value))
+            if workers > 1:
+                # NOTE: number of rounds drops, total number of probes grows
+                self.assertLess(len(get), 20 * workers)
+
+    def test_find_state_changes(self) -> None:
+        for workers in [1, 4]:
+            get = ProbeCache(self.get_state)
+            changes = list(find_state_changes(1_000_000, 0, get, lambda x, y: x == y, step=10_000, workers=workers))
+            # NOTE: intervals are walked from head, changes within an interval are yielded in ascending order
+            self.assertEqual([(999_000, 4), (250_001, 2), (250_002, 3)], changes)
+
+    def test_probes_are_shared(self) -> None:
+        calls = []
+
+        def get(level):
+            calls.append(level)
+            return self.get_state(level)
+
+        list(find_state_changes(1_000_000, 0, get, lambda x, y: x == y, step=10_000))
+        self.assertEqual(len(calls), len(set(calls)))
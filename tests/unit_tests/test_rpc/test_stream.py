@@ -0,0 +1,115 @@
+import json
+from io import BytesIO
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+from pytezos.rpc.stream import JsonStream
+from pytezos.rpc.stream import JsonStreamDecoder
+from pytezos.rpc.stream import JsonStreamError
+
+values = [
+    {'hash': 'BLa', 'level': 1, 'fitness': ['02', '00000001']},
+    [{'hash': 'oo1', 'contents': [{'kind': 'transaction', 'parameters': {'value': '{"nested": "[\\"]"}'}}]}],
+    'commit "hash" \\ with escapes',
+    42,
+    {'hash': 'BLb', 'level': 2, 'text': 'ü{}[]'},
+]
+payload = ''.join(json.dumps(value) + '\n' for value in values).encode()
+
+
+class TestJsonStreamDecoder(TestCase):
+    def test_chunk_sizes(self) -> None:
+        for chunk_size in [1, 2, 3, 7, 64, len(payload)]:
+            decoder = JsonStreamDecoder()
+            res = []
+            for i in range(0, len(payload), chunk_size):
+                res.extend(decoder.feed(payload[i : i + chunk_size]))
+            res.extend(decoder.flush())
+            self.assertEqual(values, res, chunk_size)
+
+    def test_concatenated_without_separators(self) -> None:
+        decoder = JsonStreamDecoder()
+        self.assertEqual([{'a': 1}, [2], 'x'], decoder.feed(b'{"a": 1}[2]"x"'))
+
+    def test_buffer_limit(self) -> None:
+        decoder = JsonStreamDecoder(max_buffer=16)
+        decoder.feed(b'{"a": "0123')
+        with self.assertRaises(JsonStreamError):
+            decoder.feed(b'456789abcdef"')
+
+    def test_incomplete(self) -> None:
+        decoder = JsonStreamDecoder()
+        decoder.feed(b'{"a": [1, 2')
+        with self.assertRaises(JsonStreamError):
+            decoder.flush()
+
+
+class TestJsonStream(TestCase):
+    def test_reconnect_and_resume(self) -> None:
+        connections = []
+
+        def open_stream():
+            connections.append(1)
+            if len(connections) == 1:
+                yield b'{"hash": "BLa", "level": 1}\n{"hash": "BLb"'
+                raise requests.exceptions.ChunkedEncodingError()
+            yield b'{"hash": "BLa", "level": 1}\n{"hash": "BLb", "level": 2}\n'
+
+        with patch('pytezos.rpc.stream.sleep'):
+            heads = list(JsonStream(open_stream))
+        self.assertEqual(['BLa', 'BLb'], [head['hash'] for head in heads])
+        self.assertEqual(2, len(connections))
+
+    def test_seen_hash_after_resume(self) -> None:
+        connections = []
+
+        def open_stream():
+            connections.append(1)
+            if len(connections) == 1:
+                yield b'{"hash": "BLa", "level": 1}\n'
+                raise requests.exceptions.ConnectionError()
+            # NOTE: replayed head, new head, then the old head is current again after a reorg
+            yield b'{"hash": "BLa", "level": 1}\n{"hash": "BLb", "level": 2}\n{"hash": "BLa", "level": 1}\n'
+
+        with patch('pytezos.rpc.stream.sleep'):
+            heads = list(JsonStream(open_stream))
+        self.assertEqual(['BLa', 'BLb', 'BLa'], [head['hash'] for head in heads])
+
+    def test_resume_operations(self) -> None:
+        connections = []
+
+        def open_stream():
+            connections.append(1)
+            if len(connections) == 1:
+                yield b'[{"hash": "oo1"}, {"hash": "oo2"}]\n'
+                raise requests.exceptions.ConnectionError()
+            yield b'[{"hash": "oo1"}]\n[{"hash": "oo2"}, {"hash": "oo3"}]\n[{"hash": "oo1"}]\n'
+
+        with patch('pytezos.rpc.stream.sleep'):
+            batches = list(JsonStream(open_stream))
+        # NOTE: re-broadcast operation is yielded again once the replay is over
+        self.assertEqual([['oo1', 'oo2'], ['oo3'], ['oo1']], [[op['hash'] for op in ops] for ops in batches])
+
+    def test_no_reconnect(self) -> None:
+        def open_stream():
+            yield b'{"hash": "BLa"}\n'
+            raise requests.exceptions.ConnectionError()
+
+        stream = iter(JsonStream(open_stream, reconnect=False))
+        self.assertEqual({'hash': 'BLa'}, next(stream))
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            next(stream)
+
+    def test_monitor_query(self) -> None:
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = BytesIO()
+        iter_content = patch.object(requests.Response, 'iter_content', return_value=iter([payload[:10], payload[10:]]))
+        with iter_content, patch.object(requests.Session, 'request', return_value=response) as request_mock:
+            res = list(ShellQuery(RpcNode('http://localhost:8732')).monitor.heads.main())
+        self.assertEqual(values, res)
+        self.assertTrue(request_mock.call_args.kwargs['stream'])
@@ -0,0 +1,130 @@
+import json
+import threading
+from queue import Queue
+from time import monotonic
+from time import sleep
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from pytezos.rpc.shell import ShellQuery
+
+OPG_HASH = 'ooWatchedOperation'
+BLOCKS = {
+    'A10': (10, 'A9', []),
+    'A11': (11, 'A10', []),
+    'A12': (12, 'A11', [OPG_HASH]),
+    'B12': (12, 'A11', []),
+    'B13': (13, 'B12', ['ooOther', OPG_HASH]),
+    'B14': (14, 'B13', []),
+}
+
+
+def make_header(block_hash: str) -> dict:
+    level, predecessor, _ = BLOCKS[block_hash]
+    return {'hash': block_hash, 'level': level, 'predecessor': predecessor}
+
+
+class TestMonitorWait(TestCase):
+    def setUp(self) -> None:
+        self.node = MagicMock()
+        self.node.get.side_effect = self.get
+        self.node.stream.side_effect = self.stream
+        self.shell = ShellQuery(self.node)
+        self.heads: Queue = Queue()
+        self.mempool: Queue = Queue()
+
+    def tearDown(self) -> None:
+        # NOTE: finish streams, so that reader threads exit
+        self.heads.put(None)
+        self.mempool.put(None)
+
+    def stream(self, path, params=None):
+        chunks = self.mempool if path.endswith('monitor_operations') else self.heads
+        return iter(chunks.get, None)
+
+    @staticmethod
+    def get(path, params=None, timeout=None):
+        chunks = path.strip('/').split('/')
+        block_hash, endpoint = chunks[3], chunks[4]
+        if endpoint == 'header':
+            return make_header(block_hash)
+        if endpoint == 'operation_hashes':
+            return [[], [], [], BLOCKS[block_hash][2]]
+        if endpoint == 'operations':
+            return {'hash': BLOCKS[block_hash][2][int(chunks[6])], 'block': block_hash}
+        raise NotImplementedError(path)
+
+    def set_heads(self, *block_hashes: str) -> None:
+        payload = b''.join(json.dumps(make_header(x)).encode() + b'\n' for x in block_hashes)
+        # NOTE: split into small chunks to exercise incremental decoding
+        for i in range(0, len(payload), 7):
+            self.heads.put(payload[i : i + 7])
+
+    def test_wait_blocks(self) -> None:
+        self.set_heads('A10', 'A11', 'A12', 'B12')
+        block_hashes = list(self.shell.wait_blocks('A10', max_blocks=2, yield_current=True, monitor=True))
+        self.assertEqual(['A10', 'A11', 'A12'], block_hashes)
+        self.node.stream.assert_called_once()
+
+    def test_wait_blocks_timeout(self) -> None:
+        self.set_heads('A10')
+        started_at = monotonic()
+        with self.assertRaises(TimeoutError):
+            list(self.shell.wait_blocks('A10', max_blocks=1, block_timeout=0.2, monitor=True))  # type: ignore
+        self.assertLess(monotonic() - started_at, 1)
+
+    def test_wait_blocks_stream_is_shared(self) -> None:
+        results = {}
+
+        def wait(name: str) -> None:
+            results[name] = list(self.shell.wait_blocks('A10', max_blocks=2, monitor=True))
+
+        threads = [threading.Thread(target=wait, args=(name,)) for name in ('first', 'second')]
+        for thread in threads:
+            thread.start()
+        # NOTE: header is requested after subscribing
+        while self.node.get.call_count < 2:
+            sleep(0.01)
+        self.set_heads('A10', 'A11', 'A12')
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual({'first': ['A11', 'A12'], 'second': ['A11', 'A12']}, results)
+        self.node.stream.assert_called_once()
+
+    def test_wait_operations_reorg(self) -> None:
+        # NOTE: operation is included to A12, which is replaced by B12, then included again to B13 (B12 is skipped)
+        self.set_heads('A10', 'A11', 'A12', 'B13', 'B14')
+        operations = self.shell.wait_operations(
+            opg_hashes=[OPG_HASH],
+            ttl=5,
+            min_confirmations=2,
+            current_block_hash='A10',
+            monitor=True,
+        )
+        self.assertEqual([{'hash': OPG_HASH, 'block': 'B13'}], operations)
+
+    def test_wait_operations_ttl(self) -> None:
+        self.set_heads('A11', 'B12', 'B13')
+        with self.assertRaises(StopIteration):
+            self.shell.wait_operations(
+                opg_hashes=[OPG_HASH],
+                ttl=2,
+                min_confirmations=1,
+                current_block_hash='A10',
+                monitor=True,
+            )
+
+    def test_wait_operations_rejected(self) -> None:
+        self.set_heads('A10')
+        operation = {'hash': OPG_HASH, 'branch': 'A9', 'error': [{'kind': 'temporary', 'id': 'counter_in_the_past'}]}
+        self.mempool.put(json.dumps([operation]).encode())
+        with patch('pytezos.rpc.watch.MEMPOOL_REOPEN_DELAY', 0), self.assertRaises(StopIteration):
+            self.shell.wait_operations(
+                opg_hashes=[OPG_HASH],
+                ttl=5,
+                min_confirmations=1,
+                current_block_hash='A10',
+                block_timeout=5,
+                monitor=True,
+            )